@@ -2,13 +2,13 @@
 Agente principal que coordina el scraping y generación de posts
 AHORA CON CAPACIDADES AUTÓNOMAS: Memoria, Decisiones y Aprendizaje
 """
-import json
-import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from scraper import ArticleScraper
 from generator import LinkedInPostGenerator
 from agent_brain import AutonomousAgent
+from post_store import PostStore
 
 
 class SocialPostAgent:
@@ -17,29 +17,31 @@ class SocialPostAgent:
     def __init__(self, data_dir: str = "../data", autonomous: bool = True):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.posts_file = self.data_dir / "posts.json"
+        self.store = PostStore(self.data_dir)
+        self.db_file = self.store.db_file
         self.scraper = ArticleScraper()
         self.generator = LinkedInPostGenerator()
 
         # Sistema autónomo
         self.autonomous = autonomous
         if autonomous:
-            self.brain = AutonomousAgent(data_dir)
+            # El mismo store: las vistas cacheadas del cerebro siguen su versión
+            self.brain = AutonomousAgent(data_dir, post_store=self.store)
 
     def load_existing_posts(self) -> list:
-        """Carga posts existentes desde el archivo JSON"""
-        if self.posts_file.exists():
-            with open(self.posts_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
-
-    def save_posts(self, posts: list):
-        """Guarda posts en el archivo JSON"""
-        with open(self.posts_file, 'w', encoding='utf-8') as f:
-            json.dump(posts, f, indent=2, ensure_ascii=False)
-
-    def run(self):
-        """Ejecuta el agente completo"""
+        """Carga posts existentes (más nuevos primero)"""
+        return self.store.load_posts()
+
+    def save_posts(self, new_posts: list):
+        """Agrega los posts nuevos al store (sin reescribir el historial)"""
+        self.store.append_posts(new_posts)
+
+    def run(self, interactive: bool = True):
+        """
+        Ejecuta el agente completo.
+        interactive=False no pide confirmación antes de generar (ejecuciones
+        desatendidas, pruebas de carga con REPLAY_MODE=replay).
+        """
         print("="*60)
         print("🤖 AI Social Post Agent")
         if self.autonomous:
@@ -60,7 +62,8 @@ class SocialPostAgent:
 
             print(f"\n✅ El agente decide generar nuevos posts:")
             print(f"   Razón: {reason}")
-            input("\n⏸  Presiona Enter para continuar con la generación...")
+            if interactive:
+                input("\n⏸  Presiona Enter para continuar con la generación...")
 
         # 1. Scrape artículos
         print("\n📰 Paso 1: Buscando artículos de AI...")
@@ -94,18 +97,16 @@ class SocialPostAgent:
 
         # 3. Guardar posts
         print("\n💾 Paso 3: Guardando posts...")
-        existing_posts = self.load_existing_posts()
 
         # Agregar ID único a cada post
         for i, post in enumerate(new_posts):
             post['id'] = f"post_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i}"
 
-        # Combinar con posts existentes (nuevos primero)
-        all_posts = new_posts + existing_posts
-        self.save_posts(all_posts)
+        # Append de los nuevos (quedan primero al leer)
+        self.save_posts(new_posts)
 
         print(f"✅ Guardados {len(new_posts)} posts nuevos")
-        print(f"📊 Total de posts en la base de datos: {len(all_posts)}")
+        print(f"📊 Total de posts en la base de datos: {self.store.count()}")
 
         # 3.5: Aprendizaje (si modo autónomo)
         if self.autonomous:
@@ -127,7 +128,7 @@ class SocialPostAgent:
             print()
 
         print("="*60)
-        print(f"✨ Proceso completado. Posts guardados en: {self.posts_file}")
+        print(f"✨ Proceso completado. Posts guardados en: {self.db_file}")
         if self.autonomous:
             print("🧠 El agente ha aprendido de esta generación y ajustará su comportamiento futuro")
         print("="*60)
@@ -136,7 +137,7 @@ class SocialPostAgent:
 if __name__ == "__main__":
     try:
         agent = SocialPostAgent()
-        agent.run()
+        agent.run(interactive='--yes' not in sys.argv[1:])
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("\nAsegúrate de:")
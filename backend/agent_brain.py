@@ -1,29 +1,88 @@
 """
 Sistema cerebral del agente autónomo - Memoria, decisiones y aprendizaje
 """
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import Counter, defaultdict
-import re
+import heapq
+import time
+from post_store import PostStore
+from url_utils import normalize_url
+from topics import extract_many, extract_topics
+import dedup
+from file_utils import read_json, write_json_atomic
+
+MEMORY_FORMAT_VERSION = 3
+
+
+def _week_key(moment: datetime) -> str:
+    """Clave de semana ISO, p.ej. '2026-W03' (ordenable como string)"""
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
 
 
 class AgentMemory:
     """Sistema de memoria para el agente - recuerda posts anteriores y patrones"""
 
-    def __init__(self, data_dir: str = "../data"):
+    # Ventanas de retención por defecto: historial crudo de 90 días, contadores
+    # diarios de 30 días y semanales de 52 semanas
+    DEFAULT_HISTORY_RETENTION_DAYS = 90
+    DEFAULT_DAILY_RETENTION_DAYS = 30
+    DEFAULT_WEEKLY_RETENTION_WEEKS = 52
+
+    def __init__(self, data_dir: str = "../data", max_history: int = None,
+                 history_retention_days: int = DEFAULT_HISTORY_RETENTION_DAYS,
+                 daily_retention_days: int = DEFAULT_DAILY_RETENTION_DAYS,
+                 weekly_retention_weeks: int = DEFAULT_WEEKLY_RETENTION_WEEKS,
+                 post_store: PostStore = None):
         self.data_dir = Path(data_dir)
         self.memory_file = self.data_dir / "agent_memory.json"
-        self.posts_file = self.data_dir / "posts.json"
+        self.post_store = post_store if post_store is not None else PostStore(self.data_dir)
+        # Retención del historial crudo (None = sin límite)
+        self.max_history = max_history
+        self.history_retention_days = history_retention_days
+        # Retención de los contadores agregados
+        self.daily_retention_days = daily_retention_days
+        self.weekly_retention_weeks = weekly_retention_weeks
         self.memory = self._load_memory()
+        self._rebuild_indexes()
+
+    def _build_url_index(self) -> set:
+        """Conjunto de URLs normalizadas ya procesadas (búsqueda O(1))"""
+        return {normalize_url(a['url']) for a in self.memory['article_history']}
+
+    def _build_near_duplicate_index(self) -> dedup.NearDuplicateIndex:
+        """Índice LSH de las firmas MinHash del historial (las entradas viejas sin firma usan el título)"""
+        index = dedup.NearDuplicateIndex()
+        for entry in self.memory['article_history']:
+            index.add(entry['url'], entry.get('signature') or dedup.signature(entry['title']))
+        return index
+
+    def _rebuild_indexes(self):
+        self._url_index = self._build_url_index()
+        self._near_duplicate_index = self._build_near_duplicate_index()
+
+    @property
+    def version(self) -> int:
+        """Versión monótona de la memoria (persistida); aumenta con cada cambio"""
+        return self.memory.get('version', 0)
+
+    def _touch(self):
+        self.memory['version'] = self.version + 1
+
+    def file_mtime(self) -> float:
+        """mtime actual del archivo de memoria (0 si no existe)"""
+        try:
+            return self.memory_file.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
 
     def _load_memory(self) -> Dict:
-        """Carga la memoria del agente"""
-        if self.memory_file.exists():
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {
+        """Carga la memoria del agente (y la migra al formato compacto si hace falta)"""
+        # mtime del archivo que refleja esta memoria en RAM (para detectar cambios externos)
+        self.loaded_mtime = self.file_mtime()
+        memory = read_json(self.memory_file, default=None) or {
             'topics_covered': {},  # tema -> count
             'sources_used': {},    # source -> count
             'successful_patterns': [],  # patrones que funcionan bien
@@ -31,62 +90,153 @@ class AgentMemory:
             'total_generations': 0,
             'article_history': []  # URLs de artículos ya procesados
         }
+        # Contadores agregados por día ('YYYY-MM-DD') y semana ISO ('YYYY-Www')
+        memory.setdefault('daily_stats', {})
+        memory.setdefault('weekly_stats', {})
+        memory['format_version'] = MEMORY_FORMAT_VERSION
+        # Firmas de casi duplicados de otro esquema no son comparables: se
+        # descartan y el índice usa el título de esas entradas
+        if memory.get('signature_scheme') != dedup.SIGNATURE_SCHEME:
+            for entry in memory['article_history']:
+                entry.pop('signature', None)
+            memory['signature_scheme'] = dedup.SIGNATURE_SCHEME
+        self._apply_retention(memory)
+        return memory
 
     def save_memory(self):
-        """Guarda la memoria del agente"""
-        self.data_dir.mkdir(exist_ok=True)
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(self.memory, f, indent=2, ensure_ascii=False)
+        """Guarda la memoria del agente (escritura atómica, JSON compacto)"""
+        write_json_atomic(self.memory_file, self.memory)
+        self.loaded_mtime = self.file_mtime()
+
+    @staticmethod
+    def _bump_bucket(bucket: Dict, sources: Counter, topics: Counter):
+        """Suma una generación a un contador agregado"""
+        bucket['generations'] = bucket.get('generations', 0) + 1
+        for key, counts in (('sources', sources), ('topics', topics)):
+            totals = bucket.setdefault(key, {})
+            for name, count in counts.items():
+                totals[name] = totals.get(name, 0) + count
 
     def remember_generation(self, articles: List[Dict], posts: List[Dict]):
         """Registra una generación en la memoria"""
+        now = datetime.now()
         self.memory['total_generations'] += 1
-        self.memory['last_generation'] = datetime.now().isoformat()
+        self.memory['last_generation'] = now.isoformat()
+        self._touch()
 
         # Registrar artículos procesados
+        sources = Counter()
         for article in articles:
+            signature = dedup.signature(dedup.article_text(article))
             self.memory['article_history'].append({
                 'url': article['url'],
                 'title': article['title'],
                 'source': article['source'],
-                'processed_at': datetime.now().isoformat()
+                'processed_at': now.isoformat(),
+                'signature': signature
             })
-
-            # Actualizar conteo de fuentes
-            source = article['source']
-            self.memory['sources_used'][source] = self.memory['sources_used'].get(source, 0) + 1
-
-        # Extraer y recordar tópicos de los posts
-        for post in posts:
-            topics = self._extract_topics(post['post_text'])
-            for topic in topics:
-                self.memory['topics_covered'][topic] = self.memory['topics_covered'].get(topic, 0) + 1
-
+            self._url_index.add(normalize_url(article['url']))
+            self._near_duplicate_index.add(article['url'], signature)
+            sources[article['source']] += 1
+
+        # Extraer tópicos de los posts
+        topics = Counter()
+        for post_topics in extract_many([post['post_text'] for post in posts]):
+            topics.update(post_topics)
+
+        # Totales históricos
+        for source, count in sources.items():
+            self.memory['sources_used'][source] = self.memory['sources_used'].get(source, 0) + count
+        for topic, count in topics.items():
+            self.memory['topics_covered'][topic] = self.memory['topics_covered'].get(topic, 0) + count
+
+        # Contadores rodantes por día y por semana
+        day_key = now.strftime('%Y-%m-%d')
+        week_key = _week_key(now)
+        self._bump_bucket(self.memory['daily_stats'].setdefault(day_key, {}), sources, topics)
+        self._bump_bucket(self.memory['weekly_stats'].setdefault(week_key, {}), sources, topics)
+
+        if self._apply_retention(self.memory):
+            self._rebuild_indexes()
         self.save_memory()
 
+    def _apply_retention(self, memory: Dict) -> bool:
+        """
+        Aplica las ventanas de retención al historial y a los contadores.
+        Devuelve True si se recortó el historial de artículos.
+        """
+        trimmed = False
+        if self.max_history is not None or self.history_retention_days is not None:
+            history = memory['article_history']
+            kept = self._retained_history(history, self.max_history, self.history_retention_days)
+            if len(kept) != len(history):
+                memory['article_history'] = kept
+                trimmed = True
+
+        now = datetime.now()
+        if self.daily_retention_days is not None:
+            cutoff = (now - timedelta(days=self.daily_retention_days)).strftime('%Y-%m-%d')
+            memory['daily_stats'] = {k: v for k, v in memory['daily_stats'].items() if k >= cutoff}
+        if self.weekly_retention_weeks is not None:
+            cutoff = _week_key(now - timedelta(weeks=self.weekly_retention_weeks))
+            memory['weekly_stats'] = {k: v for k, v in memory['weekly_stats'].items() if k >= cutoff}
+        return trimmed
+
+    @staticmethod
+    def _retained_history(history: List[Dict], max_entries: int = None,
+                          max_age_days: int = None) -> List[Dict]:
+        """Entradas del historial que quedan dentro de la ventana (las más recientes)"""
+        kept = history
+        if max_age_days is not None:
+            cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+            kept = [a for a in kept if a.get('processed_at', '') >= cutoff]
+        if max_entries is not None and len(kept) > max_entries:
+            kept = kept[-max_entries:] if max_entries > 0 else []
+        return kept
+
+    def compact_history(self, max_entries: int = None, max_age_days: int = None) -> int:
+        """
+        Recorta el historial de artículos por antigüedad y/o cantidad
+        (se conservan los más recientes). Devuelve cuántas entradas se eliminaron.
+        """
+        history = self.memory['article_history']
+        kept = self._retained_history(history, max_entries, max_age_days)
+
+        removed = len(history) - len(kept)
+        if removed:
+            self.memory['article_history'] = kept
+            self._rebuild_indexes()
+            self._touch()
+        return removed
+
+    def get_recent_activity(self, days: int = 7) -> Dict:
+        """Suma los contadores diarios de los últimos `days` días"""
+        cutoff = (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        activity = {'generations': 0, 'sources': {}, 'topics': {}}
+        for day, bucket in self.memory['daily_stats'].items():
+            if day < cutoff:
+                continue
+            activity['generations'] += bucket.get('generations', 0)
+            for key in ('sources', 'topics'):
+                for name, count in bucket.get(key, {}).items():
+                    activity[key][name] = activity[key].get(name, 0) + count
+        return activity
+
     def _extract_topics(self, text: str) -> List[str]:
         """Extrae tópicos clave del texto usando hashtags y palabras clave"""
-        topics = []
-
-        # Extraer hashtags
-        hashtags = re.findall(r'#(\w+)', text.lower())
-        topics.extend(hashtags)
-
-        # Palabras clave comunes de IA
-        keywords = ['gpt', 'gemini', 'claude', 'llm', 'vision', 'multimodal',
-                   'ai', 'ia', 'machine learning', 'neural', 'transformer',
-                   'chatbot', 'agent', 'automation']
-
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword in text_lower:
-                topics.append(keyword)
-
-        return list(set(topics))
+        return extract_topics(text)
 
     def was_article_processed(self, article_url: str) -> bool:
         """Verifica si un artículo ya fue procesado anteriormente"""
-        return any(a['url'] == article_url for a in self.memory['article_history'])
+        return normalize_url(article_url) in self._url_index
+
+    def find_near_duplicate(self, article: Dict, signature: str = None) -> Optional[str]:
+        """
+        URL de un artículo ya procesado casi igual a `article` (None si no hay).
+        `signature` evita recalcular la firma si ya se tiene.
+        """
+        return self._near_duplicate_index.best_match(
+            signature or dedup.signature(dedup.article_text(article)))
 
     def get_topic_diversity_score(self) -> float:
         """Calcula qué tan diversos son los tópicos cubiertos (0-1)"""
@@ -137,79 +287,138 @@ class DecisionEngine:
 
         return False, f"Condiciones normales. Próxima generación en {24 - hours_passed:.1f} horas"
 
-    def score_article(self, article: Dict) -> Tuple[float, List[str]]:
+    # Novedad de un artículo (ver _novelty)
+    NEW, PROCESSED, NEAR_DUPLICATE = 'new', 'processed', 'near_duplicate'
+
+    def _novelty(self, article: Dict, check_near_duplicates: bool = True, signature: str = None) -> str:
         """
-        Calcula un score de relevancia para un artículo (0-100)
-        Retorna (score, razones)
+        Artículos nuevos son mejores; una versión casi igual de un artículo ya
+        procesado (p.ej. sindicado con otra URL) no es nueva.
         """
-        score = 0.0
-        reasons = []
-
-        # 1. Novedad - artículos nuevos son mejores
-        if not self.memory.was_article_processed(article['url']):
-            score += 40
-            reasons.append("✓ Artículo nuevo (nunca procesado)")
+        if self.memory.was_article_processed(article['url']):
+            return self.PROCESSED
+        if check_near_duplicates and self.memory.find_near_duplicate(article, signature):
+            return self.NEAR_DUPLICATE
+        return self.NEW
+
+    @staticmethod
+    def _points(novelty: str, source_ratio: float, description_length: int, title_length: int) -> float:
+        """Puntaje (0-100) a partir de los factores ya calculados de un artículo"""
+        score = 40.0 if novelty == DecisionEngine.NEW else 5.0
+        if source_ratio is None or source_ratio < 0.3:
+            score += 30
+        elif source_ratio < 0.5:
+            score += 15
         else:
             score += 5
-            reasons.append("⚠ Artículo ya procesado anteriormente")
-
-        # 2. Balance de fuentes - preferir fuentes menos usadas
-        source = article['source']
-        source_count = self.memory.memory['sources_used'].get(source, 0)
-        total_sources = sum(self.memory.memory['sources_used'].values())
-
-        if total_sources > 0:
-            source_ratio = source_count / total_sources
-            if source_ratio < 0.3:
-                score += 30
-                reasons.append(f"✓ Fuente poco usada ({source_count} veces, {source_ratio*100:.0f}%)")
-            elif source_ratio < 0.5:
-                score += 15
-                reasons.append(f"~ Fuente moderadamente usada ({source_count} veces)")
-            else:
-                score += 5
-                reasons.append(f"⚠ Fuente muy usada ({source_count} veces, {source_ratio*100:.0f}%)")
-        else:
-            score += 30
+        if description_length > 100:
+            score += 15
+        elif description_length:
+            score += 8
+        if title_length > 30:
+            score += 15
+        return score
+
+    @staticmethod
+    def _reasons(novelty: str, source_count: int, source_ratio: float,
+                 description_length: int, title_length: int) -> List[str]:
+        """Explicación legible de los factores que componen el puntaje"""
+        reasons = [{
+            DecisionEngine.PROCESSED: "⚠ Artículo ya procesado anteriormente",
+            DecisionEngine.NEAR_DUPLICATE: "⚠ Casi duplicado de un artículo ya procesado",
+            DecisionEngine.NEW: "✓ Artículo nuevo (nunca procesado)"
+        }[novelty]]
+
+        if source_ratio is None:
             reasons.append("✓ Primera vez usando esta fuente")
+        elif source_ratio < 0.3:
+            reasons.append(f"✓ Fuente poco usada ({source_count} veces, {source_ratio*100:.0f}%)")
+        elif source_ratio < 0.5:
+            reasons.append(f"~ Fuente moderadamente usada ({source_count} veces)")
+        else:
+            reasons.append(f"⚠ Fuente muy usada ({source_count} veces, {source_ratio*100:.0f}%)")
 
-        # 3. Calidad del contenido - descripción y título
-        if article.get('description') and len(article['description']) > 100:
-            score += 15
+        if description_length > 100:
             reasons.append("✓ Descripción detallada disponible")
-        elif article.get('description'):
-            score += 8
+        elif description_length:
             reasons.append("~ Descripción corta")
-
-        if len(article.get('title', '')) > 30:
-            score += 15
+        if title_length > 30:
             reasons.append("✓ Título descriptivo")
+        return reasons
+
+    def _factors(self, articles: List[Dict], signatures: List[str] = None) -> List[Tuple]:
+        """
+        Factores de puntaje de todos los artículos en una pasada:
+        (novedad, usos de la fuente, proporción de la fuente o None, largo de
+        la descripción, largo del título). Los totales de fuentes se calculan
+        una sola vez y la búsqueda de casi duplicados se omite si no hay historial.
+        Las firmas (`signatures`, en el orden de `articles`) se calculan en lote
+        antes del recorrido si no vienen dadas.
+        """
+        sources_used = self.memory.memory['sources_used']
+        total_sources = sum(sources_used.values())
+        check_near_duplicates = len(self.memory.memory['article_history']) > 0
+        if not check_near_duplicates:
+            signatures = [None] * len(articles)
+        elif signatures is None:
+            signatures = dedup.signatures(dedup.article_text(article) for article in articles)
+        factors = []
+        for article, signature in zip(articles, signatures):
+            source_count = sources_used.get(article['source'], 0)
+            factors.append((
+                self._novelty(article, check_near_duplicates, signature),
+                source_count,
+                source_count / total_sources if total_sources > 0 else None,
+                len(article.get('description') or ''),
+                len(article.get('title', ''))
+            ))
+        return factors
 
-        return score, reasons
+    def score_article(self, article: Dict) -> Tuple[float, List[str]]:
+        """
+        Calcula un score de relevancia para un artículo (0-100)
+        Retorna (score, razones)
+        """
+        novelty, source_count, source_ratio, description_length, title_length = self._factors([article])[0]
+        return (self._points(novelty, source_ratio, description_length, title_length),
+                self._reasons(novelty, source_count, source_ratio, description_length, title_length))
 
-    def select_best_articles(self, articles: List[Dict], max_articles: int = 3) -> List[Dict]:
-        """Selecciona los mejores artículos basado en scoring"""
-        scored_articles = []
+    def score_articles(self, articles: List[Dict]) -> List[float]:
+        """Scores de muchos artículos (mismo orden), sin construir las razones"""
+        return [self._points(novelty, ratio, description_length, title_length)
+                for novelty, _, ratio, description_length, title_length in self._factors(articles)]
 
+    def select_best_articles(self, articles: List[Dict], max_articles: int = 3,
+                             on_event: Callable = None, signatures: List[str] = None) -> List[Dict]:
+        """
+        Selecciona los mejores artículos basado en scoring
+        on_event(tipo, **datos) recibe un 'article_scored' por artículo.
+        `signatures` son las firmas de casi duplicados de `articles` si ya se calcularon.
+        Solo se explican (razones impresas) los artículos seleccionados;
+        score_article() da la explicación de cualquier otro.
+        """
         print("\n🧠 MOTOR DE DECISIONES - Evaluando artículos...")
         print("=" * 70)
 
-        for article in articles:
-            score, reasons = self.score_article(article)
-            scored_articles.append((score, article, reasons))
-
-            print(f"\n📄 {article['title'][:60]}...")
-            print(f"   Fuente: {article['source']}")
-            print(f"   Score: {score:.1f}/100")
-            for reason in reasons:
+        factors = self._factors(articles, signatures)
+        scores = [self._points(novelty, ratio, description_length, title_length)
+                  for novelty, _, ratio, description_length, title_length in factors]
+        if on_event:
+            for article, score in zip(articles, scores):
+                on_event('article_scored', title=article['title'], source=article['source'],
+                         score=score)
+
+        # Top-k con un heap; en empates se conserva el orden original
+        best = heapq.nlargest(max_articles, range(len(articles)), key=scores.__getitem__)
+        selected = [articles[i] for i in best]
+
+        for i in best:
+            print(f"\n📄 {articles[i]['title'][:60]}...")
+            print(f"   Fuente: {articles[i]['source']}")
+            print(f"   Score: {scores[i]:.1f}/100")
+            for reason in self._reasons(*factors[i]):
                 print(f"   {reason}")
 
-        # Ordenar por score descendente
-        scored_articles.sort(reverse=True, key=lambda x: x[0])
-
-        # Seleccionar los mejores
-        selected = [item[1] for item in scored_articles[:max_articles]]
-
         print("\n" + "=" * 70)
         print(f"✅ Seleccionados {len(selected)} artículos de {len(articles)} candidatos")
         print("=" * 70)
@@ -232,17 +441,10 @@ class LearningSystem:
             'recommendations': []
         }
 
-        # Cargar todos los posts
-        posts_file = self.memory.posts_file
-        if posts_file.exists():
-            with open(posts_file, 'r', encoding='utf-8') as f:
-                posts = json.load(f)
-                analysis['total_posts_generated'] = len(posts)
-
-                # Analizar balance de fuentes
-                sources = [p['article']['source'] for p in posts]
-                source_counts = Counter(sources)
-                analysis['sources_balance'] = dict(source_counts)
+        # Analíticas materializadas del store (no hace falta leer los posts)
+        stats = self.memory.post_store.analytics()
+        analysis['total_posts_generated'] = stats['total_posts']
+        analysis['sources_balance'] = stats['sources']
 
         # Copiar tópicos de memoria
         analysis['topic_coverage'] = self.memory.memory['topics_covered'].copy()
@@ -304,23 +506,101 @@ class LearningSystem:
 class AutonomousAgent:
     """Agente autónomo con capacidades de memoria, decisión y aprendizaje"""
 
-    def __init__(self, data_dir: str = "../data"):
-        self.memory = AgentMemory(data_dir)
+    def __init__(self, data_dir: str = "../data", post_store: PostStore = None):
+        self.memory = AgentMemory(data_dir, post_store=post_store)
         self.decision_engine = DecisionEngine(self.memory)
         self.learning_system = LearningSystem(self.memory)
+        # Vistas derivadas cacheadas: nombre -> (clave de versión, valor)
+        self._views: Dict[str, Tuple[tuple, object]] = {}
+
+    def state_version(self) -> Tuple[int, int]:
+        """(versión de la memoria, versión del store de posts)"""
+        return self.memory.version, self.memory.post_store.version
+
+    @staticmethod
+    def _clock_bucket() -> int:
+        """Minuto actual: las vistas que dependen de la hora se recalculan a lo sumo una vez por minuto"""
+        return int(time.time() // 60)
+
+    def status_etag(self) -> str:
+        """ETag del estado: cambia con las versiones o al pasar el minuto"""
+        memory_version, store_version = self.state_version()
+        return f"{memory_version}.{store_version}.{self._clock_bucket()}"
+
+    def _cached_view(self, name: str, compute: Callable[[], object], *extra_key):
+        """
+        Devuelve la vista `name` si se calculó con las mismas versiones (y
+        extra_key); si no, la recalcula. Los valores se comparten entre
+        llamadas: no modificarlos.
+        """
+        key = (self.state_version(), extra_key)
+        cached = self._views.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self._views[name] = (key, value)
+        return value
+
+    def should_generate_now(self) -> Tuple[bool, str]:
+        """Decisión del motor, cacheada por versión y minuto"""
+        return self._cached_view('decision', self.decision_engine.should_generate_now,
+                                 self._clock_bucket())
+
+    def analyze_performance(self) -> Dict:
+        """Análisis de desempeño, recalculado solo si cambió la memoria o el store"""
+        return self._cached_view('performance', self.learning_system.analyze_performance)
+
+    def get_topic_diversity_score(self) -> float:
+        """Diversidad de tópicos cacheada por versión"""
+        return self._cached_view('diversity', self.memory.get_topic_diversity_score)
+
+    def get_recent_activity(self, days: int = 7) -> Dict:
+        """Actividad de los últimos `days` días, cacheada por versión y fecha"""
+        return self._cached_view(f'recent_activity_{days}',
+                                 lambda: self.memory.get_recent_activity(days),
+                                 datetime.now().date())
 
     def evaluate_and_decide(self) -> Tuple[bool, str, Dict]:
         """Evalúa la situación y decide si proceder"""
-        should_run, reason = self.decision_engine.should_generate_now()
+        should_run, reason = self.should_generate_now()
 
         # Análisis de desempeño
-        performance = self.learning_system.analyze_performance()
+        performance = self.analyze_performance()
 
         return should_run, reason, performance
 
-    def process_articles(self, articles: List[Dict]) -> List[Dict]:
+    def collapse_near_duplicates(self, articles: List[Dict], on_event: Callable = None) -> List[Dict]:
+        """
+        Deja un representante por grupo de artículos casi duplicados (el de
+        descripción más completa), para no puntuar ni generar dos veces la
+        misma noticia publicada por distintas fuentes.
+        """
+        signatures = dedup.signatures(dedup.article_text(article) for article in articles)
+        return [articles[i] for i in self._representatives(articles, signatures, on_event)]
+
+    @staticmethod
+    def _representatives(articles: List[Dict], signatures: List[str], on_event: Callable = None) -> List[int]:
+        """Índices (en orden) de los representantes de cada grupo de casi duplicados"""
+        clusters = dedup.cluster_articles(articles, article_signatures=signatures)
+        representatives = [
+            max(cluster, key=lambda i: (len(articles[i].get('description') or ''), -i))
+            for cluster in clusters
+        ]
+        removed = len(articles) - len(representatives)
+        if removed:
+            print(f"\n🔁 {removed} artículos casi duplicados descartados "
+                  f"({len(representatives)} únicos de {len(articles)})")
+            if on_event:
+                on_event('near_duplicates_collapsed', removed=removed, remaining=len(representatives))
+        return representatives
+
+    def process_articles(self, articles: List[Dict], on_event: Callable = None) -> List[Dict]:
         """Procesa artículos con decisión inteligente"""
-        return self.decision_engine.select_best_articles(articles)
+        # Las firmas se calculan una vez: sirven para agrupar y para buscar en el historial
+        signatures = dedup.signatures(dedup.article_text(article) for article in articles)
+        keep = self._representatives(articles, signatures, on_event)
+        return self.decision_engine.select_best_articles(
+            [articles[i] for i in keep], on_event=on_event, signatures=[signatures[i] for i in keep])
 
     def learn_from_generation(self, articles: List[Dict], posts: List[Dict]):
         """Aprende de una generación completada"""
@@ -328,7 +608,7 @@ class AutonomousAgent:
 
     def get_adaptive_params(self) -> Dict:
         """Obtiene parámetros adaptativos para la generación"""
-        return self.learning_system.get_adaptive_prompt_params()
+        return self._cached_view('adaptive_params', self.learning_system.get_adaptive_prompt_params)
 
     def print_status_report(self):
         """Imprime un reporte del estado del agente"""
@@ -341,14 +621,14 @@ class AutonomousAgent:
         print(f"   • Generaciones totales: {self.memory.memory['total_generations']}")
         print(f"   • Artículos procesados: {len(self.memory.memory['article_history'])}")
         print(f"   • Tópicos cubiertos: {len(self.memory.memory['topics_covered'])}")
-        print(f"   • Diversidad de tópicos: {self.memory.get_topic_diversity_score():.2%}")
+        print(f"   • Diversidad de tópicos: {self.get_topic_diversity_score():.2%}")
 
         if self.memory.memory['last_generation']:
             last = datetime.fromisoformat(self.memory.memory['last_generation'])
             print(f"   • Última generación: {last.strftime('%Y-%m-%d %H:%M:%S')}")
 
         # Análisis de desempeño
-        performance = self.learning_system.analyze_performance()
+        performance = self.analyze_performance()
 
         print(f"\n📈 Desempeño:")
         print(f"   • Posts generados total: {performance['total_posts_generated']}")
@@ -365,7 +645,7 @@ class AutonomousAgent:
                 print(f"   {rec}")
 
         # Decisión actual
-        should_run, reason = self.decision_engine.should_generate_now()
+        should_run, reason = self.should_generate_now()
         print(f"\n🎯 Decisión autónoma:")
         print(f"   • Generar ahora: {'✅ SÍ' if should_run else '❌ NO'}")
         print(f"   • Razón: {reason}")
@@ -0,0 +1,184 @@
+"""
+Ingesta en lote de fuentes personalizadas: muchas URLs en una sola operación.
+La metadata se descarga en paralelo (con un límite de conexiones por host),
+los posts se generan en paralelo bajo el rate limiter del generador y todo
+se guarda con un único append al store.
+
+Uso: python batch_ingest.py urls.txt   (una URL por línea; '#' comenta)
+"""
+import sys
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+from urllib.parse import urlsplit
+from metadata import MetadataService
+from services import ServiceContainer
+from url_utils import normalize_url
+
+# Estado final de cada URL
+CREATED = 'created'
+INVALID = 'invalid'
+DUPLICATE = 'duplicate'
+ALREADY_PROCESSED = 'already_processed'
+METADATA_FAILED = 'metadata_failed'
+GENERATION_FAILED = 'generation_failed'
+
+MAX_BATCH_URLS = 500
+CUSTOM_SOURCE = 'Fuente Personalizada'
+
+
+class HostLimiter:
+    """Limita las descargas simultáneas contra un mismo host"""
+
+    def __init__(self, per_host: int = 2):
+        self.per_host = per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with semaphore:
+            yield
+
+
+def _build_article(url: str, metadata: Dict) -> Dict:
+    """Artículo de fuente personalizada (mismo formato que /api/custom-source)"""
+    return {
+        'title': metadata.get('title') or url,
+        'url': url,
+        'description': metadata.get('description') or 'Artículo personalizado',
+        'source': CUSTOM_SOURCE,
+        'scraped_at': datetime.now().isoformat()
+    }
+
+
+def ingest_urls(urls: List[str], services: ServiceContainer, metadata_service: MetadataService,
+                max_workers: int = 8, per_host: int = 2, skip_processed: bool = True,
+                on_event: Callable = None, check_cancelled: Callable[[], None] = None) -> Dict:
+    """
+    Genera y guarda un post por URL.
+    Devuelve {'total', 'created', 'counts', 'results'} con un resultado por
+    URL recibida (en el mismo orden): {'url', 'status', 'post_id'?, 'error'?}.
+    Las URLs cuya metadata no se puede descargar no se envían a Gemini.
+    on_event(tipo, **datos) recibe el progreso; check_cancelled() puede
+    lanzar una excepción para abortar antes de generar o de guardar.
+    """
+    emit = on_event or (lambda *args, **kwargs: None)
+    check_cancelled = check_cancelled or (lambda: None)
+    results = [{'url': (url or '').strip(), 'status': None} for url in urls]
+
+    # 1. Validar, deduplicar y descartar lo ya procesado
+    pending = []
+    seen = set()
+    with services.brain() as brain:
+        for result in results:
+            url = result['url']
+            if urlsplit(url).scheme not in ('http', 'https'):
+                result['status'] = INVALID
+                continue
+            key = normalize_url(url)
+            if key in seen:
+                result['status'] = DUPLICATE
+                continue
+            seen.add(key)
+            if skip_processed and brain.memory.was_article_processed(url):
+                result['status'] = ALREADY_PROCESSED
+                continue
+            pending.append(result)
+
+    # 2. Metadata en paralelo, como mucho `per_host` descargas por host
+    limiter = HostLimiter(per_host)
+    done = Counter()
+    done_lock = threading.Lock()
+
+    def fetch(result: Dict):
+        try:
+            with limiter.slot(result['url']):
+                result['article'] = _build_article(result['url'], metadata_service.get(result['url']))
+        except Exception as e:
+            result['status'] = METADATA_FAILED
+            result['error'] = str(e)
+        with done_lock:
+            done['metadata'] += 1
+            count = done['metadata']
+        emit('metadata_fetched', url=result['url'], success='article' in result,
+             done=count, total=len(pending))
+
+    if pending:
+        emit('metadata_phase', f'Descargando metadata de {len(pending)} URLs...', urls=len(pending))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending)),
+                                thread_name_prefix='ingest') as executor:
+            list(executor.map(fetch, pending))
+
+    to_generate = [r for r in pending if 'article' in r]
+    check_cancelled()
+
+    # 3. Generación en paralelo (el generador aplica el rate limiter)
+    posts = []
+    if to_generate:
+        emit('generation_phase', f'Generando {len(to_generate)} posts...', articles=len(to_generate))
+        with services.brain() as brain:
+            adaptive_params = brain.get_adaptive_params()
+        generated = services.get_generator().generate_posts_from_articles(
+            [r['article'] for r in to_generate], adaptive_params, on_event=on_event
+        )
+        by_url = {post['article']['url']: post for post in generated}
+        # El sufijo aleatorio distingue lotes que terminan en el mismo segundo
+        stamp = f"{datetime.now():%Y%m%d_%H%M%S}_batch_{uuid.uuid4().hex[:8]}"
+        for i, result in enumerate(to_generate):
+            post = by_url.get(result['url'])
+            if post is None:
+                result['status'] = GENERATION_FAILED
+                continue
+            post['id'] = f"post_{stamp}_{i}"
+            result['status'] = CREATED
+            result['post_id'] = post['id']
+            posts.append(post)
+
+    # 4. Un único write para todo el lote, y una sola pasada de aprendizaje
+    check_cancelled()
+    if posts:
+        services.post_store.append_posts(posts)
+        emit('saved', count=len(posts), post_ids=[p['id'] for p in posts])
+        with services.brain() as brain:
+            brain.learn_from_generation([p['article'] for p in posts], posts)
+
+    for result in results:
+        result.pop('article', None)
+    counts = Counter(r['status'] for r in results)
+    return {
+        'total': len(results),
+        'created': counts.get(CREATED, 0),
+        'counts': dict(counts),
+        'results': results
+    }
+
+
+def read_url_file(path: Path) -> List[str]:
+    """URLs de un archivo de texto (una por línea, se ignoran vacías y comentarios)"""
+    lines = Path(path).read_text(encoding='utf-8').splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python batch_ingest.py <urls.txt>")
+        sys.exit(1)
+
+    urls = read_url_file(Path(sys.argv[1]))
+    print(f"📥 Ingestando {len(urls)} URLs...")
+    services = ServiceContainer(Path(__file__).parent.parent / "data")
+    summary = ingest_urls(urls, services, MetadataService())
+
+    for result in summary['results']:
+        detail = result.get('post_id') or result.get('error') or ''
+        print(f"  {result['status']:<18} {result['url']} {detail}")
+    print(f"\n✅ {summary['created']}/{summary['total']} posts creados: {summary['counts']}")
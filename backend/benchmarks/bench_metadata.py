@@ -0,0 +1,103 @@
+"""
+Benchmark de extracción de metadata: documento completo + BeautifulSoup
+(implementación anterior) contra lectura en streaming hasta </head>.
+
+Uso (desde backend/):  python benchmarks/bench_metadata.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bs4 import BeautifulSoup
+from metadata import CHUNK_SIZE, extract_metadata_stream
+
+SIZES = {'100KB': 100 * 1024, '1MB': 1024 * 1024, '5MB': 5 * 1024 * 1024}
+
+HEAD = """<!DOCTYPE html><html><head>
+<meta charset="utf-8">
+<title>Anuncio de un nuevo modelo multimodal</title>
+<meta property="og:title" content="Nuevo modelo multimodal">
+<meta property="og:description" content="Resumen del anuncio para redes sociales">
+<link rel="stylesheet" href="/static/site.css">
+<script>window.dataLayer = window.dataLayer || [];</script>
+</head>
+"""
+
+PARAGRAPH = ('<article class="post"><h2>Sección</h2><p>Los modelos de lenguaje '
+             '<a href="/ai">grandes</a> siguen mejorando en razonamiento y '
+             '<strong>eficiencia</strong>.</p></article>\n')
+
+
+def make_fixture(directory: Path, name: str, size: int) -> Path:
+    """Página HTML con un <head> típico y un <body> de `size` bytes aproximados"""
+    path = directory / f'page_{name}.html'
+    repeats = max(1, size // len(PARAGRAPH.encode('utf-8')))
+    path.write_text(HEAD + '<body>' + PARAGRAPH * repeats + '</body></html>', encoding='utf-8')
+    return path
+
+
+def full_document(path: Path) -> dict:
+    """Implementación anterior: descarga completa y árbol completo"""
+    soup = BeautifulSoup(path.read_bytes(), 'html.parser')
+    title = None
+    if soup.find('meta', property='og:title'):
+        title = soup.find('meta', property='og:title').get('content')
+    elif soup.find('title'):
+        title = soup.find('title').get_text(strip=True)
+    description = None
+    if soup.find('meta', property='og:description'):
+        description = soup.find('meta', property='og:description').get('content')
+    elif soup.find('meta', attrs={'name': 'description'}):
+        description = soup.find('meta', attrs={'name': 'description'}).get('content')
+    return {'title': title, 'description': description}
+
+
+def streaming(path: Path) -> dict:
+    """Lectura por chunks (como iter_content) hasta </head>"""
+    with open(path, 'rb') as f:
+        return extract_metadata_stream(iter(lambda: f.read(CHUNK_SIZE), b''))
+
+
+def measure(fn, path: Path, runs: int) -> dict:
+    """Mediana de latencia y pico de memoria (tracemalloc) de fn(path)"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(path)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'median_ms': statistics.median(timings) * 1000, 'peak_kb': peak / 1024, 'result': result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'tamaño':>7} | {'método':<10} | {'mediana ms':>10} | {'pico KB':>9}")
+        print('-' * 46)
+        for name, size in SIZES.items():
+            path = make_fixture(Path(tmp), name, size)
+            baseline = measure(full_document, path, args.runs)
+            streamed = measure(streaming, path, args.runs)
+            assert baseline['result'] == streamed['result'], (baseline['result'], streamed['result'])
+            for label, stats in (('completo', baseline), ('streaming', streamed)):
+                print(f"{name:>7} | {label:<10} | {stats['median_ms']:>10.2f} | {stats['peak_kb']:>9.1f}")
+            print(f"{'':>7}   speedup x{baseline['median_ms'] / streamed['median_ms']:.0f}, "
+                  f"memoria x{baseline['peak_kb'] / streamed['peak_kb']:.0f} menos")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark de parsing del scraper: BeautifulSoup sobre el documento completo
+(implementación anterior) contra html_parsing (parsing acotado y strip_tags).
+
+Uso (desde backend/):  python benchmarks/bench_parsing.py [--runs 5]
+Con HTML_PARSER=html.parser|lxml|selectolax se fuerza el backend.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bs4 import BeautifulSoup
+import html_parsing
+
+NAV = '<nav>' + ''.join(f'<a href="/section/{i}">Sección {i}</a>' for i in range(80)) + '</nav>'
+SIDEBAR = '<aside>' + '<div class="card"><span>Relacionado</span><img src="x.png"></div>' * 300 + '</aside>'
+ARTICLE = ('<article><div class="meta"><time>2026-01-01</time></div><h3>Anuncio {i} sobre modelos</h3>'
+           '<a href="/technology/ai/post-{i}/">Leer más</a><p>Resumen del anuncio {i} con '
+           '<strong>detalles</strong> y <em>contexto</em>.</p></article>')
+SCRIPT = '<script>' + 'var x = 1;' * 2000 + '</script>'
+
+# Páginas de listado típicas: mucho markup alrededor de unos pocos artículos
+BLOG_PAGE = ('<html><head>' + SCRIPT + '</head><body>' + NAV + SIDEBAR +
+             ''.join(ARTICLE.format(i=i) for i in range(20)) + SIDEBAR + '</body></html>').encode('utf-8')
+NEWS_PAGE = ('<html><body>' + SIDEBAR +
+             ''.join(f'<a href="/index/post-{i}/">Título de la noticia número {i}</a>' for i in range(40)) +
+             NAV + '</body></html>').encode('utf-8')
+RSS_DESCRIPTIONS = [
+    f'<p>Descripción del item {i} con <a href="https://openai.com/{i}">enlaces</a>, '
+    f'<strong>énfasis</strong> &amp; entidades.</p><p>Segundo párrafo.</p>' for i in range(5)
+]
+
+
+def old_articles(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    results = []
+    for element in soup.find_all('article', limit=5):
+        title = element.find(['h2', 'h3'])
+        link = element.find('a', href=True)
+        paragraph = element.find('p')
+        results.append((title.get_text(strip=True) if title else None,
+                        link['href'] if link else '',
+                        paragraph.get_text(strip=True) if paragraph else ''))
+    return results
+
+
+def new_articles(content):
+    return [(a['title'], a['href'], a['description'])
+            for a in html_parsing.find_articles(content, limit=5)]
+
+
+def old_links(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return [(a.get('href', ''), a.get_text(strip=True)) for a in soup.find_all('a', href=True)[:10]]
+
+
+def new_links(content):
+    return html_parsing.find_links(content, limit=10)
+
+
+def old_descriptions(descriptions):
+    return [BeautifulSoup(d, 'html.parser').get_text(strip=True)[:300] for d in descriptions]
+
+
+def new_descriptions(descriptions):
+    return [html_parsing.strip_tags(d, max_length=300) for d in descriptions]
+
+
+CASES = [
+    ('blog <article>', BLOG_PAGE, old_articles, new_articles, True),
+    ('news <a>', NEWS_PAGE, old_links, new_links, True),
+    ('rss descripciones', RSS_DESCRIPTIONS, old_descriptions, new_descriptions, False),
+]
+
+
+def median_seconds(fn, payload, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(payload)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"backend: {html_parsing.BACKEND}")
+    print(f"{'caso':<18} | {'anterior ms':>11} | {'nuevo ms':>9} | {'speedup':>7}")
+    print('-' * 55)
+    for name, payload, old, new, same_output in CASES:
+        if same_output:
+            assert old(payload) == new(payload), name
+        old_s = median_seconds(old, payload, args.runs)
+        new_s = median_seconds(new, payload, args.runs)
+        print(f"{name:<18} | {old_s * 1000:>11.2f} | {new_s * 1000:>9.2f} | x{old_s / new_s:>6.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark del pipeline completo (SocialPostAgent.run: scraping, selección,
+generación con Gemini, guardado y aprendizaje) reproducido desde un cassette
+de replay.py, sin red. Cada corrida usa un directorio de datos nuevo.
+
+Primero se graba el cassette con red y API key, en las mismas condiciones
+(directorio de datos nuevo, sin caché de generaciones), así los prompts que
+se reproducen son los grabados (desde backend/):
+  python benchmarks/bench_pipeline.py --cassette cassettes/demo --record
+y después:
+  python benchmarks/bench_pipeline.py --cassette cassettes/demo [--runs 20] [--profile pipeline.prof]
+La latencia, errores y límite de tasa se inyectan con REPLAY_LATENCY_MS,
+REPLAY_ERROR_RATE y REPLAY_RATE_LIMIT (ver replay.py).
+
+El benchmark falla si alguna llamada no está en el cassette o si una corrida
+no genera posts: los tiempos de un pipeline incompleto no son comparables.
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def _misses(agent) -> int:
+    """Llamadas HTTP y prompts de Gemini que no estaban en el cassette"""
+    import http_client
+    adapter = http_client.get_session().get_adapter('https://')
+    return getattr(adapter, 'misses', 0) + getattr(agent.generator.client, 'misses', 0)
+
+
+def run_once(profiler: cProfile.Profile = None) -> tuple:
+    """Una corrida del pipeline en un directorio de datos nuevo: (segundos, posts creados, agente)"""
+    from agent import SocialPostAgent
+    from feed_cache import FeedCache
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        agent = SocialPostAgent(data_dir=data_dir)
+        agent.scraper.cache = FeedCache(Path(data_dir) / 'http_cache.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            if profiler:
+                profiler.enable()
+            start = time.perf_counter()
+            agent.run(interactive=False)
+            elapsed = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+        created = agent.store.count()
+        agent.store.close()
+    return elapsed, created, agent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cassette', type=Path, required=True)
+    parser.add_argument('--record', action='store_true',
+                        help="graba el cassette con una corrida real (red y GEMINI_API_KEY)")
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--profile', type=Path, help="guarda un perfil cProfile de todas las corridas")
+    args = parser.parse_args()
+
+    # Antes de importar el agente: el cliente HTTP y el generador leen estas variables
+    os.environ['REPLAY_MODE'] = 'record' if args.record else 'replay'
+    os.environ['REPLAY_CASSETTE'] = str(args.cassette.resolve())
+    os.environ['GENERATION_CACHE'] = '0'     # cada corrida llega al cassette de Gemini
+    if not args.record:
+        os.environ.setdefault('GEMINI_RPM', '100000')
+
+    from metrics import LatencyTracker
+
+    if args.record:
+        elapsed, created, _ = run_once()
+        if not created:
+            sys.exit("❌ La corrida no generó posts: el cassette no sirve para el benchmark")
+        print(f"✅ Cassette grabado en {args.cassette} ({created} posts, {elapsed:.1f} s)")
+        return
+
+    tracker = LatencyTracker(window=args.runs)
+    profiler = cProfile.Profile() if args.profile else None
+    created = []
+    for run in range(1, args.runs + 1):
+        elapsed, count, agent = run_once(profiler)
+        misses = _misses(agent)
+        if misses or not count:
+            sys.exit(f"❌ Corrida {run}: {misses} llamadas sin grabar, {count} posts. "
+                     f"Vuelve a grabarlo con --record")
+        tracker.record(elapsed)
+        created.append(count)
+
+    summary = tracker.summary()
+    print(f"{args.runs} corridas, posts por corrida: {min(created)}-{max(created)}")
+    print(f"p50 {summary['p50_ms']:.1f} ms | p99 {summary['p99_ms']:.1f} ms | max {summary['max_ms']:.1f} ms")
+    if profiler:
+        profiler.dump_stats(args.profile)
+        print(f"Perfil en {args.profile} (python -m pstats {args.profile})")
+
+
+if __name__ == '__main__':
+    main()
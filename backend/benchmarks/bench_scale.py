@@ -0,0 +1,251 @@
+"""
+Benchmark de escala: latencia p50/p99 y pico de RSS del store, del cerebro
+y de los endpoints de la API (vía el test client de Flask) con data sets
+sintéticos de 1k a 1M posts / entradas de historial. No usa la red.
+
+Cada tamaño corre en su propio proceso (el pico de RSS es por proceso) sobre
+una copia del data set, así las operaciones que escriben no lo alteran.
+Los resultados se guardan en JSON para comparar entre commits.
+
+Uso (desde backend/):
+  python benchmarks/bench_scale.py [--sizes 1k,10k,100k] [--output resultados.json]
+  python benchmarks/bench_scale.py --sizes 1m                 # la primera vez genera ~1h de datos
+  python benchmarks/bench_scale.py --compare antes.json despues.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import resource
+except ImportError:  # Windows: sin getrusage
+    resource = None
+
+from metrics import LatencyTracker
+import synthetic
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+SIZE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(text: str) -> int:
+    """'10k' -> 10000, '1m' -> 1000000, '500' -> 500"""
+    text = text.strip().lower()
+    if text[-1:] in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def peak_rss_mb() -> float:
+    """Pico de memoria residente del proceso hasta ahora (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS, bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def measure(fn: Callable[[], object], repeats: int, warmup: int = 1) -> Dict:
+    """count/avg/p50/p99/max en ms de `repeats` llamadas a fn, más el pico de RSS tras ellas"""
+    tracker = LatencyTracker(window=repeats)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            fn()
+        for _ in range(repeats):
+            with tracker.measure():
+                fn()
+    return {**tracker.summary(), 'peak_rss_mb': peak_rss_mb()}
+
+
+def _operations(data_dir: Path, count: int) -> List[tuple]:
+    """(nombre, función, repeticiones) de cada operación medida sobre `data_dir`"""
+    import server
+    from agent_brain import AgentMemory, AutonomousAgent, DecisionEngine, LearningSystem
+    from post_store import PostStore
+    from services import ServiceContainer
+
+    store = PostStore(data_dir)
+    # La API usa el store y el cerebro del data set sintético en lugar de ../data
+    server.post_store = store
+    server.services = ServiceContainer(data_dir, post_store=store)
+    server.app.config['TESTING'] = True
+    client = server.app.test_client()
+
+    rng = random.Random(5)
+    with sqlite3.connect(store.db_file) as conn:
+        seqs = rng.sample(range(1, count + 1), min(count, 200))
+        post_ids = [row[0] for row in conn.execute(
+            f"SELECT id FROM posts WHERE seq IN ({','.join('?' * len(seqs))})", seqs)]
+    ids = iter(lambda: rng.choice(post_ids), None)
+    history_urls = [f'https://history.example.com/articulo/{i}' for i in rng.sample(range(count), min(count, 200))]
+    urls = iter(lambda: rng.choice(history_urls), None)
+    # Artículos nunca vistos en cada llamada: las firmas no salen de la caché
+    fresh = synthetic.iter_articles(10 ** 9, seed=99, prefix='candidatos')
+    articles = iter(list(islice(fresh, 1500)))
+    pools = iter([list(islice(fresh, 100)) for _ in range(21)])
+
+    memory = AgentMemory(data_dir, post_store=store)
+    engine = DecisionEngine(memory)
+    learning = LearningSystem(memory)
+    agent = AutonomousAgent(data_dir, post_store=store)
+    stats_etag = client.get('/api/stats').headers['ETag']
+
+    def remember():
+        picked = list(islice(fresh, 3))
+        memory.remember_generation(picked, [{'post_text': a['description']} for a in picked])
+
+    def append():
+        post = next(synthetic.iter_posts(1, seed=rng.randrange(1 << 30)))
+        store.append_posts([dict(post, id=f"{post['id']}_{rng.randrange(1 << 30)}")])
+
+    return [
+        # Store (SQLite)
+        ('store.load_posts', store.load_posts, 3),
+        ('store.get_post', lambda: store.get_post(next(ids)), 500),
+        ('store.query_posts', lambda: store.query_posts(limit=20), 200),
+        ('store.query_posts_search', lambda: store.query_posts(limit=20, q='agent'), 20),
+        ('store.analytics', store.analytics, 200),
+        # Cerebro
+        ('memory.load', lambda: AgentMemory(data_dir, post_store=store), 3),
+        ('memory.was_article_processed', lambda: memory.was_article_processed(next(urls)), 1000),
+        ('memory.find_near_duplicate', lambda: memory.find_near_duplicate(next(articles)), 200),
+        ('memory.get_topic_diversity_score', memory.get_topic_diversity_score, 200),
+        ('memory.get_recent_activity', lambda: memory.get_recent_activity(7), 50),
+        ('engine.score_article', lambda: engine.score_article(next(articles)), 500),
+        ('agent.process_articles_100', lambda: agent.process_articles(next(pools)), 20),
+        ('learning.analyze_performance', learning.analyze_performance, 50),
+        ('agent.evaluate_and_decide_cached', agent.evaluate_and_decide, 200),
+        # API (Flask test client)
+        ('api.health', lambda: client.get('/api/health'), 200),
+        ('api.posts', lambda: client.get('/api/posts'), 200),
+        ('api.posts_search', lambda: client.get('/api/posts?q=agent'), 20),
+        ('api.post', lambda: client.get(f'/api/posts/{next(ids)}'), 500),
+        ('api.stats', lambda: client.get('/api/stats'), 200),
+        ('api.stats_not_modified', lambda: client.get('/api/stats', headers={'If-None-Match': stats_etag}), 200),
+        ('api.store_metrics', lambda: client.get('/api/store/metrics'), 100),
+        ('api.agent_status', lambda: client.get('/api/agent/status'), 100),
+        ('api.agent_memory', lambda: client.get('/api/agent/memory'), 3),
+        # Escrituras al final: cambian el data set (es una copia)
+        ('store.append_posts', append, 20),
+        ('memory.remember_generation', remember, 3),
+    ]
+
+
+def run_size(source_dir: Path) -> Dict:
+    """Mide todas las operaciones sobre una copia de `source_dir` (en este proceso)"""
+    manifest = json.loads((source_dir / 'dataset.json').read_text())
+    count = manifest['count']
+    results = {'count': count, 'anchor': manifest['anchor'], 'baseline_rss_mb': peak_rss_mb(),
+               'operations': {}}
+    with tempfile.TemporaryDirectory() as work_dir:
+        data_dir = Path(work_dir) / 'data'
+        shutil.copytree(source_dir, data_dir)
+        # server abre su store al importarse: que sea la copia y no el data/ del repo
+        os.environ['DATA_DIR'] = str(data_dir)
+        for name, fn, repeats in _operations(data_dir, count):
+            results['operations'][name] = measure(fn, repeats)
+            summary = results['operations'][name]
+            print(f"  {name:<36} p50 {summary['p50_ms']:>10.3f} ms   p99 {summary['p99_ms']:>10.3f} ms   "
+                  f"RSS {summary['peak_rss_mb']} MB", file=sys.stderr)
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: List[int], cache_dir: Path) -> Dict:
+    """Genera (o reutiliza) los data sets y mide cada tamaño en un proceso aparte"""
+    report = {
+        'commit': _git_commit(),
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': {}
+    }
+    for count in sizes:
+        source_dir = synthetic.ensure_dataset(count, cache_dir)
+        print(f"📏 {count:,} posts / entradas de historial", file=sys.stderr)
+        # El progreso del worker sale por stderr; el resultado, como JSON por stdout
+        worker = subprocess.run([sys.executable, __file__, '--worker', str(source_dir)],
+                                stdout=subprocess.PIPE, text=True)
+        if worker.returncode != 0:
+            raise RuntimeError(f"Falló el benchmark de {count:,}: código {worker.returncode}")
+        report['sizes'][str(count)] = json.loads(worker.stdout)
+    return report
+
+
+def compare(before: Dict, after: Dict):
+    """Imprime p50/p99 de dos reportes y la razón después/antes por operación"""
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    for size, results in after['sizes'].items():
+        previous = before['sizes'].get(size, {}).get('operations', {})
+        print(f"\n{int(size):,}")
+        if before['sizes'].get(size, {}).get('anchor') != results.get('anchor'):
+            print("⚠️  Data sets generados en días distintos: la retención de la memoria "
+                  "puede haber recortado distinto el historial")
+        print(f"{'operación':<36} | {'p50 antes':>10} | {'p50 después':>11} | {'x':>6} | "
+              f"{'p99 antes':>10} | {'p99 después':>11}")
+        for name, summary in results['operations'].items():
+            old = previous.get(name)
+            if old is None:
+                print(f"{name:<36} | {'-':>10} | {summary['p50_ms']:>11.3f} | {'-':>6} | "
+                      f"{'-':>10} | {summary['p99_ms']:>11.3f}")
+                continue
+            ratio = summary['p50_ms'] / old['p50_ms'] if old['p50_ms'] else float('inf')
+            print(f"{name:<36} | {old['p50_ms']:>10.3f} | {summary['p50_ms']:>11.3f} | {ratio:>6.2f} | "
+                  f"{old['p99_ms']:>10.3f} | {summary['p99_ms']:>11.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1k,10k,100k',
+                        help="tamaños separados por coma (1k, 10k, 100k, 1m)")
+    parser.add_argument('--output', type=Path,
+                        help=f"archivo JSON de resultados (por defecto {RESULTS_DIR.name}/<commit>-<fecha>.json)")
+    parser.add_argument('--cache-dir', type=Path, default=synthetic.DEFAULT_CACHE_DIR,
+                        help="dónde se guardan los data sets generados")
+    parser.add_argument('--compare', nargs=2, type=Path, metavar=('ANTES', 'DESPUES'),
+                        help="compara dos archivos de resultados")
+    parser.add_argument('--worker', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        # stdout queda solo para el JSON del resultado; todo lo demás va a stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_size(args.worker)
+        print(json.dumps(results))
+        return
+    if args.compare:
+        before, after = (json.loads(path.read_text(encoding='utf-8')) for path in args.compare)
+        compare(before, after)
+        return
+
+    report = run([parse_size(size) for size in args.sizes.split(',')], args.cache_dir)
+    output = args.output or RESULTS_DIR / f"{report['commit'] or 'sin-commit'}-{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\n✅ Resultados en {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de selección de artículos: implementación anterior (score_article
+por artículo, sort completo e impresión de todas las razones) contra
+select_best_articles con scoring en lote y top-k con heap, sin historial y
+con historial (donde domina la búsqueda de casi duplicados).
+
+Uso (desde backend/):  python benchmarks/bench_scoring.py [--candidates 10000] [--history 1000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agent_brain import AgentMemory, DecisionEngine
+
+SOURCES = ['OpenAI Blog', 'Google AI Blog', 'Anthropic News', 'Hugging Face', 'Fuente Personalizada']
+
+
+def make_articles(count: int, seed: int, prefix: str) -> list:
+    """Artículos sintéticos con títulos y descripciones de largo variable"""
+    rng = random.Random(seed)
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+             for _ in range(3000)]
+    return [{
+        'title': ' '.join(rng.choice(words) for _ in range(rng.randint(3, 10))),
+        'url': f'https://example.com/{prefix}/{i}',
+        'description': ' '.join(rng.choice(words) for _ in range(rng.randint(0, 30))),
+        'source': rng.choice(SOURCES),
+        'scraped_at': '2026-01-03T12:00:00'
+    } for i in range(count)]
+
+
+def legacy_select(engine: DecisionEngine, articles: list, max_articles: int = 3) -> list:
+    """Implementación anterior de select_best_articles"""
+    scored = []
+    for article in articles:
+        score, reasons = engine.score_article(article)
+        scored.append((score, article, reasons))
+        print(f"\n📄 {article['title'][:60]}...")
+        print(f"   Fuente: {article['source']}")
+        print(f"   Score: {score:.1f}/100")
+        for reason in reasons:
+            print(f"   {reason}")
+    scored.sort(reverse=True, key=lambda x: x[0])
+    return [item[1] for item in scored[:max_articles]]
+
+
+def timed(fn, *args):
+    """(segundos, resultado) de fn(*args), sin la salida impresa"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = fn(*args)
+        return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--candidates', type=int, default=10000)
+    parser.add_argument('--history', type=int, default=1000)
+    args = parser.parse_args()
+
+    candidates = make_articles(args.candidates, seed=3, prefix='c')
+    print(f"{args.candidates} candidatos")
+    print(f"{'historial':<10} | {'método':<24} | {'segundos':>9}")
+    print('-' * 50)
+    for history in (0, args.history):
+        with tempfile.TemporaryDirectory() as data_dir:
+            memory = AgentMemory(data_dir)
+            if history:
+                memory.remember_generation(make_articles(history, seed=5, prefix='h'), [])
+            engine = DecisionEngine(memory)
+            legacy_seconds, legacy_selected = timed(legacy_select, engine, candidates)
+            batch_seconds, batch_selected = timed(engine.select_best_articles, candidates)
+            assert legacy_selected == batch_selected
+        for label, seconds in (('anterior (sort + razones)', legacy_seconds),
+                               ('lote + top-k', batch_seconds)):
+            print(f"{history:<10} | {label:<24} | {seconds:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark de extracción de tópicos: implementación anterior (regex de
+hashtags + una búsqueda de substring por palabra clave) contra el matcher
+compilado de topics.py, con el vocabulario por defecto y con uno de cientos
+de términos.
+
+Uso (desde backend/):  python benchmarks/bench_topics.py [--posts 10000] [--terms 500]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from topics import DEFAULT_VOCABULARY, TopicExtractor
+
+WORDS = ('el nuevo modelo mejora el razonamiento de los agentes y la media dijo que '
+         'the team said models gain multimodal vision with transformers and llm tooling').split()
+
+
+def make_posts(count: int, seed: int = 7) -> list:
+    """Posts sintéticos de ~120 palabras con algunos hashtags"""
+    rng = random.Random(seed)
+    posts = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(120)]
+        words += ['#AI', '#GenAI', '#LLMs'][:rng.randint(1, 3)]
+        posts.append(' '.join(words))
+    return posts
+
+
+def legacy_extractor(keywords: list):
+    """Implementación anterior generalizada a `keywords`"""
+    def extract(text: str) -> list:
+        topics = re.findall(r'#(\w+)', text.lower())
+        text_lower = text.lower()
+        for keyword in keywords:
+            if keyword in text_lower:
+                topics.append(keyword)
+        return list(set(topics))
+    return extract
+
+
+def throughput(fn, posts: list) -> float:
+    start = time.perf_counter()
+    fn(posts)
+    return len(posts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts', type=int, default=10000)
+    parser.add_argument('--terms', type=int, default=500)
+    args = parser.parse_args()
+
+    posts = make_posts(args.posts)
+    large_vocabulary = dict(DEFAULT_VOCABULARY)
+    large_vocabulary.update({f'topic{i}': [f'term{i}', f'frase de prueba {i}'] for i in range(args.terms)})
+
+    print(f"{args.posts} posts")
+    print(f"{'vocabulario':<14} | {'método':<22} | {'posts/s':>10}")
+    print('-' * 54)
+    for name, vocabulary in (('por defecto', DEFAULT_VOCABULARY), (f'{args.terms}+ términos', large_vocabulary)):
+        keywords = [alias for aliases in vocabulary.values() for alias in aliases]
+        legacy = legacy_extractor(keywords)
+        compiled = TopicExtractor(vocabulary)
+        rows = [
+            ('anterior (substring)', throughput(lambda p: [legacy(t) for t in p], posts)),
+            ('compilado, por post', throughput(lambda p: [compiled.extract(t) for t in p], posts)),
+            ('compilado, extract_many', throughput(compiled.extract_many, posts)),
+        ]
+        for label, rate in rows:
+            print(f"{name:<14} | {label:<22} | {rate:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main()
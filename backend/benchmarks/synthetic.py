@@ -0,0 +1,157 @@
+"""
+Generadores de datos sintéticos para los benchmarks de escala: un posts.db y
+un agent_memory.json con N posts / N entradas de historial, deterministas
+(misma semilla -> mismos datos) y sin red.
+
+Las fechas se anclan a la medianoche del día de generación y el ancla queda
+en el manifiesto: la retención de AgentMemory (90 días de historial, 30 de
+stats diarias, 52 semanas) se mide contra el reloj real, así que un data set
+de otro día cargaría recortado. Los data sets se guardan en
+benchmarks/.data/<tamaño>/ y se reutilizan mientras el manifiesto coincida
+(mismo formato y mismo día); generar el de 1M lleva alrededor de una hora
+(sobre todo por las firmas de casi duplicados).
+"""
+import json
+import os
+import random
+import shutil
+import sys
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import dedup
+from agent_brain import MEMORY_FORMAT_VERSION, _week_key
+from file_utils import write_json_atomic
+from post_store import PostStore
+from topics import DEFAULT_VOCABULARY
+
+DATASET_VERSION = 2
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.data'
+SOURCES = ['OpenAI Blog', 'Google AI Blog', 'Anthropic News', 'Hugging Face', 'Fuente Personalizada']
+POSTS_PER_APPEND = 500  # posts por transacción al poblar el store
+# Ventana de fechas: dentro de la retención por defecto de la memoria (90 días)
+SPAN_DAYS = 80
+
+
+def _vocabulary(rng: random.Random) -> List[str]:
+    """Palabras inventadas más los alias de tópicos, para que haya tópicos que contar"""
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10)))
+             for _ in range(5000)]
+    aliases = [alias for aliases in DEFAULT_VOCABULARY.values() for alias in aliases]
+    return words + aliases * 20
+
+
+def anchor(day: date = None) -> datetime:
+    """Momento de referencia de un data set: medianoche de `day` (hoy por defecto)"""
+    return datetime.combine(day or date.today(), time())
+
+
+def _moment(i: int, count: int, now: datetime) -> datetime:
+    """i-ésimo de `count` momentos repartidos en los últimos SPAN_DAYS días (del más viejo al más nuevo)"""
+    return now - timedelta(days=SPAN_DAYS) + timedelta(days=SPAN_DAYS) * i / max(count, 1)
+
+
+def iter_articles(count: int, seed: int, prefix: str) -> Iterator[Dict]:
+    """Artículos con el formato del scraper"""
+    rng = random.Random(seed)
+    words = _vocabulary(rng)
+    for i in range(count):
+        yield {
+            'title': ' '.join(rng.choice(words) for _ in range(rng.randint(4, 12))),
+            'url': f'https://{prefix}.example.com/articulo/{i}',
+            'description': ' '.join(rng.choice(words) for _ in range(rng.randint(10, 40))),
+            'source': rng.choice(SOURCES),
+            'scraped_at': '2026-01-03T12:00:00'
+        }
+
+
+def iter_posts(count: int, seed: int = 11, now: datetime = None) -> Iterator[Dict]:
+    """Posts con el formato del generador, del más viejo al más nuevo"""
+    rng = random.Random(seed + 1)
+    words = _vocabulary(rng)
+    now = now or anchor()
+    for i, article in enumerate(iter_articles(count, seed, 'posts')):
+        moment = _moment(i, count, now)
+        body = ' '.join(rng.choice(words) for _ in range(rng.randint(60, 120)))
+        yield {
+            'id': f"post_{moment:%Y%m%d_%H%M%S}_{i}",
+            'article': article,
+            'post_text': f"{body}\n\n#AI #{rng.choice(SOURCES).split()[0]}",
+            'generated_at': moment.isoformat()
+        }
+
+
+def make_memory(count: int, seed: int = 13, now: datetime = None) -> Dict:
+    """agent_memory.json con `count` entradas de historial (con firmas) y sus contadores"""
+    now = now or anchor()
+    rng = random.Random(seed)
+    topics = list(DEFAULT_VOCABULARY)
+    memory = {
+        'topics_covered': {}, 'sources_used': {}, 'successful_patterns': [],
+        'last_generation': now.isoformat(), 'total_generations': 0, 'article_history': [],
+        'daily_stats': {}, 'weekly_stats': {},
+        'format_version': MEMORY_FORMAT_VERSION, 'signature_scheme': dedup.SIGNATURE_SCHEME,
+        'version': 1
+    }
+    for i, article in enumerate(iter_articles(count, seed, 'history')):
+        moment = _moment(i, count, now)
+        memory['article_history'].append({
+            'url': article['url'],
+            'title': article['title'],
+            'source': article['source'],
+            'processed_at': moment.isoformat(),
+            'signature': dedup.signature.__wrapped__(dedup.article_text(article))
+        })
+        topic = rng.choice(topics)
+        memory['sources_used'][article['source']] = memory['sources_used'].get(article['source'], 0) + 1
+        memory['topics_covered'][topic] = memory['topics_covered'].get(topic, 0) + 1
+        # Una generación cada 3 artículos (los que elige select_best_articles)
+        new_generation = i % 3 == 0
+        memory['total_generations'] += new_generation
+        for buckets, key in ((memory['daily_stats'], moment.strftime('%Y-%m-%d')),
+                             (memory['weekly_stats'], _week_key(moment))):
+            bucket = buckets.setdefault(key, {'generations': 0, 'sources': {}, 'topics': {}})
+            bucket['generations'] += new_generation
+            bucket['sources'][article['source']] = bucket['sources'].get(article['source'], 0) + 1
+            bucket['topics'][topic] = bucket['topics'].get(topic, 0) + 1
+    return memory
+
+
+def _manifest(count: int, now: datetime) -> Dict:
+    return {'dataset_version': DATASET_VERSION, 'count': count, 'anchor': now.isoformat(),
+            'signature_scheme': dedup.SIGNATURE_SCHEME, 'memory_format': MEMORY_FORMAT_VERSION}
+
+
+def ensure_dataset(count: int, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    """
+    Directorio de datos (posts.db + agent_memory.json) con `count` posts y
+    entradas de historial; lo genera si falta, si cambió el formato o si se
+    generó otro día.
+    """
+    now = anchor()
+    directory = Path(cache_dir) / str(count)
+    manifest_file = directory / 'dataset.json'
+    if manifest_file.exists() and json.loads(manifest_file.read_text()) == _manifest(count, now):
+        return directory
+
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    print(f"🧪 Generando data set sintético de {count:,} posts / entradas de historial...")
+
+    store = PostStore(directory)
+    chunk = []
+    for post in iter_posts(count, now=now):
+        chunk.append(post)
+        if len(chunk) == POSTS_PER_APPEND:
+            # append_posts recibe los posts de más nuevo a más viejo
+            store.append_posts(chunk[::-1])
+            chunk = []
+    store.append_posts(chunk[::-1])
+    store.close()
+
+    write_json_atomic(directory / 'agent_memory.json', make_memory(count, now=now))
+    manifest_file.write_text(json.dumps(_manifest(count, now)))
+    return directory
@@ -0,0 +1,160 @@
+"""
+Detección de artículos casi duplicados (MinHash + LSH sobre shingles de
+título y descripción).
+
+Cada artículo se resume en una firma MinHash de NUM_PERM valores; la
+similitud de Jaccard entre dos artículos se estima comparando firmas. Para
+no comparar contra todo el historial, las firmas se indexan por bandas
+(LSH): solo se verifican los artículos que comparten al menos una banda.
+"""
+import hashlib
+import re
+import struct
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+# Jaccard estimado a partir del cual dos artículos se consideran el mismo
+DEFAULT_THRESHOLD = 0.7
+# Identifica cómo se calculan las firmas: las guardadas con otro esquema no son comparables
+SIGNATURE_SCHEME = f'blake2b16:{NUM_PERM}:{SHINGLE_SIZE}'
+
+# Cada shingle se hashea a NUM_PERM valores de 16 bits (digests de 64 bytes
+# de blake2b con distinta personalización); la firma es el mínimo por columna
+_VALUES = struct.Struct(f'>{NUM_PERM}H')
+_DIGESTS = [bytes([k]) for k in range(_VALUES.size // 64)]
+# Para el mínimo por columna los valores van en carriles de 32 bits de un
+# solo entero (SWAR): el bit 16 de cada carril es de guarda para comparar
+_LANES = struct.Struct(f'>{NUM_PERM}I')
+_GUARD = int.from_bytes(_LANES.pack(*[1 << 16] * NUM_PERM), 'big')
+
+
+def article_text(article: Dict) -> str:
+    """Texto que identifica a un artículo: título + descripción"""
+    return f"{article.get('title', '')} {article.get('description', '')}"
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Shingles de caracteres del texto normalizado (minúsculas, sin puntuación)"""
+    normalized = ' '.join(re.findall(r'\w+', text.lower()))
+    if len(normalized) <= size:
+        return {normalized}
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def _shingle_lanes(shingle: str) -> int:
+    """Los NUM_PERM valores de un shingle, uno por carril"""
+    data = shingle.encode('utf-8')
+    digest = b''.join([hashlib.blake2b(data, digest_size=64, person=person).digest()
+                       for person in _DIGESTS])
+    return int.from_bytes(_LANES.pack(*_VALUES.unpack(digest)), 'big')
+
+
+def _min_signature(rows: Iterable[int]) -> str:
+    """Mínimo por carril de los shingles de un texto, como firma hexadecimal"""
+    rows = iter(rows)
+    current = next(rows)
+    for row in rows:
+        # Guarda encendida en los carriles donde current >= row: ahí gana row
+        wins = (((current | _GUARD) - row) & _GUARD) >> 16
+        current ^= (current ^ row) & (wins * 0xFFFF)
+    return _VALUES.pack(*_LANES.unpack(current.to_bytes(_LANES.size, 'big'))).hex()
+
+
+@lru_cache(maxsize=4096)
+def signature(text: str) -> str:
+    """Firma MinHash del texto como string hexadecimal (4 caracteres por permutación)"""
+    return _min_signature(map(_shingle_lanes, shingles(text)))
+
+
+def signatures(texts: Iterable[str]) -> List[str]:
+    """
+    Firmas de muchos textos (mismo orden, mismos valores que signature). Los
+    shingles se repiten mucho entre textos: cada shingle distinto del lote
+    se hashea una sola vez.
+    """
+    lanes: Dict[str, int] = {}
+
+    def shingle_lanes(shingle: str) -> int:
+        row = lanes.get(shingle)
+        if row is None:
+            row = lanes[shingle] = _shingle_lanes(shingle)
+        return row
+
+    return [_min_signature(map(shingle_lanes, shingles(text))) for text in texts]
+
+
+def similarity(sig_a: str, sig_b: str) -> float:
+    """Jaccard estimado: fracción de permutaciones con el mismo mínimo"""
+    equal = sum(sig_a[i:i + 4] == sig_b[i:i + 4] for i in range(0, len(sig_a), 4))
+    return equal / NUM_PERM
+
+
+def _bands(sig: str) -> Iterable[Tuple[int, str]]:
+    width = ROWS * 4
+    for band in range(BANDS):
+        yield band, sig[band * width:(band + 1) * width]
+
+
+class NearDuplicateIndex:
+    """Índice LSH de firmas: búsqueda de casi duplicados sin recorrer todas las entradas"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._signatures: Dict[str, str] = {}
+        self._buckets: Dict[Tuple[int, str], Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, key: str, sig: str):
+        """Indexa una firma bajo `key` (p.ej. la URL del artículo)"""
+        self._signatures[key] = sig
+        for band in _bands(sig):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def find(self, sig: str) -> List[Tuple[str, float]]:
+        """(clave, similitud) de las entradas por encima del umbral, más parecidas primero"""
+        candidates = set()
+        for band in _bands(sig):
+            candidates |= self._buckets.get(band, set())
+        matches = [(key, similarity(sig, self._signatures[key])) for key in candidates]
+        return sorted((m for m in matches if m[1] >= self.threshold), key=lambda m: -m[1])
+
+    def best_match(self, sig: str) -> Optional[str]:
+        """Clave de la entrada más parecida, o None si ninguna supera el umbral"""
+        matches = self.find(sig)
+        return matches[0][0] if matches else None
+
+
+def cluster_articles(articles: List[Dict], threshold: float = DEFAULT_THRESHOLD,
+                     article_signatures: List[str] = None) -> List[List[int]]:
+    """
+    Agrupa los artículos casi duplicados entre sí. Devuelve listas de
+    índices (en el orden original); los artículos únicos forman su propio grupo.
+    `article_signatures` (mismo orden que `articles`) evita recalcular las
+    firmas si quien llama ya las tiene o las va a reutilizar.
+    """
+    if article_signatures is None:
+        article_signatures = signatures(article_text(article) for article in articles)
+    index = NearDuplicateIndex(threshold)
+    parent = list(range(len(articles)))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, sig in enumerate(article_signatures):
+        for key, _ in index.find(sig):
+            parent[root(int(key))] = root(i)
+        index.add(str(i), sig)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(articles)):
+        clusters.setdefault(root(i), []).append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
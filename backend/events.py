@@ -0,0 +1,96 @@
+"""
+Bus de eventos en memoria para empujar el progreso de la generación al frontend
+(Server-Sent Events, con long-poll como alternativa)
+"""
+import json
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List
+
+
+def format_sse(event: Dict) -> str:
+    """Serializa un evento en el formato de Server-Sent Events"""
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+class EventBus:
+    """
+    Publica eventos estructurados a todos los suscriptores.
+    Guarda los últimos `history` eventos para que un cliente que se conecta
+    tarde (o reconecta con Last-Event-ID) reciba lo que se perdió.
+    """
+
+    def __init__(self, history: int = 500, subscriber_queue_size: int = 1000):
+        self._history = deque(maxlen=history)
+        self._subscribers: List[queue.Queue] = []
+        self._subscriber_queue_size = subscriber_queue_size
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, event_type: str, **data) -> Dict:
+        """Publica un evento y lo entrega a todos los suscriptores"""
+        with self._condition:
+            self._last_id += 1
+            event = {'id': self._last_id, 'type': event_type, 'ts': time.time(), **data}
+            self._history.append(event)
+            for subscriber in self._subscribers:
+                try:
+                    subscriber.put_nowait(event)
+                except queue.Full:
+                    pass  # Un cliente lento pierde eventos en lugar de bloquear al productor
+            self._condition.notify_all()
+        return event
+
+    def events_after(self, after_id: int) -> List[Dict]:
+        """Eventos del historial con id > after_id"""
+        with self._lock:
+            return [e for e in self._history if e['id'] > after_id]
+
+    def subscribe(self, after_id: int = None) -> queue.Queue:
+        """Nueva suscripción; si se da after_id, primero recibe los eventos pendientes"""
+        subscriber = queue.Queue(maxsize=self._subscriber_queue_size)
+        with self._lock:
+            if after_id is not None:
+                for event in self._history:
+                    if event['id'] > after_id:
+                        subscriber.put_nowait(event)
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def stream(self, after_id: int = None, heartbeat: float = 15.0) -> Iterator[str]:
+        """Generador de texto SSE (con comentarios keep-alive cada `heartbeat` s)"""
+        subscriber = self.subscribe(after_id)
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    event = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield format_sse(event)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def wait_for_events(self, after_id: int, timeout: float = 25.0) -> List[Dict]:
+        """Long-poll: espera hasta que haya eventos nuevos o se agote el timeout"""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._last_id <= after_id:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+            return [e for e in self._history if e['id'] > after_id]
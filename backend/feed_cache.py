@@ -0,0 +1,142 @@
+"""
+Caché HTTP persistente con GET condicional (ETag / Last-Modified) para las fuentes
+"""
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import requests
+import http_client
+from file_utils import read_json, write_json_atomic
+
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / "data" / "http_cache.json"
+
+
+class FeedCache:
+    """
+    Guarda por URL los validadores HTTP y la lista de artículos ya parseada.
+    Si el servidor responde 304 se devuelven los artículos guardados sin
+    descargar el body ni volver a parsearlo.
+    """
+
+    def __init__(self, cache_file: Path = None):
+        self.cache_file = Path(cache_file or DEFAULT_CACHE_FILE)
+        self._lock = threading.Lock()
+        data = read_json(self.cache_file, default={}) or {}
+        self.entries: Dict[str, Dict] = data.get('entries', {})
+        self.counters: Dict[str, float] = {
+            'hits': 0,
+            'misses': 0,
+            'bytes_saved': 0,
+            'parse_seconds_saved': 0.0,
+        }
+        self.counters.update(data.get('stats', {}))
+
+    def _conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Headers If-None-Match / If-Modified-Since para una entrada"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def fetch(self, url: str, parse: Callable[[requests.Response], List[Dict]],
+              headers: Dict = None, timeout: float = 15) -> Optional[List[Dict]]:
+        """
+        Descarga y parsea una URL usando la caché.
+        Devuelve la lista de artículos (de la caché si hubo 304) o None si la
+        respuesta no fue 200/304. Lanza HTTPError para códigos >= 400.
+        """
+        with self._lock:
+            entry = self.entries.get(url)
+
+        request_headers = dict(headers or {})
+        request_headers.update(self._conditional_headers(entry))
+        response = http_client.get(url, headers=request_headers, timeout=timeout, stream=True)
+
+        try:
+            if response.status_code == 304 and entry is not None:
+                now = datetime.now().isoformat()
+                with self._lock:
+                    self.counters['hits'] += 1
+                    self.counters['bytes_saved'] += entry.get('size', 0)
+                    self.counters['parse_seconds_saved'] += entry.get('parse_seconds', 0.0)
+                    entry['checked_at'] = now
+                    self._save()
+                return [dict(article, scraped_at=now) for article in entry['articles']]
+
+            response.raise_for_status()
+            if response.status_code != 200:
+                return None
+
+            body_read = self._count_body(response)
+            start = time.perf_counter()
+            articles = parse(response)
+            parse_seconds = time.perf_counter() - start
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            with self._lock:
+                self.counters['misses'] += 1
+                if etag or last_modified:
+                    self.entries[url] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'articles': articles,
+                        'size': body_read[0],
+                        'parse_seconds': round(parse_seconds, 6),
+                        'checked_at': datetime.now().isoformat()
+                    }
+                else:
+                    self.entries.pop(url, None)
+                self._save()
+            return articles
+        finally:
+            response.close()
+
+    @staticmethod
+    def _count_body(response: requests.Response) -> List[int]:
+        """
+        Cuenta los bytes del body que lee el parser (también vía
+        response.content, que usa iter_content): es el tamaño para las
+        métricas de bytes ahorrados. Si el parser cortó antes del final, el
+        resto del body no se descarga ni se cuenta.
+        """
+        read = [0]
+        iter_content = response.iter_content
+
+        def counting(*args, **kwargs):
+            for chunk in iter_content(*args, **kwargs):
+                read[0] += len(chunk)
+                yield chunk
+
+        response.iter_content = counting
+        return read
+
+    def stats(self) -> Dict:
+        """Contadores de hits/misses y recursos ahorrados"""
+        with self._lock:
+            total = self.counters['hits'] + self.counters['misses']
+            return {
+                **self.counters,
+                'hit_rate': self.counters['hits'] / total if total else 0.0,
+                'cached_urls': len(self.entries)
+            }
+
+    def clear(self):
+        """Vacía la caché y los contadores"""
+        with self._lock:
+            self.entries = {}
+            for key in self.counters:
+                self.counters[key] = 0
+            self._save()
+
+    def _save(self):
+        """Persiste la caché (llamar con el lock tomado)"""
+        try:
+            write_json_atomic(self.cache_file, {'entries': self.entries, 'stats': self.counters})
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar la caché HTTP: {e}")
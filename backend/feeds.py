@@ -0,0 +1,88 @@
+"""
+Lector incremental de feeds RSS 2.0 / RSS 1.0 / Atom.
+
+El XML se parsea a medida que llegan los chunks (XMLPullParser, la variante
+push de iterparse) y la lectura se corta al completar `limit` items, así que
+tiempo y memoria dependen de cuántos items se piden y no del tamaño del feed.
+"""
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+import html_parsing
+
+ITEM_TAGS = ('item', 'entry')  # RSS / Atom
+DESCRIPTION_MAX_LENGTH = 300
+
+
+def _local_name(tag: str) -> str:
+    """Nombre sin namespace: '{http://www.w3.org/2005/Atom}entry' -> 'entry'"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _atom_link(element: ET.Element) -> Optional[str]:
+    """href del <link> alternativo de una entrada Atom"""
+    if element.get('rel', 'alternate') == 'alternate' and element.get('href'):
+        return element.get('href')
+    return None
+
+
+def _parse_item(element: ET.Element) -> Dict[str, str]:
+    """Título, URL y descripción (texto plano) de un <item> o <entry>"""
+    fields = {}
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'link':
+            # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+            link = (child.text or '').strip() or _atom_link(child)
+            if link and 'link' not in fields:
+                fields['link'] = link
+        elif name in ('title', 'description', 'summary', 'content', 'encoded') and name not in fields:
+            fields[name] = (child.text or '').strip()
+
+    description = next((fields[k] for k in ('description', 'summary', 'content', 'encoded')
+                        if fields.get(k)), '')
+    return {
+        'title': fields.get('title', ''),
+        'url': fields.get('link', ''),
+        'description': html_parsing.strip_tags(description, max_length=DESCRIPTION_MAX_LENGTH)
+    }
+
+
+def iter_feed(chunks: Iterable[bytes], limit: int = None) -> Iterator[Dict[str, str]]:
+    """
+    Items del feed a medida que se parsean, como dicts {'title', 'url', 'description'}.
+    Deja de consumir `chunks` al llegar a `limit`. Lanza ET.ParseError si el XML es inválido.
+    """
+    if limit is not None and limit <= 0:
+        return
+    parser = ET.XMLPullParser(events=('end',))
+    produced = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if _local_name(element.tag) not in ITEM_TAGS:
+                continue
+            item = _parse_item(element)
+            element.clear()  # el item ya se procesó: liberar su subárbol
+            yield item
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+    parser.close()
+
+
+def read_feed(chunks: Iterable[bytes], source: str, limit: int = None) -> List[Dict]:
+    """
+    Artículos normalizados (formato del scraper) de los primeros `limit` items
+    con título y URL.
+    """
+    articles = []
+    for item in iter_feed(chunks):
+        if not (item['title'] and item['url']):
+            continue
+        articles.append({**item, 'source': source, 'scraped_at': datetime.now().isoformat()})
+        if limit is not None and len(articles) >= limit:
+            break
+    return articles
@@ -0,0 +1,43 @@
+"""
+Utilidades de archivos compartidas por los módulos de persistencia
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """Lee un archivo JSON; devuelve default si no existe o está corrupto"""
+    path = Path(path)
+    if not path.exists():
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"⚠️  No se pudo leer {path}: {e}")
+        return default
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = None):
+    """
+    Escribe JSON de forma atómica: primero a un archivo temporal en el mismo
+    directorio y luego os.replace, así un lector nunca ve un archivo a medias.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    separators = None if indent else (',', ':')
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False, separators=separators)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,121 @@
+"""
+Caché persistente de respuestas del LLM, direccionada por contenido
+(hash de modelo + prompt + parámetros adaptativos), con TTL y desalojo LRU.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / "data" / "generation_cache.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_generations_last_access ON generations(last_access);
+"""
+
+
+def cache_key(model: str, prompt: str, adaptive_params: Dict = None) -> str:
+    """SHA-256 del modelo, el prompt renderizado y los parámetros"""
+    payload = json.dumps(
+        {'model': model, 'prompt': prompt, 'params': adaptive_params or {}},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class GenerationCache:
+    """Caché de generaciones en SQLite con expiración por TTL y límite de entradas (LRU)"""
+
+    def __init__(self, cache_file: Path = None,
+                 ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 1000):
+        self.cache_file = Path(cache_file or DEFAULT_CACHE_FILE)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0}
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión propia de cada hilo"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.cache_file, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def get(self, key: str) -> Optional[str]:
+        """Respuesta guardada para `key`, o None si no existe o expiró"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT response, created_at FROM generations WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+
+        if row is None:
+            self._count('misses')
+            return None
+        if self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+            conn.execute("DELETE FROM generations WHERE key = ?", (key,))
+            self._count('expired')
+            self._count('misses')
+            return None
+
+        conn.execute("UPDATE generations SET last_access = ? WHERE key = ?", (now, key))
+        self._count('hits')
+        return row[0]
+
+    def put(self, key: str, response: str):
+        """Guarda una respuesta y desaloja las menos usadas si se supera max_entries"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO generations (key, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+            excess = conn.execute("SELECT COUNT(*) FROM generations").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM generations WHERE key IN "
+                    "(SELECT key FROM generations ORDER BY last_access ASC LIMIT ?)",
+                    (excess,)
+                )
+                self._count('evictions', excess)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def stats(self) -> Dict:
+        """Hits, misses, desalojos y tasa de aciertos"""
+        entries = self._connect().execute("SELECT COUNT(*) FROM generations").fetchone()[0]
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters['hits'] + counters['misses']
+        return {
+            **counters,
+            'entries': entries,
+            'hit_rate': counters['hits'] / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Elimina todas las entradas"""
+        self._connect().execute("DELETE FROM generations")
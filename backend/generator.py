@@ -2,26 +2,88 @@
 Generador de posts de LinkedIn usando Google Gemini
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
-from typing import Dict, List
+from typing import Callable, Dict, List
 from dotenv import load_dotenv
+from rate_limit import RateLimiter, backoff_delay
+from generation_cache import GenerationCache, cache_key
+import replay
 
 load_dotenv()
 
+MODEL_NAME = 'gemini-2.5-flash'
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
 
 class LinkedInPostGenerator:
     """Genera posts de LinkedIn a partir de artículos de AI"""
 
-    def __init__(self):
+    def __init__(self, client=None, max_in_flight: int = None,
+                 requests_per_minute: float = None, tokens_per_minute: float = None,
+                 max_retries: int = 3, cache: GenerationCache = None, use_cache: bool = None):
+        if client is None:
+            # Con REPLAY_MODE=replay las respuestas salen del cassette y no hace falta API key
+            client = replay.genai_client(self._live_client)
+
+        self.client = client
+
+        # Concurrencia y límites de tasa (configurables por .env)
+        self.max_in_flight = max_in_flight or int(os.getenv('GEMINI_MAX_IN_FLIGHT', '4'))
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=requests_per_minute or float(os.getenv('GEMINI_RPM', '10')),
+            tokens_per_minute=tokens_per_minute or float(os.getenv('GEMINI_TPM', '250000'))
+        )
+        self.max_retries = max_retries
+
+        # Caché de respuestas: prompts idénticos no vuelven a llamar a la API
+        if use_cache is None:
+            use_cache = os.getenv('GENERATION_CACHE', '1') != '0'
+        self.use_cache = use_cache
+        self.cache = cache if cache is not None else (GenerationCache() if use_cache else None)
+
+    @staticmethod
+    def _live_client():
+        """Cliente real de Gemini"""
         api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
             raise ValueError("GEMINI_API_KEY no está configurada en el archivo .env")
-
-        self.client = genai.Client(api_key=api_key)
-
-    def generate_post(self, article: Dict, adaptive_params: Dict = None) -> Dict:
-        """Genera un post de LinkedIn basado en un artículo"""
+        return genai.Client(api_key=api_key)
+
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """Estimación gruesa de tokens (prompt + respuesta) para el límite por minuto"""
+        return len(prompt) // 4 + 500
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """429 y 5xx se reintentan; el resto de errores no"""
+        status = getattr(error, 'code', None) or getattr(error, 'status_code', None)
+        return status in RETRYABLE_STATUS
+
+    def _generate_content(self, prompt: str) -> str:
+        """Llama al modelo respetando el rate limiter y reintentando con backoff"""
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(self._estimate_tokens(prompt))
+            try:
+                response = self.client.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=prompt
+                )
+                return response.text.strip()
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"   ↻ Reintentando en {delay:.1f}s ({e})")
+                time.sleep(delay)
+                attempt += 1
+
+    def build_prompt(self, article: Dict, adaptive_params: Dict = None) -> str:
+        """Construye el prompt para un artículo"""
 
         # Parámetros por defecto
         params = {
@@ -56,13 +118,24 @@ Requisitos del post:
 
 Genera SOLO el texto del post, sin introducción ni comentarios adicionales."""
 
+        return prompt
+
+    def generate_post(self, article: Dict, adaptive_params: Dict = None,
+                      use_cache: bool = None) -> Dict:
+        """
+        Genera un post de LinkedIn basado en un artículo.
+        use_cache=False fuerza una variante nueva (sin leer la caché).
+        """
+        use_cache = self.use_cache if use_cache is None else use_cache
         try:
-            response = self.client.models.generate_content(
-                model='gemini-2.5-flash',
-                contents=prompt
-            )
+            prompt = self.build_prompt(article, adaptive_params)
+            key = cache_key(MODEL_NAME, prompt, adaptive_params)
 
-            post_text = response.text.strip()
+            post_text = self.cache.get(key) if use_cache and self.cache else None
+            if post_text is None:
+                post_text = self._generate_content(prompt)
+                if self.cache:
+                    self.cache.put(key, post_text)
 
             # Agregar el link al final
             full_post = f"{post_text}\n\nLeer más: {article['url']}"
@@ -77,17 +150,41 @@ Genera SOLO el texto del post, sin introducción ni comentarios adicionales."""
             print(f"Error generando post para '{article['title']}': {e}")
             return None
 
-    def generate_posts_from_articles(self, articles: List[Dict], adaptive_params: Dict = None) -> List[Dict]:
-        """Genera posts para todos los artículos"""
-        posts = []
-
-        for i, article in enumerate(articles, 1):
+    def generate_posts_from_articles(self, articles: List[Dict], adaptive_params: Dict = None,
+                                     max_in_flight: int = None, use_cache: bool = None,
+                                     on_event: Callable = None) -> List[Dict]:
+        """
+        Genera posts para todos los artículos.
+        Con max_in_flight > 1 las llamadas se hacen en paralelo (limitadas por el
+        rate limiter); el orden de salida es siempre el de `articles`.
+        on_event(tipo, **datos) recibe un 'post_generated' por artículo.
+        """
+        max_in_flight = max_in_flight or self.max_in_flight
+
+        def generate(indexed):
+            i, article = indexed
             print(f"Generando post {i}/{len(articles)}: {article['title'][:50]}...")
-            post = self.generate_post(article, adaptive_params)
-            if post:
-                posts.append(post)
+            post = self.generate_post(article, adaptive_params, use_cache=use_cache)
+            if on_event:
+                on_event('post_generated', index=i, total=len(articles),
+                         title=article['title'], success=post is not None)
+            return post
+
+        indexed_articles = list(enumerate(articles, 1))
+        if max_in_flight > 1 and len(articles) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_in_flight, len(articles)),
+                                    thread_name_prefix='generator') as executor:
+                results = list(executor.map(generate, indexed_articles))
+        else:
+            results = [generate(item) for item in indexed_articles]
+
+        posts = [post for post in results if post]
 
         print(f"\nGenerados {len(posts)} posts exitosamente")
+        if self.cache:
+            stats = self.cache.stats()
+            print(f"Caché de generaciones: {stats['hits']} hits / {stats['misses']} misses "
+                  f"({stats['hit_rate']:.0%})")
         return posts
 
 
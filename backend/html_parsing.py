@@ -0,0 +1,103 @@
+"""
+Parsing de HTML para el scraper, con backend intercambiable.
+
+Usa selectolax o lxml si están instalados y si no cae a html.parser de la
+biblioteca estándar (vía BeautifulSoup). En todos los casos se parsea solo lo
+que el scraper necesita: los <a> o los <article> de la página, y las
+descripciones del RSS se limpian sin construir un árbol.
+La variable HTML_PARSER ('selectolax', 'lxml' o 'html.parser') fuerza un backend.
+"""
+import html
+import os
+import re
+from typing import Dict, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:  # dependencia opcional
+    _SelectolaxParser = None
+
+try:
+    import lxml  # noqa: F401  (solo se usa como parser de BeautifulSoup)
+    _HAS_LXML = True
+except ImportError:  # dependencia opcional
+    _HAS_LXML = False
+
+_TAG_RE = re.compile(r'<[^>]*>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _detect_backend() -> str:
+    """
+    Backend pedido en HTML_PARSER o el más rápido instalado. Un backend
+    pedido que no está disponible no impide importar el scraper: se avisa y
+    se usa la detección automática.
+    """
+    requested = os.getenv('HTML_PARSER')
+    available = {
+        'selectolax': _SelectolaxParser is not None,
+        'lxml': _HAS_LXML,
+        'html.parser': True
+    }
+    detected = next(name for name, ok in available.items() if ok)
+    if requested and not available.get(requested):
+        print(f"⚠️  HTML_PARSER={requested} no está disponible; se usa {detected}")
+        return detected
+    return requested or detected
+
+
+BACKEND = _detect_backend()
+
+
+def strip_tags(fragment: str, max_length: int = None) -> str:
+    """Texto plano de un fragmento HTML (sin etiquetas, entidades resueltas, espacios colapsados)"""
+    text = _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', fragment))).strip()
+    return text[:max_length] if max_length is not None else text
+
+
+def _soup(content, only: SoupStrainer) -> BeautifulSoup:
+    """Árbol de BeautifulSoup con solo los elementos que acepta `only`"""
+    parser = 'lxml' if BACKEND == 'lxml' else 'html.parser'
+    return BeautifulSoup(content, parser, parse_only=only)
+
+
+def find_links(content, limit: int = None) -> List[Tuple[str, str]]:
+    """(href, texto) de los primeros `limit` enlaces con href, en orden de documento"""
+    if BACKEND == 'selectolax':
+        nodes = _SelectolaxParser(content).css('a[href]')[:limit]
+        return [(node.attributes.get('href') or '', node.text(strip=True)) for node in nodes]
+
+    anchors = _soup(content, SoupStrainer('a', href=True)).find_all('a', href=True, limit=limit)
+    return [(a.get('href', ''), a.get_text(strip=True)) for a in anchors]
+
+
+def find_articles(content, limit: int = None) -> List[Dict[str, str]]:
+    """
+    Primeros `limit` elementos <article>, cada uno como
+    {'title': primer h2/h3, 'href': primer enlace, 'description': primer <p>}
+    (None si falta el título; '' si faltan los otros).
+    """
+    results = []
+    if BACKEND == 'selectolax':
+        for element in _SelectolaxParser(content).css('article')[:limit]:
+            title = element.css_first('h2, h3')
+            link = element.css_first('a[href]')
+            paragraph = element.css_first('p')
+            results.append({
+                'title': title.text(strip=True) if title else None,
+                'href': (link.attributes.get('href') or '') if link else '',
+                'description': paragraph.text(strip=True) if paragraph else ''
+            })
+        return results
+
+    for element in _soup(content, SoupStrainer('article')).find_all('article', limit=limit):
+        title = element.find(['h2', 'h3'])
+        link = element.find('a', href=True)
+        paragraph = element.find('p')
+        results.append({
+            'title': title.get_text(strip=True) if title else None,
+            'href': link['href'] if link else '',
+            'description': paragraph.get_text(strip=True) if paragraph else ''
+        })
+    return results
@@ -0,0 +1,118 @@
+"""
+Cliente HTTP compartido con connection pooling, keep-alive y reintentos
+"""
+import os
+import threading
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import replay
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # Solo las codificaciones que urllib3 sabe descomprimir (br/zstd si están instalados)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+DEFAULT_TIMEOUT = 15
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Configuración ajustable por variables de entorno
+_config = {
+    'pool_connections': int(os.getenv('HTTP_POOL_CONNECTIONS', '10')),  # hosts distintos en caché
+    'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', '10')),          # conexiones por host
+    'max_retries': int(os.getenv('HTTP_MAX_RETRIES', '2')),
+    'backoff_factor': float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5')),
+}
+
+# Sesiones compartidas del proceso: con reintentos (True) y sin ellos (False)
+_sessions: Dict[bool, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _build_session(retries: bool = True) -> requests.Session:
+    """Crea una sesión con un pool de conexiones por host y política de reintentos"""
+    retry = Retry(
+        total=_config['max_retries'] if retries else 0,
+        backoff_factor=_config['backoff_factor'],
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_config['pool_connections'],
+        pool_maxsize=_config['pool_maxsize'],
+        max_retries=retry
+    )
+    # REPLAY_MODE=record/replay: grabar o servir las respuestas desde un cassette
+    adapter = replay.http_adapter(adapter)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(retries: bool = True) -> requests.Session:
+    """
+    Devuelve la sesión compartida del proceso.
+    La sesión no se modifica después de creada, por lo que puede usarse
+    desde varios hilos: los pools de urllib3 son thread-safe.
+    retries=False da una segunda sesión sin reintentos, para llamadas con un
+    plazo total que un reintento excedería.
+    """
+    session = _sessions.get(retries)
+    if session is None:
+        with _lock:
+            session = _sessions.get(retries)
+            if session is None:
+                session = _sessions[retries] = _build_session(retries)
+    return session
+
+
+def configure(pool_connections: int = None, pool_maxsize: int = None,
+              max_retries: int = None, backoff_factor: float = None):
+    """Ajusta el tamaño de los pools y la política de reintentos (recrea la sesión)"""
+    with _lock:
+        updates = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'max_retries': max_retries,
+            'backoff_factor': backoff_factor,
+        }
+        _config.update({k: v for k, v in updates.items() if v is not None})
+
+        _close_sessions()
+
+
+def get_config() -> dict:
+    """Configuración actual del cliente"""
+    return dict(_config)
+
+
+def get(url: str, timeout: float = DEFAULT_TIMEOUT, retries: bool = True,
+        **kwargs) -> requests.Response:
+    """GET a través de la sesión compartida (retries=False: sin reintentos)"""
+    return get_session(retries).get(url, timeout=timeout, **kwargs)
+
+
+def _close_sessions():
+    """Cierra y descarta las sesiones (llamar con el lock tomado)"""
+    for session in _sessions.values():
+        session.close()
+    _sessions.clear()
+
+
+def close():
+    """Cierra las sesiones compartidas y sus conexiones"""
+    with _lock:
+        _close_sessions()
@@ -0,0 +1,176 @@
+"""
+Sistema de trabajos en background: ids, estado por trabajo, cancelación y
+deduplicación de pedidos repetidos, sobre un pool de workers acotado.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from events import EventBus
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+
+class JobCancelled(Exception):
+    """Se lanza dentro de un trabajo cuando se pidió su cancelación"""
+
+
+class Job:
+    """Un trabajo en background con su estado, progreso y resultado"""
+
+    def __init__(self, kind: str, key: str = None, events: EventBus = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.key = key
+        self.status = QUEUED
+        self.progress = ''
+        self.result = None
+        self.error = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.future: Optional[Future] = None
+        self._cancel_requested = threading.Event()
+        self._events = events
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def check_cancelled(self):
+        """Punto de cancelación cooperativa: llamarlo entre fases del trabajo"""
+        if self.cancel_requested:
+            raise JobCancelled()
+
+    def emit(self, event_type: str, progress: str = None, **data):
+        """Actualiza el progreso y publica un evento etiquetado con el job"""
+        if progress:
+            self.progress = progress
+        if self._events is not None:
+            self._events.publish(event_type, job_id=self.id, kind=self.kind, progress=progress, **data)
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'key': self.key,
+            'status': self.status,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class JobManager:
+    """
+    Ejecuta trabajos en un ThreadPoolExecutor acotado.
+    Un submit con el mismo (kind, key) que un trabajo aún activo devuelve ese
+    trabajo en lugar de encolar otro. Al terminar se publica
+    '<kind>_finished', '<kind>_failed' o '<kind>_cancelled'.
+    """
+
+    def __init__(self, max_workers: int = 2, history: int = 100, events: EventBus = None):
+        self.events = events
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[..., Dict], key: str = None,
+               *args, **kwargs) -> Tuple[Job, bool]:
+        """
+        Encola fn(job, *args, **kwargs). Devuelve (job, creado); creado=False
+        cuando se reutilizó un trabajo activo con la misma clave.
+        """
+        with self._lock:
+            if key is not None:
+                for job in self._jobs.values():
+                    if job.kind == kind and job.key == key and job.is_active:
+                        return job, False
+
+            job = Job(kind, key, self.events)
+            self._jobs[job.id] = job
+            self._trim_history()
+            job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        return job, True
+
+    def _run(self, job: Job, fn: Callable, args: tuple, kwargs: dict):
+        with self._lock:
+            if job.status != QUEUED:
+                return
+            job.status = RUNNING
+            job.started_at = datetime.now().isoformat()
+
+        try:
+            job.check_cancelled()
+            result = fn(job, *args, **kwargs)
+            self._finish(job, SUCCEEDED, result=result)
+        except JobCancelled:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            self._finish(job, FAILED, error=str(e))
+
+    def _finish(self, job: Job, status: str, result: Dict = None, error: str = None):
+        with self._lock:
+            job.status = status
+            job.result = result
+            job.error = error
+            job.finished_at = datetime.now().isoformat()
+
+        suffix = {SUCCEEDED: 'finished', FAILED: 'failed', CANCELLED: 'cancelled'}[status]
+        job.emit(f'{job.kind}_{suffix}', status=status, result=result, error=error)
+
+    def _trim_history(self):
+        """Descarta los trabajos terminados más viejos (llamar con el lock tomado)"""
+        excess = len(self._jobs) - self.history
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if not self._jobs[job_id].is_active:
+                del self._jobs[job_id]
+                excess -= 1
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, kind: str = None) -> List[Job]:
+        """Trabajos conocidos, más nuevos primero"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [j for j in reversed(jobs) if kind is None or j.kind == kind]
+
+    def latest(self, kind: str) -> Optional[Job]:
+        jobs = self.list(kind)
+        return jobs[0] if jobs else None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancela un trabajo: si está en cola no llega a ejecutarse; si está
+        corriendo se marca y se detiene en su próximo check_cancelled().
+        """
+        job = self.get(job_id)
+        if job is None or not job.is_active:
+            return False
+
+        job._cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, CANCELLED)
+        return True
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
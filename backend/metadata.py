@@ -0,0 +1,236 @@
+"""
+Extracción de metadata (título y descripción) de URLs, con caché LRU+TTL
+compartida por /api/fetch-metadata y /api/custom-source.
+"""
+import codecs
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, Optional
+import requests
+from urllib3.exceptions import ReadTimeoutError
+import http_client
+from url_utils import normalize_url
+
+# Solo interesa el <head>: se corta la descarga al cerrarse o al superar este tamaño
+MAX_HEAD_BYTES = int(os.getenv('METADATA_MAX_BYTES', str(256 * 1024)))
+# Tiempo máximo para toda la descarga (no solo por lectura)
+FETCH_TIMEOUT = float(os.getenv('METADATA_TIMEOUT', '10'))
+CHUNK_SIZE = 8192
+
+
+class _HeadMetaParser(HTMLParser):
+    """
+    Parser incremental que recoge <title> y las <meta> de título/descripción
+    sin construir un árbol. `done` se activa al terminar el <head>.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.title_parts = []
+        self.in_title = False
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'meta':
+            attrs = dict(attrs)
+            key = (attrs.get('property') or attrs.get('name') or '').lower()
+            if key in ('og:title', 'og:description', 'description') and key not in self.meta:
+                self.meta[key] = attrs.get('content')
+        elif tag == 'title':
+            self.in_title = True
+        elif tag == 'body':
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self.in_title = False
+        elif tag == 'head':
+            self.done = True
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title_parts.append(data)
+
+    def result(self) -> Dict[str, Optional[str]]:
+        title = self.meta.get('og:title')
+        if title is None and self.title_parts:
+            title = ''.join(self.title_parts).strip()
+        description = self.meta.get('og:description')
+        if description is None:
+            description = self.meta.get('description')
+        return {'title': title, 'description': description}
+
+
+def extract_metadata_stream(chunks: Iterable[bytes], encoding: str = None,
+                            max_bytes: int = MAX_HEAD_BYTES,
+                            deadline: float = None) -> Dict[str, Optional[str]]:
+    """
+    Título (og:title o <title>) y descripción (og:description o meta description)
+    leyendo `chunks` solo hasta el fin del <head> o `max_bytes`.
+    `deadline` (time.monotonic) corta la lectura con TimeoutError.
+    """
+    parser = _HeadMetaParser()
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    read = 0
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError('Tiempo agotado al descargar la metadata')
+        if not chunk:
+            continue
+        chunk = chunk[:max_bytes - read]
+        read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done or read >= max_bytes:
+            break
+    return parser.result()
+
+
+def extract_metadata(html: bytes) -> Dict[str, Optional[str]]:
+    """Metadata de un documento ya descargado"""
+    return extract_metadata_stream([html])
+
+
+def _declared_charset(response) -> Optional[str]:
+    """Charset explícito del Content-Type (requests asume ISO-8859-1 si falta; acá se usa UTF-8)"""
+    content_type = response.headers.get('Content-Type', '')
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset':
+            try:
+                return codecs.lookup(value.strip().strip('"\'')).name
+            except LookupError:
+                return None
+    return None
+
+
+def _read_chunks(response: requests.Response, deadline: float) -> Iterator[bytes]:
+    """
+    Body de una respuesta en streaming sin pasarse de `deadline`. Cada
+    lectura usa como timeout de socket el tiempo que queda y devuelve lo
+    que haya llegado (read1), así un servidor que manda de a pocos bytes no
+    estira una lectura hasta llenar el chunk.
+    """
+    raw = response.raw
+    connection = getattr(raw, 'connection', None)
+    if connection is None or not hasattr(raw, 'read1'):
+        # Respuestas que no vienen de un socket (replay, tests): el plazo se revisa entre chunks
+        yield from response.iter_content(CHUNK_SIZE)
+        return
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError('Tiempo agotado al descargar la metadata')
+        if connection.sock is not None:
+            connection.sock.settimeout(remaining)
+        try:
+            chunk = raw.read1(CHUNK_SIZE, decode_content=True)
+        except (ReadTimeoutError, socket.timeout) as e:
+            raise TimeoutError('Tiempo agotado al descargar la metadata') from e
+        if not chunk:
+            return
+        yield chunk
+
+
+def fetch_metadata(url: str, timeout: float = FETCH_TIMEOUT,
+                   max_bytes: int = MAX_HEAD_BYTES) -> Dict[str, Optional[str]]:
+    """
+    Descarga la página en streaming y extrae su metadata sin leer el <body>.
+    `timeout` limita la descarga completa: sin reintentos, y cada lectura
+    espera como mucho lo que queda del plazo.
+    """
+    deadline = time.monotonic() + timeout
+    response = http_client.get(url, timeout=timeout, stream=True, retries=False)
+    try:
+        response.raise_for_status()
+        return extract_metadata_stream(
+            _read_chunks(response, deadline), encoding=_declared_charset(response),
+            max_bytes=max_bytes, deadline=deadline
+        )
+    finally:
+        response.close()
+
+
+class MetadataService:
+    """
+    Metadata de URLs con caché en memoria.
+    La clave es la URL normalizada, así que variantes triviales (www, utm_*,
+    barra final) comparten entrada. Las entradas vencen a los `ttl_seconds`
+    y se desaloja la menos usada al superar `max_entries`. Pedidos
+    concurrentes de la misma URL esperan a una única descarga; los errores
+    no se cachean.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 256,
+                 fetcher: Callable[[str], Dict] = fetch_metadata):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.fetcher = fetcher
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()  # clave -> (vence, metadata)
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'evictions': 0}
+
+    def get(self, url: str) -> Dict[str, Optional[str]]:
+        """Metadata de `url` (desde la caché si está vigente); propaga errores de descarga"""
+        key = normalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return dict(entry[1])
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.counters['coalesced'] += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self.counters['misses'] += 1
+                leader = True
+
+        if not leader:
+            return dict(future.result())
+
+        try:
+            metadata = self.fetcher(url)
+        except Exception as e:
+            with self._lock:
+                self.counters['errors'] += 1
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, metadata)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters['evictions'] += 1
+            del self._in_flight[key]
+        future.set_result(metadata)
+        return dict(metadata)
+
+    def stats(self) -> Dict:
+        """Contadores de la caché y tasa de aciertos"""
+        with self._lock:
+            counters = dict(self.counters)
+            entries = len(self._entries)
+        lookups = counters['hits'] + counters['misses'] + counters['coalesced']
+        return {
+            **counters,
+            'entries': entries,
+            'hit_rate': (counters['hits'] + counters['coalesced']) / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Vacía la caché (no afecta descargas en curso)"""
+        with self._lock:
+            self._entries.clear()
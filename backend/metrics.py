@@ -0,0 +1,53 @@
+"""
+Métricas ligeras de latencia para los componentes del backend
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyTracker:
+    """Guarda las últimas N mediciones y resume count/avg/p50/p99/max en ms"""
+
+    def __init__(self, window: int = 1000):
+        self._samples = deque(maxlen=window)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds * 1000)
+            self._count += 1
+
+    @contextmanager
+    def measure(self):
+        """Mide la duración del bloque `with`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self._count
+        if not samples:
+            return {'count': count, 'avg_ms': 0.0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'count': count,
+            'avg_ms': round(sum(samples) / len(samples), 4),
+            'p50_ms': round(percentile(samples, 50), 4),
+            'p99_ms': round(percentile(samples, 99), 4),
+            'max_ms': round(samples[-1], 4)
+        }
@@ -0,0 +1,427 @@
+"""
+Almacenamiento de posts en SQLite (append-only, escrituras atómicas)
+Reemplaza la reescritura completa de posts.json en cada generación.
+"""
+import json
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from file_utils import write_json_atomic
+from metrics import LatencyTracker
+from topics import DEFAULT_EXTRACTOR
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    source TEXT,
+    generated_at TEXT,
+    data TEXT NOT NULL,
+    batch INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_posts_id ON posts(id);
+CREATE INDEX IF NOT EXISTS idx_posts_source ON posts(source, seq);
+CREATE INDEX IF NOT EXISTS idx_posts_generated_at ON posts(generated_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS analytics (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, key)
+);
+"""
+
+# Dimensiones de la tabla analytics (contadores materializados)
+TOTALS = 'total'            # 'posts' y 'generations'
+BY_SOURCE = 'source'        # posts por fuente
+BY_DAY = 'day'              # posts por día (YYYY-MM-DD de generated_at)
+BY_TOPIC = 'topic'          # posts que mencionan cada tópico
+GENERATION_SIZE = 'generation_size'  # cantidad de generaciones con N posts
+
+
+def _analytics_deltas(posts: Iterable[Dict], generations: Counter) -> Counter:
+    """
+    Contadores que aportan `posts` a cada (dimensión, clave).
+    `generations` mapea tamaño de generación -> cantidad de generaciones.
+    """
+    posts = list(posts)
+    deltas = Counter()
+    topics_per_post = DEFAULT_EXTRACTOR.extract_many([post.get('post_text') or '' for post in posts])
+    for post, topics in zip(posts, topics_per_post):
+        deltas[(TOTALS, 'posts')] += 1
+        source = (post.get('article') or {}).get('source')
+        if source is not None:
+            deltas[(BY_SOURCE, source)] += 1
+        if post.get('generated_at'):
+            deltas[(BY_DAY, post['generated_at'][:10])] += 1
+        for topic in topics:
+            deltas[(BY_TOPIC, topic)] += 1
+    for size, count in generations.items():
+        deltas[(TOTALS, 'generations')] += count
+        deltas[(GENERATION_SIZE, str(size))] += count
+    return deltas
+
+
+class PostStore:
+    """
+    Store de posts sobre SQLite.
+    Cada post es una fila; el orden de inserción (seq) define la antigüedad,
+    así que escribir cuesta O(posts nuevos) y leer en orden "más nuevos
+    primero" es un recorrido descendente por la clave primaria.
+    """
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.data_dir / "posts.db"
+        self.legacy_file = self.data_dir / "posts.json"
+        self._local = threading.local()
+        self.lookup_latency = LatencyTracker()
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        self._add_batch_column(conn)
+        self._migrate_legacy_json()
+        # Se reconstruyen si nunca se calcularon o si cambió el vocabulario de tópicos
+        built = conn.execute("SELECT value FROM meta WHERE key = 'analytics_built'").fetchone()
+        if built is None or built[0] != DEFAULT_EXTRACTOR.fingerprint:
+            self.rebuild_analytics()
+        self._version = self._read_version(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión propia de cada hilo (sqlite3 no comparte conexiones entre hilos)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _write(self):
+        """Context manager de transacción de escritura (BEGIN IMMEDIATE ... COMMIT)"""
+        return _Transaction(self._connect())
+
+    @staticmethod
+    def _add_batch_column(conn: sqlite3.Connection):
+        """Agrega posts.batch (id de la generación) a bases creadas antes de las analíticas"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+        if 'batch' not in columns:
+            conn.execute("ALTER TABLE posts ADD COLUMN batch INTEGER")
+
+    @staticmethod
+    def _read_version(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _bump_version(self, conn: sqlite3.Connection) -> int:
+        """
+        Incrementa la versión dentro de la transacción de escritura en curso.
+        Quien llama la publica en self._version recién después del COMMIT.
+        """
+        version = self._read_version(conn) + 1
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(version),))
+        return version
+
+    @property
+    def version(self) -> int:
+        """
+        Versión monótona del contenido: aumenta con cada escritura.
+        Sirve como clave para cachear vistas derivadas de los posts.
+        """
+        return self._version
+
+    def refresh_version(self) -> int:
+        """Relee la versión persistida (detecta escrituras de otros procesos)"""
+        self._version = self._read_version(self._connect())
+        return self._version
+
+    @staticmethod
+    def _row_values(post: Dict) -> tuple:
+        article = post.get('article') or {}
+        return (
+            post['id'],
+            article.get('source'),
+            post.get('generated_at'),
+            json.dumps(post, ensure_ascii=False)
+        )
+
+    def _migrate_legacy_json(self):
+        """Importa posts.json una sola vez (se deja el archivo original como respaldo)"""
+        if not self.legacy_file.exists():
+            return
+
+        with self._write() as conn:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+            if done:
+                return
+
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                legacy_posts = json.load(f)
+
+            # posts.json está ordenado de más nuevo a más viejo
+            conn.executemany(
+                "INSERT INTO posts (id, source, generated_at, data) VALUES (?, ?, ?, ?)",
+                [self._row_values(p) for p in reversed(legacy_posts)]
+            )
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                (str(len(legacy_posts)),)
+            )
+            # Las analíticas se recalculan incluyendo los posts importados
+            conn.execute("DELETE FROM meta WHERE key = 'analytics_built'")
+            self._bump_version(conn)
+        print(f"📦 Migrados {len(legacy_posts)} posts desde {self.legacy_file.name} a {self.db_file.name}")
+
+    def append_posts(self, posts: List[Dict]) -> int:
+        """
+        Agrega posts en una única transacción atómica.
+        `posts` viene ordenado de más nuevo a más viejo (igual que load_posts),
+        por lo que posts[0] queda primero en la siguiente lectura.
+        """
+        if not posts:
+            return 0
+        rows = [self._row_values(p) for p in reversed(posts)]
+        deltas = _analytics_deltas(posts, Counter({len(posts): 1}))
+        with self._write() as conn:
+            # Cada append es una generación; su id de lote es la nueva versión
+            version = self._bump_version(conn)
+            conn.executemany(
+                "INSERT INTO posts (id, source, generated_at, data, batch) VALUES (?, ?, ?, ?, ?)",
+                [(*row, version) for row in rows]
+            )
+            self._apply_analytics(conn, deltas)
+        self._version = version
+        return len(rows)
+
+    @staticmethod
+    def _apply_analytics(conn: sqlite3.Connection, deltas: Counter):
+        """Suma los deltas a la tabla analytics (dentro de la transacción en curso)"""
+        conn.executemany(
+            "INSERT INTO analytics (dimension, key, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (dimension, key) DO UPDATE SET count = count + excluded.count",
+            [(dimension, key, count) for (dimension, key), count in deltas.items()]
+        )
+
+    def _compute_analytics(self, conn: sqlite3.Connection) -> Counter:
+        """
+        Recalcula los contadores desde los posts crudos (recorrido completo).
+        Los posts migrados de posts.json no tienen lote: se agrupan por minuto de generación.
+        """
+        posts = []
+        batch_sizes = Counter()
+        rows = conn.execute(
+            "SELECT data, COALESCE(CAST(batch AS TEXT), 'legacy:' || substr(generated_at, 1, 16)) "
+            "FROM posts"
+        )
+        for data, batch in rows:
+            posts.append(json.loads(data))
+            batch_sizes[batch] += 1
+        return _analytics_deltas(posts, Counter(batch_sizes.values()))
+
+    def rebuild_analytics(self) -> Dict:
+        """
+        Reconstruye la tabla analytics desde los posts crudos. Si los
+        contadores cambian sube la versión, así las vistas cacheadas (y el
+        ETag de /api/stats) se invalidan.
+        """
+        version = None
+        with self._write() as conn:
+            deltas = self._compute_analytics(conn)
+            if +deltas != self._stored_analytics(conn):
+                conn.execute("DELETE FROM analytics")
+                self._apply_analytics(conn, deltas)
+                version = self._bump_version(conn)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('analytics_built', ?)",
+                         (DEFAULT_EXTRACTOR.fingerprint,))
+        if version is not None:
+            self._version = version
+        return self.analytics()
+
+    @staticmethod
+    def _stored_analytics(conn: sqlite3.Connection) -> Counter:
+        """Contadores materializados distintos de cero"""
+        return Counter({
+            (dimension, key): count
+            for dimension, key, count in conn.execute("SELECT dimension, key, count FROM analytics")
+            if count
+        })
+
+    def check_analytics(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """
+        Compara los contadores materializados con un recálculo desde los posts.
+        Devuelve {(dimensión, clave): (materializado, recalculado)} con las
+        diferencias; vacío si son consistentes.
+        """
+        conn = self._connect()
+        expected = self._compute_analytics(conn)
+        stored = self._stored_analytics(conn)
+        return {
+            key: (stored[key], expected[key])
+            for key in set(stored) | set(expected)
+            if stored[key] != expected[key]
+        }
+
+    def analytics(self) -> Dict:
+        """
+        Analíticas materializadas: total de posts y generaciones, posts por
+        fuente, día y tópico, y distribución de posts por generación.
+        Se lee una tabla pequeña (una fila por clave), sin recorrer los posts.
+        """
+        result = {
+            'total_posts': 0,
+            'generations': 0,
+            'sources': {},
+            'days': {},
+            'topics': {},
+            'posts_per_generation': {}
+        }
+        sections = {BY_SOURCE: 'sources', BY_DAY: 'days', BY_TOPIC: 'topics',
+                    GENERATION_SIZE: 'posts_per_generation'}
+        rows = self._connect().execute("SELECT dimension, key, count FROM analytics WHERE count > 0")
+        for dimension, key, count in rows:
+            if dimension == TOTALS:
+                result['total_posts' if key == 'posts' else 'generations'] = count
+            elif dimension in sections:
+                result[sections[dimension]][key] = count
+        return result
+
+    def load_posts(self) -> List[Dict]:
+        """Todos los posts, más nuevos primero"""
+        rows = self._connect().execute("SELECT data FROM posts ORDER BY seq DESC")
+        return [json.loads(data) for (data,) in rows]
+
+    def get_post(self, post_id: str) -> Optional[Dict]:
+        """
+        Un post por id usando el índice idx_posts_id: solo se lee esa fila.
+        Si hubiera ids repetidos gana el más nuevo (igual que el recorrido anterior).
+        """
+        with self.lookup_latency.measure():
+            row = self._connect().execute(
+                "SELECT data FROM posts WHERE id = ? ORDER BY seq DESC LIMIT 1",
+                (post_id,)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+
+    def metrics(self) -> Dict:
+        """Métricas del store: tamaño y latencia de búsquedas por id"""
+        return {
+            'total_posts': self.count(),
+            'db_size_bytes': self.db_file.stat().st_size if self.db_file.exists() else 0,
+            'lookup_latency': self.lookup_latency.summary()
+        }
+
+    def query_posts(self, limit: int = 20, cursor: Optional[int] = None,
+                    source: str = None, since: str = None, until: str = None,
+                    q: str = None) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Página de posts (más nuevos primero) con filtros opcionales.
+        `cursor` es el seq del último post de la página anterior; devuelve
+        (posts, next_cursor) con next_cursor=None cuando no hay más páginas.
+        Fuente, fechas y cursor se resuelven con índices; solo se decodifican
+        las filas de la página pedida.
+        """
+        clauses = []
+        params: list = []
+        if cursor is not None:
+            clauses.append("seq < ?")
+            params.append(cursor)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if since:
+            clauses.append("generated_at >= ?")
+            params.append(since)
+        if until:
+            # Una fecha sin hora incluye el día completo
+            clauses.append("generated_at <= ?")
+            params.append(f"{until}T23:59:59.999999" if len(until) == 10 else until)
+        if q:
+            pattern = f"%{q}%"
+            clauses.append(
+                "(json_extract(data, '$.post_text') LIKE ? "
+                "OR json_extract(data, '$.article.title') LIKE ?)"
+            )
+            params.extend([pattern, pattern])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connect().execute(
+            f"SELECT seq, data FROM posts {where} ORDER BY seq DESC LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = rows[-1][0] if has_more else None
+        return [json.loads(data) for _, data in rows], next_cursor
+
+    def source_counts(self) -> Dict[str, int]:
+        """Posts por fuente (contadores materializados)"""
+        rows = self._connect().execute(
+            "SELECT key, count FROM analytics WHERE dimension = ? AND count > 0", (BY_SOURCE,)
+        )
+        return dict(rows.fetchall())
+
+    def count(self) -> int:
+        """Número total de posts"""
+        return self._connect().execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def export_json(self, path: Path):
+        """Exporta todos los posts al formato legado de posts.json"""
+        write_json_atomic(path, self.load_posts(), indent=2)
+
+    def close(self):
+        """Cierra la conexión del hilo actual"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE / COMMIT con rollback ante cualquier error"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute('ROLLBACK')
+        return False
+
+
+if __name__ == "__main__":
+    store = PostStore()
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command == 'export' and len(sys.argv) > 2:
+        store.export_json(Path(sys.argv[2]))
+        print(f"✅ Exportados {store.count()} posts a {sys.argv[2]}")
+    elif command == 'rebuild-analytics':
+        stats = store.rebuild_analytics()
+        print(f"✅ Analíticas reconstruidas: {stats['total_posts']} posts, "
+              f"{stats['generations']} generaciones")
+    elif command == 'check-analytics':
+        mismatches = store.check_analytics()
+        for (dimension, key), (stored, expected) in sorted(mismatches.items()):
+            print(f"⚠️  {dimension}/{key}: materializado={stored} recalculado={expected}")
+        print("✅ Analíticas consistentes" if not mismatches else
+              f"❌ {len(mismatches)} diferencias (usar rebuild-analytics)")
+        sys.exit(1 if mismatches else 0)
+    else:
+        print(f"📁 {store.db_file}: {store.count()} posts")
+        print("Uso: python post_store.py export <archivo.json>")
+        print("     python post_store.py rebuild-analytics | check-analytics")
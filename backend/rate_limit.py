@@ -0,0 +1,64 @@
+"""
+Limitadores de tasa (token bucket) y backoff con jitter para llamadas a APIs
+"""
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe: se recarga a `rate_per_minute` unidades por
+    minuto hasta `capacity`. acquire() bloquea hasta que haya saldo.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0, timeout: float = None) -> bool:
+        """Consume `amount` unidades; devuelve False si se agota `timeout`"""
+        # Una petición mayor que la capacidad nunca cabría: se limita a la capacidad
+        amount = min(amount, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return True
+                wait = (amount - self._tokens) / self.rate_per_second
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Combina un límite de requests por minuto y otro de tokens por minuto"""
+
+    def __init__(self, requests_per_minute: float = None, tokens_per_minute: float = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    def acquire(self, estimated_tokens: int = 0):
+        """Bloquea hasta que la llamada quepa en ambos límites"""
+        if self.requests:
+            self.requests.acquire(1)
+        if self.tokens and estimated_tokens:
+            self.tokens.acquire(estimated_tokens)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Backoff exponencial con 'full jitter': uniforme en [0, min(cap, base * 2^attempt)]"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,266 @@
+"""
+Grabación y reproducción (record/replay) de las respuestas HTTP de las
+fuentes y de Gemini, para correr el pipeline completo sin red y con tiempos
+reproducibles.
+
+REPLAY_MODE elige el modo (por defecto 'off'):
+  record  las llamadas van a la red/API y cada respuesta se guarda en el cassette
+  replay  las respuestas salen del cassette; lo que no está grabado falla
+REPLAY_CASSETTE es el directorio del cassette (http.json + genai.json).
+
+En replay se pueden inyectar fallas para pruebas de carga:
+  REPLAY_LATENCY_MS   latencia por llamada: '50' o un rango '20-200'
+  REPLAY_ERROR_RATE   probabilidad (0-1) de responder 503
+  REPLAY_RATE_LIMIT   llamadas por minuto antes de responder 429 (por canal)
+  REPLAY_SEED         semilla de las fallas aleatorias
+"""
+import base64
+import hashlib
+import io
+import os
+import random
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Tuple
+import requests
+from google.genai import errors
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from file_utils import read_json, write_json_atomic
+from rate_limit import TokenBucket
+
+OFF = 'off'
+RECORD = 'record'
+REPLAY = 'replay'
+
+DEFAULT_CASSETTE = Path(__file__).parent.parent / "data" / "cassettes" / "default"
+# Los validadores no se envían al grabar: el cassette guarda siempre la respuesta completa
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+
+def mode() -> str:
+    """Modo actual según REPLAY_MODE"""
+    value = os.getenv('REPLAY_MODE', OFF).strip().lower() or OFF
+    if value not in (OFF, RECORD, REPLAY):
+        raise ValueError(f"REPLAY_MODE={value} no es válido (off, record o replay)")
+    return value
+
+
+def cassette_dir() -> Path:
+    return Path(os.getenv('REPLAY_CASSETTE') or DEFAULT_CASSETTE)
+
+
+class CassetteMiss(LookupError):
+    """La llamada no está grabada en el cassette"""
+
+
+class Cassette:
+    """Respuestas grabadas en un archivo JSON (clave -> respuesta), seguro entre hilos"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = read_json(self.path, default={}) or {}
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, value: Dict):
+        with self._lock:
+            self.entries[key] = value
+            write_json_atomic(self.path, self.entries, indent=1)
+
+
+def _parse_latency(value: str) -> Tuple[float, float]:
+    """'50' -> (0.05, 0.05); '20-200' -> (0.02, 0.2) en segundos"""
+    if not value:
+        return 0.0, 0.0
+    low, _, high = value.partition('-')
+    return float(low) / 1000, float(high or low) / 1000
+
+
+class Faults:
+    """Latencia, errores y límite de tasa inyectados antes de cada respuesta reproducida"""
+
+    def __init__(self, latency: Tuple[float, float] = (0.0, 0.0), error_rate: float = 0.0,
+                 rate_limit: float = None, seed: int = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.bucket = TokenBucket(rate_limit) if rate_limit else None
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'Faults':
+        rate_limit = os.getenv('REPLAY_RATE_LIMIT')
+        seed = os.getenv('REPLAY_SEED')
+        return cls(
+            latency=_parse_latency(os.getenv('REPLAY_LATENCY_MS', '')),
+            error_rate=float(os.getenv('REPLAY_ERROR_RATE', '0')),
+            rate_limit=float(rate_limit) if rate_limit else None,
+            seed=int(seed) if seed else None
+        )
+
+    def apply(self) -> Optional[int]:
+        """Espera la latencia y devuelve el status a simular (429/503) o None si la llamada sigue"""
+        with self._lock:
+            delay = self._random.uniform(*self.latency)
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if self.bucket is not None and not self.bucket.acquire(timeout=0):
+            return 429
+        return 503 if failed else None
+
+
+# ---------------------------------------------------------------- HTTP
+
+def _http_key(request: requests.PreparedRequest) -> str:
+    return f"{request.method} {request.url}"
+
+
+def _build_response(request: requests.PreparedRequest, status: int, headers: Dict,
+                    body: bytes, adapter: BaseAdapter) -> requests.Response:
+    """requests.Response servida desde memoria (soporta stream=True e iter_content)"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(body)
+    response.reason = HTTPStatus(status).phrase
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    return response
+
+
+class RecordingAdapter(BaseAdapter):
+    """Envía por el adapter real y graba la respuesta completa en el cassette"""
+
+    def __init__(self, inner: HTTPAdapter, cassette: Cassette):
+        super().__init__()
+        self.inner = inner
+        self.cassette = cassette
+
+    def send(self, request, stream=False, **kwargs):
+        for header in CONDITIONAL_HEADERS:
+            request.headers.pop(header, None)
+        live = self.inner.send(request, stream=False, **kwargs)
+        # Headers de transporte: el body se guarda ya descomprimido y completo
+        headers = {k: v for k, v in live.headers.items()
+                   if k.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')}
+        body = live.content
+        self.cassette.put(_http_key(request), {
+            'status': live.status_code,
+            'headers': headers,
+            'body': base64.b64encode(body).decode('ascii')
+        })
+        return _build_response(request, live.status_code, headers, body, self)
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Responde desde el cassette, con fallas inyectadas; nunca abre conexiones"""
+
+    def __init__(self, cassette: Cassette, faults: Faults = None):
+        super().__init__()
+        self.cassette = cassette
+        self.faults = faults or Faults()
+        self.misses = 0  # llamadas sin grabar (el scraper las trata como un error de red)
+
+    def send(self, request, stream=False, **kwargs):
+        entry = self.cassette.get(_http_key(request))
+        if entry is None:
+            self.misses += 1
+            raise requests.ConnectionError(f"Sin respuesta grabada para {_http_key(request)}",
+                                           request=request)
+        status = self.faults.apply()
+        if status is not None:
+            return _build_response(request, status, {'Retry-After': '1'} if status == 429 else {},
+                                   b'', self)
+        # GET condicional como lo resolvería el servidor grabado
+        etag = CaseInsensitiveDict(entry['headers']).get('ETag')
+        if etag and request.headers.get('If-None-Match') == etag:
+            return _build_response(request, 304, {'ETag': etag}, b'', self)
+        return _build_response(request, entry['status'], entry['headers'],
+                               base64.b64decode(entry['body']), self)
+
+    def close(self):
+        pass
+
+
+def http_adapter(inner: HTTPAdapter) -> BaseAdapter:
+    """Adapter a montar en la sesión HTTP según REPLAY_MODE (el mismo `inner` si está apagado)"""
+    current = mode()
+    if current == RECORD:
+        return RecordingAdapter(inner, Cassette(cassette_dir() / 'http.json'))
+    if current == REPLAY:
+        return ReplayAdapter(Cassette(cassette_dir() / 'http.json'), Faults.from_env())
+    return inner
+
+
+# ---------------------------------------------------------------- Gemini
+
+def _genai_key(model: str, contents) -> str:
+    return hashlib.sha256(f"{model}\n{contents}".encode('utf-8')).hexdigest()
+
+
+class _Models:
+    def __init__(self, generate: Callable):
+        self.generate_content = generate
+
+
+class RecordingGenAIClient:
+    """Envuelve un genai.Client: cada generate_content real se graba en el cassette"""
+
+    def __init__(self, client, cassette: Cassette):
+        self.client = client
+        self.cassette = cassette
+        self.models = _Models(self._generate_content)
+
+    def _generate_content(self, model: str, contents, **kwargs):
+        response = self.client.models.generate_content(model=model, contents=contents, **kwargs)
+        self.cassette.put(_genai_key(model, contents), {'model': model, 'text': response.text})
+        return response
+
+
+class ReplayGenAIClient:
+    """Sustituto de genai.Client que responde desde el cassette (sin API key ni red)"""
+
+    def __init__(self, cassette: Cassette, faults: Faults = None):
+        self.cassette = cassette
+        self.faults = faults or Faults()
+        self.misses = 0  # prompts sin grabar (el generador descarta ese post)
+        self.models = _Models(self._generate_content)
+
+    def _generate_content(self, model: str, contents, **kwargs):
+        entry = self.cassette.get(_genai_key(model, contents))
+        if entry is None:
+            self.misses += 1
+            raise CassetteMiss(f"Sin respuesta grabada de {model} para este prompt")
+        status = self.faults.apply()
+        if status is not None:
+            # Los mismos errores que lanza el SDK, para que el generador los reintente igual
+            error = errors.ClientError if status == 429 else errors.ServerError
+            raise error(status, {'error': {'message': f'{status} inyectado por REPLAY_*'}})
+        return SimpleNamespace(text=entry['text'])
+
+
+def genai_client(factory: Callable[[], object]):
+    """
+    Cliente de Gemini según REPLAY_MODE. `factory` crea el cliente real y
+    solo se llama si hace falta (en replay no se necesita API key).
+    """
+    current = mode()
+    if current == REPLAY:
+        return ReplayGenAIClient(Cassette(cassette_dir() / 'genai.json'), Faults.from_env())
+    if current == RECORD:
+        return RecordingGenAIClient(factory(), Cassette(cassette_dir() / 'genai.json'))
+    return factory()
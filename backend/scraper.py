@@ -1,26 +1,84 @@
 """
 Web scraper para artículos de AI de diferentes sitios
 """
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, List, Dict, Tuple
 from datetime import datetime
-import xml.etree.ElementTree as ET
+import http_client
+import html_parsing
+import feeds
+from feed_cache import FeedCache
+
+FEED_CHUNK_SIZE = 16 * 1024
 
 
 class ArticleScraper:
     """Scraper para artículos de AI"""
 
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+    def __init__(self, max_workers: int = 4, source_timeout: float = 20.0,
+                 total_budget: float = 30.0, cache: FeedCache = None):
+        # Motor concurrente: cada fuente corre en su propio worker, con un
+        # deadline por fuente y un presupuesto total para toda la ronda
+        self.max_workers = max_workers
+        self.source_timeout = source_timeout
+        self.total_budget = total_budget
+        self.source_timeouts: Dict[str, float] = {}  # fuente -> deadline propio
+        self.last_run_timings: Dict[str, Dict] = {}
+        self.headers = dict(http_client.DEFAULT_HEADERS)
+        # Caché condicional (ETag/Last-Modified) compartida por todas las fuentes
+        self.cache = cache if cache is not None else FeedCache()
+
+    def _parse_openai_rss(self, response) -> List[Dict]:
+        """Parsea el RSS de OpenAI (primeros 5 items, sin leer el resto del feed)"""
+        return feeds.read_feed(response.iter_content(FEED_CHUNK_SIZE), 'OpenAI Blog', limit=5)
+
+    def _parse_openai_news(self, response) -> List[Dict]:
+        """Parsea la página de noticias de OpenAI"""
+        articles = []
+
+        # Buscar enlaces con "news" o "research" en la URL (solo se parsean los <a>)
+        for href, title in html_parsing.find_links(response.content, limit=10):
+            if '/index/' in href or '/research/' in href:
+                if len(title) > 10:  # Filtrar títulos muy cortos
+                    full_url = f"https://openai.com{href}" if not href.startswith('http') else href
+                    articles.append({
+                        'title': title,
+                        'url': full_url,
+                        'description': '',
+                        'source': 'OpenAI Blog',
+                        'scraped_at': datetime.now().isoformat()
+                    })
+                    if len(articles) >= 3:
+                        break
+        return articles
+
+    def _parse_google_ai_blog(self, response) -> List[Dict]:
+        """Parsea la página del blog de Google AI"""
+        articles = []
+
+        # Google AI Blog usa diferentes selectores (solo se parsean los <article>)
+        for element in html_parsing.find_articles(response.content, limit=5):
+            if element['title'] is None:
+                continue
+
+            title = element['title']
+            link = element['href']
+
+            if not link.startswith('http'):
+                link = f"https://blog.google{link}"
+
+            description = element['description'][:300]
+
+            if title and link:
+                articles.append({
+                    'title': title,
+                    'url': link,
+                    'description': description,
+                    'source': 'Google AI Blog',
+                    'scraped_at': datetime.now().isoformat()
+                })
+        return articles
 
     def scrape_openai_blog(self) -> List[Dict]:
         """Scrape artículos del blog de OpenAI usando RSS"""
@@ -28,31 +86,9 @@ class ArticleScraper:
         try:
             # Intentar con RSS feed primero (más confiable)
             url = "https://openai.com/blog/rss/"
-            response = requests.get(url, headers=self.headers, timeout=15)
-
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                items = root.findall('.//item')[:5]  # Primeros 5
-
-                for item in items:
-                    title = item.find('title').text if item.find('title') is not None else ""
-                    link = item.find('link').text if item.find('link') is not None else ""
-                    description = item.find('description').text if item.find('description') is not None else ""
-
-                    if title and link:
-                        # Limpiar HTML de la descripción
-                        if description:
-                            soup = BeautifulSoup(description, 'html.parser')
-                            description = soup.get_text(strip=True)[:300]
-
-                        articles.append({
-                            'title': title,
-                            'url': link,
-                            'description': description,
-                            'source': 'OpenAI Blog',
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                return articles
+            rss_articles = self.cache.fetch(url, self._parse_openai_rss, headers=self.headers)
+            if rss_articles is not None:
+                return rss_articles
 
         except Exception as e:
             print(f"Error scraping OpenAI RSS: {e}")
@@ -60,28 +96,7 @@ class ArticleScraper:
         # Si RSS falla, intentar scraping directo
         try:
             url = "https://openai.com/news/"
-            response = requests.get(url, headers=self.headers, timeout=15)
-
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Buscar enlaces con "news" o "research" en la URL
-                links = soup.find_all('a', href=True)
-                for link in links[:10]:
-                    href = link.get('href', '')
-                    if '/index/' in href or '/research/' in href:
-                        title = link.get_text(strip=True)
-                        if len(title) > 10:  # Filtrar títulos muy cortos
-                            full_url = f"https://openai.com{href}" if not href.startswith('http') else href
-                            articles.append({
-                                'title': title,
-                                'url': full_url,
-                                'description': '',
-                                'source': 'OpenAI Blog',
-                                'scraped_at': datetime.now().isoformat()
-                            })
-                            if len(articles) >= 3:
-                                break
+            articles = self.cache.fetch(url, self._parse_openai_news, headers=self.headers) or []
         except Exception as e:
             print(f"Error scraping OpenAI blog: {e}")
 
@@ -92,41 +107,10 @@ class ArticleScraper:
         articles = []
         try:
             url = "https://blog.google/technology/ai/"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Google AI Blog usa diferentes selectores
-            article_elements = soup.find_all('article', limit=5)
-
-            for element in article_elements:
-                title_elem = element.find(['h2', 'h3'])
-                if not title_elem:
-                    continue
-
-                title = title_elem.get_text(strip=True)
-                link_elem = element.find('a', href=True)
-                link = link_elem['href'] if link_elem else ""
-
-                if not link.startswith('http'):
-                    link = f"https://blog.google{link}"
-
-                desc_elem = element.find('p')
-                description = desc_elem.get_text(strip=True)[:300] if desc_elem else ""
-
-                if title and link:
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'description': description,
-                        'source': 'Google AI Blog',
-                        'scraped_at': datetime.now().isoformat()
-                    })
+            articles = self.cache.fetch(url, self._parse_google_ai_blog, headers=self.headers) or []
 
         except Exception as e:
             print(f"Error scraping Google AI blog: {e}")
-
         return articles
 
     def get_fallback_articles(self) -> List[Dict]:
@@ -155,17 +139,109 @@ class ArticleScraper:
             }
         ]
 
-    def get_ai_articles(self) -> List[Dict]:
-        """Obtiene artículos de todas las fuentes"""
+    def get_sources(self) -> Dict[str, Callable[[], List[Dict]]]:
+        """Fuentes a scrapear (nombre -> función), en orden de prioridad"""
+        return {
+            'OpenAI Blog': self.scrape_openai_blog,
+            'Google AI Blog': self.scrape_google_ai_blog,
+        }
+
+    @staticmethod
+    def _timed_scrape(scrape: Callable[[], List[Dict]]) -> Tuple[List[Dict], float]:
+        """Ejecuta un scraper y mide su duración"""
+        start = time.monotonic()
+        articles = scrape()
+        return articles, time.monotonic() - start
+
+    def fetch_all_sources(self, on_event: Callable = None) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """
+        Scrapea todas las fuentes en paralelo.
+        Devuelve (artículos, tiempos por fuente). Las fuentes que no terminan
+        dentro de su deadline o del presupuesto total se descartan y quedan
+        marcadas como 'timeout'; el resto se devuelve en el orden de get_sources.
+        on_event(tipo, **datos) recibe 'scrape_started' y 'scrape_finished' por fuente.
+        """
+        emit = on_event or (lambda event_type, **data: None)
+        sources = self.get_sources()
+        timings: Dict[str, Dict] = {}
+        results: Dict[str, List[Dict]] = {}
+        if not sources:
+            self.last_run_timings = timings
+            return [], timings
+
+        start = time.monotonic()
+        budget_deadline = start + self.total_budget
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(sources))),
+            thread_name_prefix='scraper'
+        )
+        futures = {}
+        deadlines = {}
+        for name, scrape in sources.items():
+            print(f"Scraping {name}...")
+            emit('scrape_started', source=name)
+            future = executor.submit(self._timed_scrape, scrape)
+            futures[future] = name
+            timeout = self.source_timeouts.get(name, self.source_timeout)
+            deadlines[future] = min(start + timeout, budget_deadline)
+
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                expired = {f for f in pending if deadlines[f] <= now}
+                for future in expired:
+                    future.cancel()
+                    timings[futures[future]] = {
+                        'status': 'timeout',
+                        'elapsed': round(now - start, 3),
+                        'articles': 0
+                    }
+                    emit('scrape_finished', source=futures[future], **timings[futures[future]])
+                pending -= expired
+                if not pending:
+                    break
+
+                next_deadline = min(deadlines[f] for f in pending)
+                done, pending = wait(pending, timeout=max(0.0, next_deadline - now),
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures[future]
+                    try:
+                        articles, elapsed = future.result()
+                        results[name] = articles or []
+                        timings[name] = {
+                            'status': 'ok',
+                            'elapsed': round(elapsed, 3),
+                            'articles': len(results[name])
+                        }
+                    except Exception as e:
+                        print(f"Error scraping {name}: {e}")
+                        timings[name] = {
+                            'status': 'error',
+                            'elapsed': round(time.monotonic() - start, 3),
+                            'articles': 0,
+                            'error': str(e)
+                        }
+                    emit('scrape_finished', source=name, **timings[name])
+        finally:
+            # No esperar a las fuentes lentas: sus hilos terminan por su cuenta
+            executor.shutdown(wait=False, cancel_futures=True)
+
         all_articles = []
+        for name in sources:
+            all_articles.extend(results.get(name, []))
 
-        print("Scraping OpenAI blog...")
-        openai_articles = self.scrape_openai_blog()
-        all_articles.extend(openai_articles)
+        self.last_run_timings = timings
+        return all_articles, timings
+
+    def get_ai_articles(self, on_event: Callable = None) -> List[Dict]:
+        """Obtiene artículos de todas las fuentes"""
+        all_articles, timings = self.fetch_all_sources(on_event)
 
-        print("Scraping Google AI blog...")
-        google_articles = self.scrape_google_ai_blog()
-        all_articles.extend(google_articles)
+        for name, timing in timings.items():
+            print(f"  {name}: {timing['status']} en {timing['elapsed']:.2f}s "
+                  f"({timing['articles']} artículos)")
 
         # Si no se encontraron suficientes artículos, complementar con fallback
         if len(all_articles) < 3:
@@ -179,6 +255,9 @@ class ArticleScraper:
                     if len(all_articles) >= 3:
                         break
 
+        cache_stats = self.cache.stats()
+        print(f"Caché HTTP: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"({cache_stats['bytes_saved'] / 1024:.0f} KB ahorrados)")
         print(f"Total articles found: {len(all_articles)}")
         return all_articles
 
@@ -1,56 +1,92 @@
 """
 API Flask para servir los posts generados
 """
-import json
+import hashlib
+import os
 from pathlib import Path
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
-import threading
-import requests
-from bs4 import BeautifulSoup
 from scraper import ArticleScraper
-from generator import LinkedInPostGenerator
-from agent_brain import AutonomousAgent
+from feed_cache import FeedCache
+from metadata import MetadataService
+import batch_ingest
+from post_store import PostStore
+from events import EventBus
+from jobs import Job, JobManager
+from services import ServiceContainer
 from datetime import datetime
 
 app = Flask(__name__)
 CORS(app)  # Permite requests desde el frontend React
 
-DATA_DIR = Path(__file__).parent.parent / "data"
-POSTS_FILE = DATA_DIR / "posts.json"
+DATA_DIR = Path(os.getenv('DATA_DIR') or Path(__file__).parent.parent / "data")
+post_store = PostStore(DATA_DIR)
+events = EventBus()
+services = ServiceContainer(DATA_DIR, post_store=post_store)
+jobs = JobManager(max_workers=int(os.getenv('JOB_WORKERS', '2')), events=events)
+metadata_service = MetadataService()
 
-# Estado para tracking de generación
-generation_status = {
-    'is_generating': False,
-    'progress': '',
-    'error': None
-}
+
+def generation_status() -> dict:
+    """Estado de la última generación (formato de /api/generate/status)"""
+    job = jobs.latest('generation')
+    if job is None:
+        return {'is_generating': False, 'progress': '', 'error': None, 'job_id': None}
+    return {
+        'is_generating': job.is_active,
+        'progress': job.progress,
+        'error': job.error,
+        'job_id': job.id
+    }
 
 
 def load_posts():
-    """Carga los posts desde el archivo JSON"""
-    if POSTS_FILE.exists():
-        with open(POSTS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    """Carga los posts desde el store (más nuevos primero)"""
+    return post_store.load_posts()
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
 
 
 @app.route('/api/posts', methods=['GET'])
 def get_posts():
-    """Endpoint para obtener todos los posts"""
-    posts = load_posts()
+    """
+    Endpoint para obtener posts paginados (más nuevos primero)
+    Query params: limit, cursor, source, since, until (ISO), q (texto)
+    """
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        cursor = request.args.get('cursor')
+        cursor = int(cursor) if cursor else None
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'limit y cursor deben ser enteros'
+        }), 400
+
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    posts, next_cursor = post_store.query_posts(
+        limit=limit,
+        cursor=cursor,
+        source=request.args.get('source'),
+        since=request.args.get('since'),
+        until=request.args.get('until'),
+        q=request.args.get('q')
+    )
     return jsonify({
         'success': True,
         'count': len(posts),
-        'posts': posts
+        'posts': posts,
+        'next_cursor': str(next_cursor) if next_cursor is not None else None,
+        'has_more': next_cursor is not None
     })
 
 
 @app.route('/api/posts/<post_id>', methods=['GET'])
 def get_post(post_id):
     """Endpoint para obtener un post específico"""
-    posts = load_posts()
-    post = next((p for p in posts if p['id'] == post_id), None)
+    post = post_store.get_post(post_id)
 
     if post:
         return jsonify({
@@ -64,22 +100,55 @@ def get_post(post_id):
         }), 404
 
 
+def _not_modified(etag: str):
+    """Respuesta 304 si el cliente ya tiene la versión `etag` (If-None-Match)"""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
-    """Endpoint para obtener estadísticas"""
-    posts = load_posts()
+    """Endpoint para obtener estadísticas (contadores materializados, con ETag)"""
+    etag = f"stats-{post_store.refresh_version()}"
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
+    response = jsonify({
+        'success': True,
+        'stats': post_store.analytics()
+    })
+    response.set_etag(etag)
+    return response
 
-    sources = {}
-    for post in posts:
-        source = post['article']['source']
-        sources[source] = sources.get(source, 0) + 1
 
+@app.route('/api/store/metrics', methods=['GET'])
+def get_store_metrics():
+    """Endpoint para ver tamaño del store y latencia de búsquedas por id"""
     return jsonify({
         'success': True,
-        'stats': {
-            'total_posts': len(posts),
-            'sources': sources
-        }
+        'metrics': post_store.metrics()
+    })
+
+
+@app.route('/api/scraper/cache', methods=['GET'])
+def get_scraper_cache_stats():
+    """Endpoint para ver la efectividad de la caché HTTP del scraper"""
+    return jsonify({
+        'success': True,
+        'cache': FeedCache().stats()
+    })
+
+
+@app.route('/api/metadata/cache', methods=['GET'])
+def get_metadata_cache_stats():
+    """Endpoint para ver la efectividad de la caché de metadata de URLs"""
+    return jsonify({
+        'success': True,
+        'cache': metadata_service.stats()
     })
 
 
@@ -93,101 +162,176 @@ def health():
     })
 
 
-def generate_posts_background():
-    """Función que genera posts en background con capacidades autónomas"""
-    global generation_status
+class GenerationError(Exception):
+    """La generación terminó sin posts (el mensaje se muestra al usuario)"""
 
-    try:
-        generation_status['is_generating'] = True
-        generation_status['progress'] = '🧠 Evaluando con sistema autónomo...'
-        generation_status['error'] = None
 
-        # Inicializar agente autónomo
-        brain = AutonomousAgent()
+def generate_posts_background(job: Job) -> dict:
+    """Trabajo que genera posts en background con capacidades autónomas"""
+    job.emit('generation_started', '🧠 Evaluando con sistema autónomo...')
 
-        # Evaluar si debe generar
+    # Evaluar si debe generar (cerebro compartido del proceso)
+    with services.brain() as brain:
         should_run, reason, performance = brain.evaluate_and_decide()
 
-        if not should_run:
-            generation_status['error'] = f'El agente decidió no generar: {reason}'
-            generation_status['is_generating'] = False
-            return
+    if not should_run:
+        raise GenerationError(f'El agente decidió no generar: {reason}')
 
-        generation_status['progress'] = 'Buscando artículos...'
+    job.check_cancelled()
+    job.emit('scrape_phase', 'Buscando artículos...')
 
-        # Scrape artículos
-        scraper = ArticleScraper()
-        all_articles = scraper.get_ai_articles()
+    # Scrape artículos
+    scraper = ArticleScraper()
+    all_articles = scraper.get_ai_articles(on_event=job.emit)
 
-        if not all_articles:
-            generation_status['error'] = 'No se encontraron artículos'
-            generation_status['is_generating'] = False
-            return
+    if not all_articles:
+        raise GenerationError('No se encontraron artículos')
 
-        generation_status['progress'] = f'🧠 Seleccionando mejores artículos de {len(all_articles)} candidatos...'
+    job.check_cancelled()
+    job.emit('scoring_phase', f'🧠 Seleccionando mejores artículos de {len(all_articles)} candidatos...',
+             candidates=len(all_articles))
 
-        # Selección inteligente
-        articles = brain.process_articles(all_articles)
-
-        generation_status['progress'] = f'Generando {len(articles)} posts con parámetros adaptativos...'
-
-        # Generar posts con parámetros adaptativos
-        generator = LinkedInPostGenerator()
+    # Selección inteligente
+    with services.brain() as brain:
+        articles = brain.process_articles(all_articles, on_event=job.emit)
         adaptive_params = brain.get_adaptive_params()
-        new_posts = generator.generate_posts_from_articles(articles, adaptive_params)
 
-        if not new_posts:
-            generation_status['error'] = 'No se pudieron generar posts'
-            generation_status['is_generating'] = False
-            return
+    job.check_cancelled()
+    job.emit('generation_phase', f'Generando {len(articles)} posts con parámetros adaptativos...',
+             articles=len(articles))
 
-        # Guardar posts
-        generation_status['progress'] = 'Guardando posts...'
-        existing_posts = load_posts()
+    # Generar posts con parámetros adaptativos
+    generator = services.get_generator()
+    new_posts = generator.generate_posts_from_articles(articles, adaptive_params,
+                                                       on_event=job.emit)
 
-        # Agregar ID único
-        for i, post in enumerate(new_posts):
-            post['id'] = f"post_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i}"
+    if not new_posts:
+        raise GenerationError('No se pudieron generar posts')
 
-        all_posts = new_posts + existing_posts
+    # Último punto de cancelación: después de guardar ya no se deshace
+    job.check_cancelled()
+    job.progress = 'Guardando posts...'
 
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(POSTS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(all_posts, f, indent=2, ensure_ascii=False)
+    # Agregar ID único
+    for i, post in enumerate(new_posts):
+        post['id'] = f"post_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i}"
 
-        # Fase de aprendizaje
-        generation_status['progress'] = '🧠 Aprendiendo de esta generación...'
-        brain.learn_from_generation(articles, new_posts)
+    post_store.append_posts(new_posts)
+    job.emit('saved', count=len(new_posts), post_ids=[p['id'] for p in new_posts])
 
-        generation_status['progress'] = f'✅ Completado: {len(new_posts)} posts generados (el agente aprendió)'
-        generation_status['is_generating'] = False
+    # Fase de aprendizaje
+    job.emit('learning_phase', '🧠 Aprendiendo de esta generación...')
+    with services.brain() as brain:
+        brain.learn_from_generation(articles, new_posts)
 
-    except Exception as e:
-        generation_status['error'] = str(e)
-        generation_status['is_generating'] = False
+    job.progress = f'✅ Completado: {len(new_posts)} posts generados (el agente aprendió)'
+    return {
+        'posts': len(new_posts),
+        'post_ids': [p['id'] for p in new_posts]
+    }
 
 
 @app.route('/api/generate', methods=['POST'])
 def generate_posts():
-    """Endpoint para generar nuevos posts"""
-    global generation_status
+    """
+    Endpoint para generar nuevos posts.
+    Si ya hay una generación en cola o corriendo se devuelve ese mismo trabajo.
+    """
+    # Los clientes se suscriben a /api/generate/events?after=<last_event_id>
+    # para no perder eventos emitidos antes de conectarse
+    last_event_id = events.last_id
+
+    job, created = jobs.submit('generation', generate_posts_background, key='generation')
+
+    return jsonify({
+        'success': True,
+        'message': 'Generación iniciada' if created else 'Ya hay una generación en progreso; se reutiliza',
+        'job_id': job.id,
+        'coalesced': not created,
+        'job': job.to_dict(),
+        'status': generation_status(),
+        'last_event_id': last_event_id
+    }), 202
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """Endpoint para listar los trabajos recientes (filtro opcional ?kind=)"""
+    return jsonify({
+        'success': True,
+        'jobs': [job.to_dict() for job in jobs.list(request.args.get('kind'))]
+    })
 
-    if generation_status['is_generating']:
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Endpoint para obtener el estado y resultado de un trabajo"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Endpoint para cancelar un trabajo en cola o en ejecución"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    if not jobs.cancel(job_id):
         return jsonify({
             'success': False,
-            'error': 'Ya hay una generación en progreso',
-            'status': generation_status
+            'error': f'El trabajo ya terminó ({job.status})',
+            'job': job.to_dict()
         }), 409
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+
+@app.route('/api/generate/events', methods=['GET'])
+def stream_generation_events():
+    """Stream SSE con los eventos estructurados de progreso de la generación"""
+    after = request.args.get('after') or request.headers.get('Last-Event-ID')
+    try:
+        after_id = int(after) if after else None
+    except ValueError:
+        after_id = None
 
-    # Iniciar generación en background
-    thread = threading.Thread(target=generate_posts_background)
-    thread.daemon = True
-    thread.start()
+    return Response(
+        stream_with_context(events.stream(after_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/generate/events/poll', methods=['GET'])
+def poll_generation_events():
+    """Long-poll alternativo a SSE: espera hasta `timeout` s por eventos con id > after"""
+    try:
+        after_id = int(request.args.get('after', 0))
+        timeout = min(float(request.args.get('timeout', 25)), 60)
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'after y timeout deben ser numéricos'
+        }), 400
 
+    new_events = events.wait_for_events(after_id, timeout)
     return jsonify({
         'success': True,
-        'message': 'Generación iniciada',
-        'status': generation_status
+        'events': new_events,
+        'last_event_id': new_events[-1]['id'] if new_events else after_id
     })
 
 
@@ -196,40 +340,47 @@ def get_generation_status():
     """Endpoint para obtener el estado de la generación"""
     return jsonify({
         'success': True,
-        'status': generation_status
+        'status': generation_status()
     })
 
 
 @app.route('/api/agent/status', methods=['GET'])
 def get_agent_status():
-    """Endpoint para obtener el estado del agente autónomo"""
+    """Endpoint para obtener el estado del agente autónomo (con ETag)"""
     try:
-        brain = AutonomousAgent()
-
-        # Obtener información del estado del agente
-        should_run, reason = brain.decision_engine.should_generate_now()
-        performance = brain.learning_system.analyze_performance()
-        adaptive_params = brain.get_adaptive_params()
-
-        return jsonify({
-            'success': True,
-            'agent': {
-                'memory': {
-                    'total_generations': brain.memory.memory['total_generations'],
-                    'articles_processed': len(brain.memory.memory['article_history']),
-                    'topics_covered': len(brain.memory.memory['topics_covered']),
-                    'topic_diversity': brain.memory.get_topic_diversity_score(),
-                    'last_generation': brain.memory.memory.get('last_generation'),
-                    'sources_used': brain.memory.memory['sources_used']
-                },
-                'decision': {
-                    'should_generate_now': should_run,
-                    'reason': reason
-                },
-                'performance': performance,
-                'adaptive_params': adaptive_params
-            }
-        })
+        with services.brain() as brain:
+            etag = f"status-{brain.status_etag()}"
+            not_modified = _not_modified(etag)
+            if not_modified is not None:
+                return not_modified
+
+            # Vistas cacheadas por versión: solo se recalculan tras un cambio de estado
+            should_run, reason = brain.should_generate_now()
+            performance = brain.analyze_performance()
+            adaptive_params = brain.get_adaptive_params()
+
+            response = jsonify({
+                'success': True,
+                'agent': {
+                    'memory': {
+                        'total_generations': brain.memory.memory['total_generations'],
+                        'articles_processed': len(brain.memory.memory['article_history']),
+                        'topics_covered': len(brain.memory.memory['topics_covered']),
+                        'topic_diversity': brain.get_topic_diversity_score(),
+                        'last_generation': brain.memory.memory.get('last_generation'),
+                        'sources_used': brain.memory.memory['sources_used'],
+                        'last_7_days': brain.get_recent_activity(7)
+                    },
+                    'decision': {
+                        'should_generate_now': should_run,
+                        'reason': reason
+                    },
+                    'performance': performance,
+                    'adaptive_params': adaptive_params
+                }
+            })
+            response.set_etag(etag)
+            return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -239,13 +390,20 @@ def get_agent_status():
 
 @app.route('/api/agent/memory', methods=['GET'])
 def get_agent_memory():
-    """Endpoint para ver la memoria completa del agente"""
+    """Endpoint para ver la memoria completa del agente (con ETag)"""
     try:
-        brain = AutonomousAgent()
-        return jsonify({
-            'success': True,
-            'memory': brain.memory.memory
-        })
+        with services.brain() as brain:
+            etag = f"memory-{brain.memory.version}"
+            not_modified = _not_modified(etag)
+            if not_modified is not None:
+                return not_modified
+
+            response = jsonify({
+                'success': True,
+                'memory': brain.memory.memory
+            })
+            response.set_etag(etag)
+            return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -265,34 +423,11 @@ def fetch_metadata():
         }), 400
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # Intentar obtener título
-        title = None
-        if soup.find('meta', property='og:title'):
-            title = soup.find('meta', property='og:title').get('content')
-        elif soup.find('title'):
-            title = soup.find('title').get_text(strip=True)
-
-        # Intentar obtener descripción
-        description = None
-        if soup.find('meta', property='og:description'):
-            description = soup.find('meta', property='og:description').get('content')
-        elif soup.find('meta', attrs={'name': 'description'}):
-            description = soup.find('meta', attrs={'name': 'description'}).get('content')
+        metadata = metadata_service.get(url)
 
         return jsonify({
             'success': True,
-            'metadata': {
-                'title': title,
-                'description': description
-            }
+            'metadata': metadata
         })
 
     except Exception as e:
@@ -321,26 +456,10 @@ def add_custom_source():
         # Si no se proporcionó título o descripción, intentar obtenerlos
         if not title or not description:
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                }
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                if not title:
-                    if soup.find('meta', property='og:title'):
-                        title = soup.find('meta', property='og:title').get('content')
-                    elif soup.find('title'):
-                        title = soup.find('title').get_text(strip=True)
-
-                if not description:
-                    if soup.find('meta', property='og:description'):
-                        description = soup.find('meta', property='og:description').get('content')
-                    elif soup.find('meta', attrs={'name': 'description'}):
-                        description = soup.find('meta', attrs={'name': 'description'}).get('content')
-
+                # Normalmente ya está en caché por la vista previa de /api/fetch-metadata
+                metadata = metadata_service.get(url)
+                title = title or metadata['title'] or ''
+                description = description or metadata['description'] or ''
             except Exception as e:
                 print(f"Error al obtener metadata: {e}")
 
@@ -358,11 +477,11 @@ def add_custom_source():
         }
 
         # Generar post inmediatamente
-        generator = LinkedInPostGenerator()
+        generator = services.get_generator()
 
         # Usar agente autónomo para parámetros adaptativos
-        brain = AutonomousAgent()
-        adaptive_params = brain.get_adaptive_params()
+        with services.brain() as brain:
+            adaptive_params = brain.get_adaptive_params()
 
         post = generator.generate_post(article, adaptive_params)
 
@@ -373,16 +492,12 @@ def add_custom_source():
             }), 500
 
         # Guardar post
-        existing_posts = load_posts()
         post['id'] = f"post_{datetime.now().strftime('%Y%m%d_%H%M%S')}_custom"
-        all_posts = [post] + existing_posts
-
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(POSTS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(all_posts, f, indent=2, ensure_ascii=False)
+        post_store.append_posts([post])
 
         # Aprender de esta generación
-        brain.learn_from_generation([article], [post])
+        with services.brain() as brain:
+            brain.learn_from_generation([article], [post])
 
         return jsonify({
             'success': True,
@@ -398,21 +513,75 @@ def add_custom_source():
         }), 500
 
 
+def batch_ingest_background(job: Job, urls: list, skip_processed: bool) -> dict:
+    """Trabajo que ingesta un lote de URLs de fuentes personalizadas"""
+    job.emit('batch_started', f'📥 Ingestando {len(urls)} URLs...', urls=len(urls))
+    summary = batch_ingest.ingest_urls(
+        urls, services, metadata_service, skip_processed=skip_processed,
+        on_event=job.emit, check_cancelled=job.check_cancelled
+    )
+    job.progress = f"✅ Completado: {summary['created']}/{summary['total']} posts creados"
+    return summary
+
+
+@app.route('/api/custom-source/batch', methods=['POST'])
+def add_custom_sources_batch():
+    """
+    Endpoint para ingestar muchas URLs de una vez (trabajo en background).
+    El resultado por URL queda en GET /api/jobs/<id>.
+    """
+    data = request.get_json(silent=True) or {}
+    urls = data.get('urls')
+
+    if not isinstance(urls, list) or not urls or not all(isinstance(u, str) for u in urls):
+        return jsonify({
+            'success': False,
+            'error': 'urls debe ser una lista no vacía de URLs'
+        }), 400
+    if len(urls) > batch_ingest.MAX_BATCH_URLS:
+        return jsonify({
+            'success': False,
+            'error': f'Máximo {batch_ingest.MAX_BATCH_URLS} URLs por lote'
+        }), 400
+
+    skip_processed = bool(data.get('skip_processed', True))
+    last_event_id = events.last_id
+    # El mismo lote enviado dos veces mientras corre reutiliza el trabajo
+    key = hashlib.sha256('\n'.join(urls).encode('utf-8')).hexdigest()
+    job, created = jobs.submit('batch_ingest', batch_ingest_background, key,
+                               urls, skip_processed)
+
+    return jsonify({
+        'success': True,
+        'message': 'Ingesta iniciada' if created else 'Ese lote ya se está procesando; se reutiliza',
+        'job_id': job.id,
+        'coalesced': not created,
+        'job': job.to_dict(),
+        'last_event_id': last_event_id
+    }), 202
+
+
 if __name__ == '__main__':
     print("🚀 Starting API server...")
-    print(f"📁 Posts file: {POSTS_FILE}")
+    print(f"📁 Posts store: {post_store.db_file}")
     print("🌐 API running at: http://localhost:5001")
     print("\nEndpoints:")
-    print("  GET  /api/posts          - Lista todos los posts")
+    print("  GET  /api/posts          - Lista posts paginados (limit, cursor, source, since, until, q)")
     print("  GET  /api/posts/<id>     - Obtiene un post específico")
     print("  GET  /api/stats          - Estadísticas")
+    print("  GET  /api/store/metrics  - Métricas del store de posts")
+    print("  GET  /api/scraper/cache  - Hits/misses de la caché HTTP del scraper")
+    print("  GET  /api/metadata/cache - Hits/misses de la caché de metadata de URLs")
     print("  GET  /api/health         - Health check")
     print("  POST /api/generate       - Genera nuevos posts (con agente autónomo)")
     print("  GET  /api/generate/status - Estado de generación")
+    print("  GET  /api/jobs/<id>      - Estado de un trabajo (POST /api/jobs/<id>/cancel para cancelar)")
+    print("  GET  /api/generate/events - Stream SSE de progreso (long-poll: /events/poll)")
     print("  🧠 GET  /api/agent/status  - Estado del agente autónomo")
     print("  🧠 GET  /api/agent/memory  - Memoria del agente")
     print("  📎 GET  /api/fetch-metadata - Obtener metadata de URL")
     print("  📎 POST /api/custom-source  - Agregar fuente personalizada")
+    print("  📎 POST /api/custom-source/batch - Ingestar muchas URLs (trabajo en background)")
     print("\n")
 
     app.run(debug=True, port=5001)
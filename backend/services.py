@@ -0,0 +1,73 @@
+"""
+Contenedor de servicios del proceso: un único cerebro autónomo y un único
+generador (cliente de Gemini) compartidos por todas las requests.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from agent_brain import AutonomousAgent
+from generator import LinkedInPostGenerator
+from post_store import PostStore
+
+
+class ServiceContainer:
+    """
+    Mantiene instancias de larga vida en lugar de construirlas por request.
+    El cerebro se recarga si agent_memory.json cambió por fuera del proceso
+    (p.ej. una ejecución de agent.py); ese chequeo es un stat() que se hace
+    como mucho cada `refresh_interval` segundos.
+    """
+
+    def __init__(self, data_dir: Path, post_store: PostStore = None,
+                 refresh_interval: float = 5.0,
+                 generator_factory: Callable[[], LinkedInPostGenerator] = LinkedInPostGenerator):
+        self.data_dir = Path(data_dir)
+        self.post_store = post_store if post_store is not None else PostStore(self.data_dir)
+        self.refresh_interval = refresh_interval
+        self.generator_factory = generator_factory
+
+        self._brain: Optional[AutonomousAgent] = None
+        self._generator: Optional[LinkedInPostGenerator] = None
+        self._last_check = 0.0
+        # Reentrante: un endpoint puede llamar a otro método del cerebro con el lock tomado
+        self.brain_lock = threading.RLock()
+        self._generator_lock = threading.Lock()
+
+    def _brain_is_stale(self) -> bool:
+        now = time.monotonic()
+        if now - self._last_check < self.refresh_interval:
+            return False
+        self._last_check = now
+        # Escrituras de otros procesos al store invalidan las vistas cacheadas del cerebro
+        self.post_store.refresh_version()
+        return self._brain.memory.file_mtime() != self._brain.memory.loaded_mtime
+
+    def get_brain(self) -> AutonomousAgent:
+        """Cerebro compartido (se crea la primera vez o si la memoria cambió en disco)"""
+        with self.brain_lock:
+            if self._brain is None or self._brain_is_stale():
+                self._brain = AutonomousAgent(self.data_dir, post_store=self.post_store)
+                self._last_check = time.monotonic()
+            return self._brain
+
+    @contextmanager
+    def brain(self) -> Iterator[AutonomousAgent]:
+        """Uso exclusivo del cerebro: `with services.brain() as brain: ...`"""
+        with self.brain_lock:
+            yield self.get_brain()
+
+    def get_generator(self) -> LinkedInPostGenerator:
+        """Generador compartido (un solo genai.Client y un solo rate limiter)"""
+        if self._generator is None:
+            with self._generator_lock:
+                if self._generator is None:
+                    self._generator = self.generator_factory()
+        return self._generator
+
+    def reset(self):
+        """Descarta las instancias (se recrean en el próximo uso)"""
+        with self.brain_lock, self._generator_lock:
+            self._brain = None
+            self._generator = None
@@ -3,7 +3,23 @@ Configuración de pytest para los tests del backend
 """
 import sys
 import os
+import tempfile
+import pytest
 
 # Agregar el directorio backend al Python path
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, backend_dir)
+
+# server crea su store al importarse: que no sea el de data/ del repo
+_server_data_dir = tempfile.TemporaryDirectory(prefix='backend-tests-')
+os.environ['DATA_DIR'] = _server_data_dir.name
+
+import feed_cache
+import generation_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Las cachés creadas con su archivo por defecto escriben en tmp_path, no en data/"""
+    monkeypatch.setattr(feed_cache, 'DEFAULT_CACHE_FILE', tmp_path / 'http_cache.json')
+    monkeypatch.setattr(generation_cache, 'DEFAULT_CACHE_FILE', tmp_path / 'generation_cache.db')
@@ -0,0 +1,42 @@
+"""
+Dobles de prueba locales (sin red) para los tests del backend
+"""
+import threading
+import time
+from types import SimpleNamespace
+from google.genai import errors
+
+
+class FakeGenaiClient:
+    """
+    Imita genai.Client: client.models.generate_content(model=..., contents=...)
+    Simula latencia y devuelve 429 en las primeras `rate_limit_errors` llamadas.
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit_errors: int = 0, fail_status: int = None):
+        self.latency = latency
+        self.rate_limit_errors = rate_limit_errors
+        self.fail_status = fail_status
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(generate_content=self.generate_content)
+
+    def generate_content(self, model: str, contents: str):
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if self.fail_status:
+                raise errors.ClientError(self.fail_status, {'error': {'message': 'fake error'}})
+            if call_number <= self.rate_limit_errors:
+                raise errors.ClientError(429, {'error': {'message': 'rate limited'}})
+            title = contents.split('Título: ', 1)[1].split('\n', 1)[0]
+            return SimpleNamespace(text=f"Post sobre {title}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
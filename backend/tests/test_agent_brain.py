@@ -0,0 +1,293 @@
+"""
+Tests para el sistema autónomo (memoria, decisiones y aprendizaje)
+"""
+import pytest
+from datetime import datetime, timedelta
+import dedup
+from agent_brain import AgentMemory, AutonomousAgent, DecisionEngine
+from url_utils import normalize_url
+
+
+def make_article(url, title='Test Article About AI', source='Test Blog'):
+    """Crea un artículo de ejemplo"""
+    return {
+        'title': title,
+        'url': url,
+        'description': 'Descripción de prueba',
+        'source': source,
+        'scraped_at': '2026-01-03T12:00:00'
+    }
+
+
+class TestNormalizeUrl:
+    """Tests para normalize_url"""
+
+    def test_strips_scheme_www_and_trailing_slash(self):
+        """Test que se ignoran esquema, www y barra final"""
+        assert normalize_url('https://www.OpenAI.com/index/gpt/') == 'openai.com/index/gpt'
+        assert normalize_url('http://openai.com/index/gpt') == 'openai.com/index/gpt'
+
+    def test_strips_tracking_params_and_fragment(self):
+        """Test que se eliminan parámetros de tracking y el fragmento"""
+        url = 'https://blog.google/ai/post?utm_source=x&b=2&fbclid=abc&a=1#section'
+        assert normalize_url(url) == 'blog.google/ai/post?a=1&b=2'
+
+
+class TestAgentMemory:
+    """Tests para la clase AgentMemory"""
+
+    @pytest.fixture
+    def memory(self, tmp_path):
+        """Fixture con una memoria vacía en un directorio temporal"""
+        return AgentMemory(tmp_path)
+
+    def test_was_article_processed_uses_normalized_urls(self, memory):
+        """Test que variantes triviales de una URL cuentan como ya procesadas"""
+        memory.remember_generation([make_article('https://openai.com/index/gpt-5')], [])
+
+        assert memory.was_article_processed('https://www.openai.com/index/gpt-5/?utm_source=rss')
+        assert not memory.was_article_processed('https://openai.com/index/gpt-6')
+
+    def test_url_index_is_rebuilt_on_load(self, tmp_path):
+        """Test que el índice se reconstruye al cargar la memoria"""
+        AgentMemory(tmp_path).remember_generation([make_article('https://example.com/a')], [])
+
+        assert AgentMemory(tmp_path).was_article_processed('https://example.com/a')
+
+    def test_compact_history_by_count(self, memory):
+        """Test que la compactación conserva los más recientes"""
+        memory.remember_generation([make_article(f'https://example.com/{i}') for i in range(10)], [])
+
+        removed = memory.compact_history(max_entries=3)
+
+        assert removed == 7
+        assert not memory.was_article_processed('https://example.com/0')
+        assert memory.was_article_processed('https://example.com/9')
+
+    def test_compact_history_by_age(self, memory):
+        """Test que la compactación por antigüedad elimina entradas viejas"""
+        old = (datetime.now() - timedelta(days=60)).isoformat()
+        memory.memory['article_history'].append({
+            'url': 'https://example.com/old', 'title': 'Old', 'source': 'Test', 'processed_at': old
+        })
+        memory.remember_generation([make_article('https://example.com/new')], [])
+
+        memory.compact_history(max_age_days=30)
+
+        assert not memory.was_article_processed('https://example.com/old')
+        assert memory.was_article_processed('https://example.com/new')
+
+    def test_memory_is_saved_compact_and_atomic(self, memory):
+        """Test que la memoria se guarda en JSON compacto sin archivos temporales"""
+        memory.remember_generation([make_article('https://example.com/a')], [])
+
+        content = memory.memory_file.read_text(encoding='utf-8')
+        assert '\n' not in content
+        assert list(memory.data_dir.glob('.agent_memory.json.*')) == []
+
+    def test_rolling_counters_per_day_and_week(self, memory):
+        """Test que cada generación actualiza los contadores diarios y semanales"""
+        post = {'post_text': 'Nuevo modelo #GPT y agentes'}
+        memory.remember_generation([make_article('https://example.com/a', source='OpenAI Blog')], [post])
+        memory.remember_generation([make_article('https://example.com/b', source='OpenAI Blog')], [post])
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        daily = memory.memory['daily_stats'][today]
+        assert daily['generations'] == 2
+        assert daily['sources']['OpenAI Blog'] == 2
+        assert daily['topics']['gpt'] == 2
+        assert sum(b['generations'] for b in memory.memory['weekly_stats'].values()) == 2
+        assert memory.get_recent_activity(7)['generations'] == 2
+
+    def test_retention_windows_bound_the_file(self, tmp_path):
+        """Test que el historial y los contadores viejos se descartan al cargar"""
+        memory = AgentMemory(tmp_path, history_retention_days=30, daily_retention_days=7)
+        old_day = datetime.now() - timedelta(days=45)
+        memory.memory['article_history'].append({
+            'url': 'https://example.com/old', 'title': 'Old', 'source': 'Test',
+            'processed_at': old_day.isoformat()
+        })
+        memory.memory['daily_stats'][old_day.strftime('%Y-%m-%d')] = {'generations': 1}
+        memory.save_memory()
+
+        reloaded = AgentMemory(tmp_path, history_retention_days=30, daily_retention_days=7)
+
+        assert reloaded.memory['article_history'] == []
+        assert reloaded.memory['daily_stats'] == {}
+        assert not reloaded.was_article_processed('https://example.com/old')
+
+
+class TestNearDuplicates:
+    """Tests para la detección de casi duplicados en la memoria y el agente"""
+
+    ORIGINAL = 'OpenAI announces GPT-5 with improved reasoning for developers'
+    SYNDICATED = 'OpenAI Announces GPT-5 With Improved Reasoning For Developers'
+
+    def test_memory_finds_syndicated_copy_after_reload(self, tmp_path):
+        """Test que una copia con otra URL se reconoce contra el historial persistido"""
+        AgentMemory(tmp_path).remember_generation(
+            [make_article('https://openai.com/index/gpt-5', title=self.ORIGINAL)], []
+        )
+        memory = AgentMemory(tmp_path)
+
+        copy = make_article('https://news.example.com/gpt-5', title=self.SYNDICATED)
+        assert memory.find_near_duplicate(copy) == 'https://openai.com/index/gpt-5'
+        assert memory.find_near_duplicate(make_article('https://example.com/x',
+                                                       title='Gemini gets a new robotics model')) is None
+
+    def test_signatures_from_another_scheme_are_dropped(self, tmp_path):
+        """Test que las firmas guardadas con otro esquema no se comparan"""
+        memory = AgentMemory(tmp_path)
+        memory.remember_generation([make_article('https://openai.com/index/gpt-5', title=self.ORIGINAL)], [])
+        memory.memory['signature_scheme'] = 'anterior'
+        memory.memory['article_history'][0]['signature'] = '0' * 256
+        memory.save_memory()
+
+        reloaded = AgentMemory(tmp_path)
+
+        assert 'signature' not in reloaded.memory['article_history'][0]
+        copy = make_article('https://news.example.com/gpt-5', title=self.SYNDICATED)
+        assert reloaded.find_near_duplicate(copy) == 'https://openai.com/index/gpt-5'
+
+    def test_near_duplicate_of_history_scores_as_processed(self, tmp_path):
+        """Test que un casi duplicado del historial no puntúa como nuevo"""
+        memory = AgentMemory(tmp_path)
+        memory.remember_generation([make_article('https://openai.com/index/gpt-5', title=self.ORIGINAL)], [])
+        engine = DecisionEngine(memory)
+
+        score, reasons = engine.score_article(make_article('https://news.example.com/gpt-5',
+                                                           title=self.SYNDICATED))
+        assert any('Casi duplicado' in r for r in reasons)
+
+    def test_process_articles_keeps_one_per_cluster(self, tmp_path):
+        """Test que solo un artículo por grupo de casi duplicados llega a la selección"""
+        agent = AutonomousAgent(tmp_path)
+        original = make_article('https://openai.com/index/gpt-5', title=self.ORIGINAL)
+        copy = dict(make_article('https://news.example.com/gpt-5', title=self.SYNDICATED),
+                    description='Descripción de prueba más completa')
+        other = make_article('https://example.com/robots', title='Gemini gets a new robotics model')
+        events = []
+
+        selected = agent.process_articles([original, other, copy],
+                                          on_event=lambda t, **d: events.append((t, d)))
+
+        assert len(selected) == 2
+        assert copy in selected and original not in selected
+        assert ('near_duplicates_collapsed', {'removed': 1, 'remaining': 2}) in events
+
+    def test_process_articles_computes_each_signature_once(self, tmp_path, monkeypatch):
+        """Test que las firmas del agrupamiento se reutilizan en la búsqueda en el historial"""
+        agent = AutonomousAgent(tmp_path)
+        agent.memory.remember_generation([make_article('https://openai.com/index/gpt-5', title=self.ORIGINAL)], [])
+        batches = []
+        original_signatures = dedup.signatures
+
+        def counting(texts):
+            texts = list(texts)
+            batches.append(len(texts))
+            return original_signatures(texts)
+
+        monkeypatch.setattr(dedup, 'signatures', counting)
+        monkeypatch.setattr(dedup, 'signature', lambda text: pytest.fail('firma recalculada'))
+        articles = [make_article(f'https://example.com/{i}', title=f'Artículo número {i} sobre modelos')
+                    for i in range(5)]
+
+        agent.process_articles(articles + [make_article('https://news.example.com/gpt-5', title=self.SYNDICATED)])
+
+        assert batches == [6]
+
+
+class TestDecisionEngine:
+    """Tests para la clase DecisionEngine"""
+
+    def test_processed_article_scores_lower(self, tmp_path):
+        """Test que un artículo ya procesado recibe menos puntaje"""
+        memory = AgentMemory(tmp_path)
+        memory.remember_generation([make_article('https://example.com/seen')], [])
+        engine = DecisionEngine(memory)
+
+        seen_score, _ = engine.score_article(make_article('https://example.com/seen/'))
+        new_score, _ = engine.score_article(make_article('https://example.com/new',
+                                                         title='Otra noticia distinta'))
+
+        assert new_score > seen_score
+
+
+    def test_batch_scores_match_single_scores(self, tmp_path):
+        """Test que score_articles da los mismos scores que score_article"""
+        memory = AgentMemory(tmp_path)
+        memory.remember_generation([make_article('https://example.com/seen', source='Blog A')], [])
+        engine = DecisionEngine(memory)
+        articles = [
+            make_article('https://example.com/seen', source='Blog A'),
+            make_article('https://example.com/b', title='Un título bastante largo y descriptivo', source='Blog B'),
+            dict(make_article('https://example.com/c', title='Corto', source='Blog A'), description=''),
+        ]
+
+        assert engine.score_articles(articles) == [engine.score_article(a)[0] for a in articles]
+
+    def test_select_best_articles_top_k_keeps_order_on_ties(self, tmp_path, capsys):
+        """Test que se eligen los k mejores (empates en orden original) y solo se explican esos"""
+        engine = DecisionEngine(AgentMemory(tmp_path))
+        articles = [make_article(f'https://example.com/{i}', title=f'Noticia {i}') for i in range(5)]
+        articles[3]['description'] = 'x' * 150
+        events = []
+
+        selected = engine.select_best_articles(articles, max_articles=3,
+                                               on_event=lambda t, **d: events.append(t))
+
+        assert selected == [articles[3], articles[0], articles[1]]
+        assert events == ['article_scored'] * 5
+        assert capsys.readouterr().out.count('📄') == 3
+
+    def test_empty_history_skips_near_duplicate_lookup(self, tmp_path, monkeypatch):
+        """Test que sin historial no se calculan firmas para buscar casi duplicados"""
+        memory = AgentMemory(tmp_path)
+        monkeypatch.setattr(memory, 'find_near_duplicate', lambda article: pytest.fail('no debería buscarse'))
+
+        DecisionEngine(memory).score_articles([make_article('https://example.com/a')])
+
+
+class TestAutonomousAgentViews:
+    """Tests para las vistas derivadas cacheadas por versión"""
+
+    def test_memory_version_increases_and_persists(self, tmp_path):
+        """Test que cada generación sube la versión de la memoria"""
+        memory = AgentMemory(tmp_path)
+        assert memory.version == 0
+        memory.remember_generation([make_article('https://example.com/a')], [])
+
+        assert memory.version == 1
+        assert AgentMemory(tmp_path).version == 1
+
+    def test_views_are_recomputed_only_after_a_change(self, tmp_path, monkeypatch):
+        """Test que el análisis se reutiliza hasta que cambia la memoria o el store"""
+        agent = AutonomousAgent(tmp_path)
+        calls = []
+        original = agent.learning_system.analyze_performance
+        monkeypatch.setattr(agent.learning_system, 'analyze_performance',
+                            lambda: calls.append(1) or original())
+
+        first = agent.analyze_performance()
+        assert agent.analyze_performance() is first
+        assert len(calls) == 1
+
+        agent.memory.post_store.append_posts([{
+            'id': 'p1', 'post_text': 'x', 'article': {'source': 'Test Blog'}
+        }])
+        performance = agent.analyze_performance()
+        assert performance['sources_balance'] == {'Test Blog': 1}
+        assert len(calls) == 2
+
+        agent.learn_from_generation([make_article('https://example.com/a')], [])
+        agent.analyze_performance()
+        assert len(calls) == 3
+
+    def test_status_etag_follows_versions(self, tmp_path):
+        """Test que el ETag de estado cambia tras una generación"""
+        agent = AutonomousAgent(tmp_path)
+        before = agent.status_etag()
+        assert agent.status_etag() == before
+
+        agent.learn_from_generation([make_article('https://example.com/a')], [])
+        assert agent.status_etag() != before
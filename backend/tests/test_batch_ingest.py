@@ -0,0 +1,140 @@
+"""
+Tests para la ingesta en lote de fuentes personalizadas
+"""
+import threading
+import time
+import pytest
+import batch_ingest
+from batch_ingest import HostLimiter, ingest_urls
+from generator import LinkedInPostGenerator
+from metadata import MetadataService
+from services import ServiceContainer
+from fakes import FakeGenaiClient
+
+
+def fake_metadata(url):
+    """Metadata falsa; las URLs con 'broken' fallan"""
+    if 'broken' in url:
+        raise ConnectionError('no responde')
+    return {'title': f'Artículo {url.rsplit("/", 1)[-1]}', 'description': 'Descripción'}
+
+
+class TestBatchIngest:
+    """Tests para ingest_urls"""
+
+    @pytest.fixture
+    def client(self):
+        return FakeGenaiClient()
+
+    @pytest.fixture
+    def services(self, tmp_path, client):
+        """Contenedor con un generador sobre el cliente falso"""
+        return ServiceContainer(tmp_path, refresh_interval=0, generator_factory=lambda: LinkedInPostGenerator(
+            client=client, max_in_flight=4, requests_per_minute=6000, use_cache=False
+        ))
+
+    def test_reports_status_per_url_and_writes_once(self, services, monkeypatch):
+        """Test que cada URL tiene su estado y los posts se guardan en un solo append"""
+        appends = []
+        original = services.post_store.append_posts
+        monkeypatch.setattr(services.post_store, 'append_posts',
+                            lambda posts: appends.append(len(posts)) or original(posts))
+        urls = ['https://a.com/1', 'https://a.com/2', 'https://www.a.com/1/', 'ftp://a.com/x',
+                'https://b.com/broken', 'https://b.com/3']
+
+        summary = ingest_urls(urls, services, MetadataService(fetcher=fake_metadata))
+
+        assert [r['status'] for r in summary['results']] == [
+            'created', 'created', 'duplicate', 'invalid', 'metadata_failed', 'created'
+        ]
+        assert summary['created'] == 3
+        assert appends == [3]
+        assert services.post_store.count() == 3
+        post_id = summary['results'][0]['post_id']
+        assert services.post_store.get_post(post_id)['article']['title'] == 'Artículo 1'
+
+    def test_batches_in_the_same_second_get_distinct_ids(self, services):
+        """Test que dos lotes simultáneos no repiten ids de posts"""
+        metadata = MetadataService(fetcher=fake_metadata)
+        first = ingest_urls(['https://a.com/1'], services, metadata)
+        second = ingest_urls(['https://a.com/2'], services, metadata)
+
+        ids = [first['results'][0]['post_id'], second['results'][0]['post_id']]
+        assert ids[0] != ids[1]
+        assert [services.post_store.get_post(i)['article']['url'] for i in ids] == [
+            'https://a.com/1', 'https://a.com/2'
+        ]
+
+    def test_skips_already_processed_urls(self, services, client):
+        """Test que una URL ya procesada no se vuelve a generar"""
+        metadata = MetadataService(fetcher=fake_metadata)
+        ingest_urls(['https://a.com/1'], services, metadata)
+
+        summary = ingest_urls(['https://a.com/1', 'https://a.com/2'], services, metadata)
+
+        assert [r['status'] for r in summary['results']] == ['already_processed', 'created']
+        assert client.calls == 2
+
+    def test_generation_failures_are_reported(self, tmp_path):
+        """Test que un error de Gemini marca la URL sin guardar nada"""
+        services = ServiceContainer(tmp_path, refresh_interval=0, generator_factory=lambda: LinkedInPostGenerator(
+            client=FakeGenaiClient(fail_status=400), max_in_flight=2, requests_per_minute=6000, use_cache=False
+        ))
+
+        summary = ingest_urls(['https://a.com/1'], services, MetadataService(fetcher=fake_metadata))
+
+        assert summary['results'][0]['status'] == 'generation_failed'
+        assert services.post_store.count() == 0
+
+    def test_cancellation_before_saving(self, services):
+        """Test que check_cancelled puede abortar el lote antes de guardar"""
+        class Cancelled(Exception):
+            pass
+
+        calls = []
+
+        def check_cancelled():
+            calls.append(1)
+            if len(calls) == 2:
+                raise Cancelled()
+
+        with pytest.raises(Cancelled):
+            ingest_urls(['https://a.com/1'], services, MetadataService(fetcher=fake_metadata),
+                        check_cancelled=check_cancelled)
+        assert services.post_store.count() == 0
+
+    def test_read_url_file(self, tmp_path):
+        """Test que se ignoran líneas vacías y comentarios"""
+        path = tmp_path / 'urls.txt'
+        path.write_text('# lista\nhttps://a.com/1\n\n  https://a.com/2  \n', encoding='utf-8')
+
+        assert batch_ingest.read_url_file(path) == ['https://a.com/1', 'https://a.com/2']
+
+
+class TestHostLimiter:
+    """Tests para HostLimiter"""
+
+    def test_limits_concurrency_per_host(self):
+        """Test que nunca hay más de `per_host` descargas simultáneas a un host"""
+        limiter = HostLimiter(per_host=2)
+        active = {'a.com': 0, 'b.com': 0}
+        peak = {'a.com': 0, 'b.com': 0}
+        lock = threading.Lock()
+
+        def work(url, host):
+            with limiter.slot(url):
+                with lock:
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(0.02)
+                with lock:
+                    active[host] -= 1
+
+        threads = [threading.Thread(target=work, args=(f'https://{h}/{i}', h))
+                   for i in range(6) for h in ('a.com', 'b.com')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == {'a.com': 2, 'b.com': 2}
@@ -0,0 +1,66 @@
+"""
+Tests para la detección de artículos casi duplicados (MinHash + LSH)
+"""
+import dedup
+from dedup import NearDuplicateIndex, cluster_articles, signature, similarity
+
+ORIGINAL = {'title': 'OpenAI announces GPT-5 with improved reasoning',
+            'description': 'The new model is faster and cheaper for developers building agents.'}
+SYNDICATED = {'title': 'OpenAI Announces GPT-5 With Improved Reasoning!',
+              'description': 'The new model is faster and cheaper for developers building agents'}
+UNRELATED = {'title': 'Google DeepMind publishes a weather forecasting model',
+             'description': 'A graph neural network predicts the weather ten days ahead.'}
+
+
+def text(article):
+    return dedup.article_text(article)
+
+
+class TestSignatures:
+    """Tests para las firmas MinHash"""
+
+    def test_signature_is_compact_and_deterministic(self):
+        """Test que la firma tiene 4 hex por permutación y no depende del proceso"""
+        sig = signature(text(ORIGINAL))
+        assert len(sig) == dedup.NUM_PERM * 4
+        assert sig == signature.__wrapped__(text(ORIGINAL))
+
+    def test_similarity_separates_duplicates_from_unrelated(self):
+        """Test que variaciones de formato dan similitud alta y otro artículo, baja"""
+        assert similarity(signature(text(ORIGINAL)), signature(text(SYNDICATED))) >= 0.9
+        assert similarity(signature(text(ORIGINAL)), signature(text(UNRELATED))) < 0.3
+
+
+class TestNearDuplicateIndex:
+    """Tests para NearDuplicateIndex"""
+
+    def test_finds_near_duplicates_only(self):
+        """Test que se encuentra la versión sindicada y no el artículo distinto"""
+        index = NearDuplicateIndex()
+        index.add('https://openai.com/gpt-5', signature(text(ORIGINAL)))
+        index.add('https://deepmind.google/weather', signature(text(UNRELATED)))
+
+        assert index.best_match(signature(text(SYNDICATED))) == 'https://openai.com/gpt-5'
+        assert index.best_match(signature('Anthropic releases a new coding assistant')) is None
+
+    def test_lookups_only_verify_colliding_entries(self, monkeypatch):
+        """Test que la búsqueda no compara contra todo el índice"""
+        index = NearDuplicateIndex()
+        for i in range(300):
+            index.add(f'https://example.com/{i}', signature(f'Artículo número {i} sobre tema {i * 7919}'))
+        compared = []
+        original = dedup.similarity
+        monkeypatch.setattr(dedup, 'similarity', lambda a, b: compared.append(1) or original(a, b))
+
+        index.find(signature(text(ORIGINAL)))
+
+        assert len(compared) < 30
+
+
+class TestClusterArticles:
+    """Tests para cluster_articles"""
+
+    def test_groups_near_duplicates(self):
+        """Test que los casi duplicados quedan en el mismo grupo"""
+        clusters = cluster_articles([ORIGINAL, UNRELATED, SYNDICATED])
+        assert clusters == [[0, 2], [1]]
@@ -0,0 +1,75 @@
+"""
+Tests para el bus de eventos de progreso (SSE / long-poll)
+"""
+import threading
+import time
+import pytest
+from events import EventBus, format_sse
+
+
+class TestEventBus:
+    """Tests para la clase EventBus"""
+
+    @pytest.fixture
+    def bus(self):
+        """Fixture con un bus vacío"""
+        return EventBus()
+
+    def test_publish_assigns_increasing_ids(self, bus):
+        """Test que cada evento recibe un id creciente"""
+        first = bus.publish('scrape_started', source='A')
+        second = bus.publish('scrape_finished', source='A', status='ok')
+
+        assert second['id'] == first['id'] + 1
+        assert bus.last_id == second['id']
+
+    def test_subscriber_receives_events(self, bus):
+        """Test que un suscriptor recibe los eventos publicados"""
+        subscriber = bus.subscribe()
+        bus.publish('post_generated', index=1)
+
+        event = subscriber.get(timeout=1)
+        assert event['type'] == 'post_generated'
+        assert event['index'] == 1
+
+    def test_late_subscriber_replays_missed_events(self, bus):
+        """Test que suscribirse con after_id entrega los eventos perdidos"""
+        start = bus.last_id
+        bus.publish('generation_started')
+        bus.publish('scrape_started', source='A')
+
+        subscriber = bus.subscribe(after_id=start)
+
+        assert [subscriber.get_nowait()['type'] for _ in range(2)] == ['generation_started', 'scrape_started']
+
+    def test_stream_formats_sse(self, bus):
+        """Test que el stream produce mensajes SSE"""
+        stream = bus.stream(after_id=0)
+        assert next(stream).startswith('retry:')
+
+        bus.publish('saved', count=2)
+        message = next(stream)
+        stream.close()
+
+        assert message.startswith('id: 1\nevent: saved\n')
+        assert '"count": 2' in message
+
+    def test_long_poll_wakes_up_on_publish(self, bus):
+        """Test que el long-poll vuelve apenas hay un evento nuevo"""
+        threading.Timer(0.1, lambda: bus.publish('generation_finished')).start()
+
+        start = time.monotonic()
+        received = bus.wait_for_events(after_id=0, timeout=5)
+
+        assert time.monotonic() - start < 2
+        assert received[0]['type'] == 'generation_finished'
+
+    def test_long_poll_times_out(self, bus):
+        """Test que el long-poll devuelve vacío al agotar el timeout"""
+        assert bus.wait_for_events(after_id=0, timeout=0.05) == []
+
+    def test_format_sse(self):
+        """Test del formato de un evento SSE"""
+        text = format_sse({'id': 7, 'type': 'saved', 'count': 1})
+        assert text.endswith('\n\n')
+        assert 'event: saved' in text
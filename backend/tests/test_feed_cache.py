@@ -0,0 +1,103 @@
+"""
+Tests para la caché HTTP condicional del scraper
+"""
+import io
+import pytest
+import requests
+from unittest.mock import Mock
+from requests.structures import CaseInsensitiveDict
+import feed_cache
+import feeds
+from feed_cache import FeedCache
+
+
+def make_response(status_code, content=b'', headers=None):
+    """Crea una respuesta HTTP real servida desde memoria (como con stream=True)"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+def read_all(articles):
+    """Parser que lee el body completo y devuelve `articles`"""
+    return lambda response: response.content and articles
+
+
+class TestFeedCache:
+    """Tests para la clase FeedCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture con una caché en un directorio temporal"""
+        return FeedCache(tmp_path / 'http_cache.json')
+
+    @pytest.fixture
+    def articles(self):
+        """Fixture con artículos parseados"""
+        return [{'title': 'A', 'url': 'https://example.com/a', 'description': '',
+                 'source': 'Test', 'scraped_at': '2026-01-01T00:00:00'}]
+
+    def test_miss_stores_validators(self, cache, articles, monkeypatch):
+        """Test que un 200 guarda ETag/Last-Modified y los artículos parseados"""
+        response = make_response(200, b'<rss/>', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2026 00:00:00 GMT'})
+        monkeypatch.setattr(feed_cache.http_client, 'get', Mock(return_value=response))
+
+        result = cache.fetch('https://example.com/rss', lambda r: articles)
+
+        assert result == articles
+        assert cache.entries['https://example.com/rss']['etag'] == '"v1"'
+        assert cache.stats()['misses'] == 1
+
+    def test_not_modified_skips_parse(self, cache, articles, monkeypatch):
+        """Test que un 304 devuelve los artículos en caché sin parsear"""
+        get = Mock(return_value=make_response(200, b'x' * 2048, {'ETag': '"v1"'}))
+        monkeypatch.setattr(feed_cache.http_client, 'get', get)
+        cache.fetch('https://example.com/rss', read_all(articles))
+
+        get.return_value = make_response(304)
+        parse = Mock()
+        result = cache.fetch('https://example.com/rss', parse)
+
+        parse.assert_not_called()
+        assert get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+        assert [a['title'] for a in result] == ['A']
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['bytes_saved'] == 2048
+        assert stats['hit_rate'] == 0.5
+
+    def test_cache_persists_between_instances(self, tmp_path, articles, monkeypatch):
+        """Test que la caché y sus contadores sobreviven a un reinicio"""
+        response = make_response(200, b'<rss/>', {'Last-Modified': 'Mon, 01 Jan 2026 00:00:00 GMT'})
+        monkeypatch.setattr(feed_cache.http_client, 'get', Mock(return_value=response))
+        FeedCache(tmp_path / 'http_cache.json').fetch('https://example.com/rss', lambda r: articles)
+
+        reloaded = FeedCache(tmp_path / 'http_cache.json')
+
+        assert 'https://example.com/rss' in reloaded.entries
+        assert reloaded.stats()['misses'] == 1
+
+    def test_response_without_validators_is_not_cached(self, cache, articles, monkeypatch):
+        """Test que sin validadores no se guarda la entrada"""
+        monkeypatch.setattr(feed_cache.http_client, 'get', Mock(return_value=make_response(200, b'<rss/>')))
+
+        cache.fetch('https://example.com/rss', lambda r: articles)
+
+        assert cache.entries == {}
+
+    def test_streaming_parse_stops_reading_the_body(self, cache, monkeypatch):
+        """Test que sin Content-Length el tamaño es lo que leyó el parser, sin descargar el resto"""
+        items = ''.join(f'<item><title>T{i}</title><link>https://example.com/{i}</link>'
+                        f'<description>{"x" * 1000}</description></item>' for i in range(100))
+        body = f'<rss><channel>{items}</channel></rss>'.encode()
+        response = make_response(200, body, {'ETag': '"v1"'})
+        monkeypatch.setattr(feed_cache.http_client, 'get', Mock(return_value=response))
+
+        result = cache.fetch('https://example.com/rss',
+                             lambda r: feeds.read_feed(r.iter_content(4096), 'Test', limit=5))
+
+        size = cache.entries['https://example.com/rss']['size']
+        assert len(result) == 5
+        assert 0 < size < len(body) // 4
@@ -0,0 +1,87 @@
+"""
+Tests para el lector incremental de feeds RSS/Atom
+"""
+import xml.etree.ElementTree as ET
+import pytest
+from unittest.mock import Mock
+from feeds import iter_feed, read_feed
+from scraper import ArticleScraper
+
+
+def rss(count: int) -> bytes:
+    items = ''.join(
+        f'<item><title>Post {i}</title><link>https://openai.com/index/post-{i}</link>'
+        f'<description>&lt;p&gt;Resumen &lt;b&gt;{i}&lt;/b&gt;&lt;/p&gt;</description></item>'
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>{items}</channel></rss>'.encode()
+
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Blog</title>
+  <entry>
+    <title>Entrada Atom</title>
+    <link rel="self" href="https://example.com/feed/1"/>
+    <link rel="alternate" href="https://example.com/posts/1"/>
+    <summary type="html">&lt;p&gt;Resumen&lt;/p&gt;</summary>
+  </entry>
+  <entry>
+    <title>Sin link</title>
+  </entry>
+</feed>"""
+
+
+def chunked(data: bytes, size: int = 64, consumed: list = None):
+    """Itera `data` en chunks registrando cuántos se consumieron"""
+    for i in range(0, len(data), size):
+        if consumed is not None:
+            consumed.append(i)
+        yield data[i:i + size]
+
+
+class TestFeeds:
+    """Tests para iter_feed y read_feed"""
+
+    def test_reads_rss_items(self):
+        """Test que se normalizan título, URL y descripción sin HTML"""
+        items = list(iter_feed(chunked(rss(2))))
+
+        assert items[0] == {'title': 'Post 0', 'url': 'https://openai.com/index/post-0',
+                            'description': 'Resumen 0'}
+        assert len(items) == 2
+
+    def test_reads_atom_entries(self):
+        """Test que en Atom se usa el link alternativo y el summary"""
+        articles = read_feed(chunked(ATOM), 'Atom Blog')
+
+        assert len(articles) == 1
+        assert articles[0]['url'] == 'https://example.com/posts/1'
+        assert articles[0]['description'] == 'Resumen'
+        assert articles[0]['source'] == 'Atom Blog'
+        assert 'scraped_at' in articles[0]
+
+    def test_stops_reading_after_limit(self):
+        """Test que no se consume el resto del feed después de `limit` items"""
+        data = rss(1000)
+        consumed = []
+
+        articles = read_feed(chunked(data, consumed=consumed), 'OpenAI Blog', limit=5)
+
+        assert [a['title'] for a in articles] == [f'Post {i}' for i in range(5)]
+        assert len(consumed) * 64 < len(data) / 50
+
+    def test_invalid_xml_raises(self):
+        """Test que un XML inválido lanza ParseError (el scraper hace fallback)"""
+        with pytest.raises(ET.ParseError):
+            list(iter_feed([b'<rss><channel><item></channel>']))
+
+    def test_scraper_rss_parser_streams_response(self):
+        """Test que el parser del scraper lee la respuesta con iter_content"""
+        response = Mock()
+        response.iter_content = Mock(return_value=chunked(rss(20)))
+
+        articles = ArticleScraper(cache=Mock())._parse_openai_rss(response)
+
+        assert len(articles) == 5
+        assert articles[0]['source'] == 'OpenAI Blog'
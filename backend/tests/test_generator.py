@@ -1,9 +1,13 @@
 """
 Tests para el LinkedInPostGenerator
 """
+import time
 import pytest
 from unittest.mock import Mock, patch
+import generator as generator_module
 from generator import LinkedInPostGenerator
+from fakes import FakeGenaiClient
+from generation_cache import GenerationCache
 
 
 class TestLinkedInPostGenerator:
@@ -140,3 +144,163 @@ class TestLinkedInPostGenerator:
             # El post debe incluir "Leer más:" seguido de la URL
             assert 'Leer más:' in post['post_text']
             assert sample_article['url'] in post['post_text']
+
+
+class TestConcurrentGeneration:
+    """Tests del modo concurrente contra un cliente falso local"""
+
+    @pytest.fixture
+    def articles(self):
+        """Fixture con varios artículos"""
+        return [
+            {
+                'title': f'Article {i}',
+                'url': f'https://example.com/{i}',
+                'description': f'Description {i}',
+                'source': 'Test',
+                'scraped_at': '2026-01-03T12:00:00'
+            }
+            for i in range(6)
+        ]
+
+    @pytest.fixture(autouse=True)
+    def no_backoff_sleep(self, monkeypatch):
+        """Backoff instantáneo para que los reintentos no demoren los tests"""
+        monkeypatch.setattr(generator_module, 'backoff_delay', lambda attempt: 0)
+
+    def test_parallel_generation_keeps_order(self, articles):
+        """Test que en paralelo se respeta el orden de los artículos"""
+        client = FakeGenaiClient(latency=0.2)
+        generator = LinkedInPostGenerator(client=client, max_in_flight=6,
+                                          requests_per_minute=600, use_cache=False)
+
+        start = time.monotonic()
+        posts = generator.generate_posts_from_articles(articles)
+        elapsed = time.monotonic() - start
+
+        assert [p['article']['title'] for p in posts] == [a['title'] for a in articles]
+        assert posts[3]['post_text'].startswith('Post sobre Article 3')
+        assert elapsed < 0.8
+        assert client.max_in_flight > 1
+
+    def test_max_in_flight_is_respected(self, articles):
+        """Test que nunca hay más llamadas simultáneas que max_in_flight"""
+        client = FakeGenaiClient(latency=0.05)
+        generator = LinkedInPostGenerator(client=client, max_in_flight=2,
+                                          requests_per_minute=600, use_cache=False)
+
+        generator.generate_posts_from_articles(articles)
+
+        assert client.max_in_flight <= 2
+
+    def test_rate_limit_errors_are_retried(self, articles):
+        """Test que los 429 se reintentan hasta obtener respuesta"""
+        client = FakeGenaiClient(rate_limit_errors=2)
+        generator = LinkedInPostGenerator(client=client, max_in_flight=1,
+                                          requests_per_minute=600, use_cache=False)
+
+        posts = generator.generate_posts_from_articles(articles[:1])
+
+        assert len(posts) == 1
+        assert client.calls == 3
+
+    def test_non_retryable_errors_fail_fast(self, articles):
+        """Test que un 400 no se reintenta y el post se descarta"""
+        client = FakeGenaiClient(fail_status=400)
+        generator = LinkedInPostGenerator(client=client, max_in_flight=1,
+                                          requests_per_minute=600, use_cache=False)
+
+        posts = generator.generate_posts_from_articles(articles[:1])
+
+        assert posts == []
+        assert client.calls == 1
+
+    def test_request_rate_limiter_throttles(self, articles):
+        """Test que el token bucket de requests limita la tasa"""
+        client = FakeGenaiClient()
+        # 120 rpm = 2 por segundo, con capacidad inicial de 120: forzar una capacidad de 1
+        generator = LinkedInPostGenerator(client=client, max_in_flight=4,
+                                          requests_per_minute=120, use_cache=False)
+        generator.rate_limiter.requests.capacity = 1
+        generator.rate_limiter.requests._tokens = 1
+
+        start = time.monotonic()
+        generator.generate_posts_from_articles(articles[:3])
+
+        assert time.monotonic() - start >= 0.9
+
+
+class TestGenerationCache:
+    """Tests de la caché de generaciones"""
+
+    @pytest.fixture
+    def article(self):
+        """Fixture con un artículo"""
+        return {
+            'title': 'Cached Article',
+            'url': 'https://example.com/cached',
+            'description': 'Description',
+            'source': 'Test',
+            'scraped_at': '2026-01-03T12:00:00'
+        }
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture con una caché en un directorio temporal"""
+        return GenerationCache(tmp_path / 'generation_cache.db')
+
+    def test_repeat_generation_hits_cache(self, article, cache):
+        """Test que un prompt repetido no vuelve a llamar al modelo"""
+        client = FakeGenaiClient()
+        generator = LinkedInPostGenerator(client=client, cache=cache, use_cache=True)
+
+        first = generator.generate_post(article)
+        second = generator.generate_post(article)
+
+        assert client.calls == 1
+        assert first['post_text'] == second['post_text']
+        assert cache.stats()['hits'] == 1
+
+    def test_different_params_miss_cache(self, article, cache):
+        """Test que otros parámetros adaptativos generan una entrada distinta"""
+        client = FakeGenaiClient()
+        generator = LinkedInPostGenerator(client=client, cache=cache, use_cache=True)
+
+        generator.generate_post(article, {'tone': 'casual'})
+        generator.generate_post(article, {'tone': 'técnico'})
+
+        assert client.calls == 2
+
+    def test_opt_out_forces_fresh_variant(self, article, cache):
+        """Test que use_cache=False llama al modelo aunque haya entrada"""
+        client = FakeGenaiClient()
+        generator = LinkedInPostGenerator(client=client, cache=cache, use_cache=True)
+
+        generator.generate_post(article)
+        generator.generate_post(article, use_cache=False)
+
+        assert client.calls == 2
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test que las entradas expiradas cuentan como miss"""
+        cache = GenerationCache(tmp_path / 'cache.db', ttl_seconds=0)
+        cache.put('key', 'value')
+        time.sleep(0.01)
+
+        assert cache.get('key') is None
+        assert cache.stats()['expired'] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Test que se desaloja la entrada menos usada al superar el límite"""
+        cache = GenerationCache(tmp_path / 'cache.db', max_entries=2)
+        cache.put('a', '1')
+        time.sleep(0.01)
+        cache.put('b', '2')
+        time.sleep(0.01)
+        cache.get('a')
+        time.sleep(0.01)
+        cache.put('c', '3')
+
+        assert cache.get('b') is None
+        assert cache.get('a') == '1'
+        assert cache.stats()['evictions'] == 1
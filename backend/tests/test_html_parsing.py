@@ -0,0 +1,81 @@
+"""
+Tests para el parsing de HTML del scraper (con el backend disponible)
+"""
+from unittest.mock import Mock
+import html_parsing
+from scraper import ArticleScraper
+
+
+PAGE = b"""<html><head><title>Blog</title></head><body>
+<nav><a href="/about">About us</a><a name="ancla">sin href</a></nav>
+<article>
+  <h3>Un modelo nuevo</h3>
+  <a href="/technology/ai/modelo-nuevo/">Leer</a>
+  <p>Primer p&aacute;rrafo</p><p>Segundo</p>
+</article>
+<article><p>Sin t\xc3\xadtulo</p></article>
+<article><h2>Otro anuncio</h2><a href="https://blog.google/x">x</a></article>
+</body></html>"""
+
+
+class TestBackendSelection:
+    """Tests para la elección del backend por HTML_PARSER"""
+
+    def test_forced_backend(self, monkeypatch):
+        """Test que HTML_PARSER fuerza un backend disponible"""
+        monkeypatch.setenv('HTML_PARSER', 'html.parser')
+        assert html_parsing._detect_backend() == 'html.parser'
+
+    def test_unavailable_backend_falls_back_to_detection(self, monkeypatch, capsys):
+        """Test que un backend no instalado avisa y usa la detección automática en lugar de fallar"""
+        monkeypatch.setattr(html_parsing, '_SelectolaxParser', None)
+        monkeypatch.delenv('HTML_PARSER', raising=False)
+        detected = html_parsing._detect_backend()
+
+        monkeypatch.setenv('HTML_PARSER', 'selectolax')
+        assert html_parsing._detect_backend() == detected
+        assert 'HTML_PARSER=selectolax' in capsys.readouterr().out
+
+
+class TestStripTags:
+    """Tests para strip_tags"""
+
+    def test_removes_tags_and_unescapes_entities(self):
+        """Test que se quitan etiquetas, se resuelven entidades y se colapsan espacios"""
+        fragment = '<p>Modelos <b>grandes</b> &amp; <i>rápidos</i></p>\n<p>IA</p>'
+        assert html_parsing.strip_tags(fragment) == 'Modelos grandes & rápidos IA'
+
+    def test_truncates(self):
+        """Test que max_length recorta el resultado"""
+        assert html_parsing.strip_tags('<p>abcdef</p>', max_length=3) == 'abc'
+
+
+class TestScopedParsing:
+    """Tests para find_links y find_articles"""
+
+    def test_find_links_in_document_order(self):
+        """Test que solo se devuelven enlaces con href, en orden"""
+        links = html_parsing.find_links(PAGE)
+        assert links == [('/about', 'About us'), ('/technology/ai/modelo-nuevo/', 'Leer'),
+                         ('https://blog.google/x', 'x')]
+        assert html_parsing.find_links(PAGE, limit=1) == [('/about', 'About us')]
+
+    def test_find_articles(self):
+        """Test que cada <article> trae su primer título, enlace y párrafo"""
+        articles = html_parsing.find_articles(PAGE, limit=5)
+
+        assert articles[0] == {'title': 'Un modelo nuevo', 'href': '/technology/ai/modelo-nuevo/',
+                               'description': 'Primer párrafo'}
+        assert articles[1]['title'] is None
+        assert articles[2] == {'title': 'Otro anuncio', 'href': 'https://blog.google/x', 'description': ''}
+
+    def test_google_parser_uses_scoped_articles(self):
+        """Test que el scraper arma los artículos desde los <article> de la página"""
+        scraper = ArticleScraper(cache=Mock())
+        response = Mock(content=PAGE)
+
+        articles = scraper._parse_google_ai_blog(response)
+
+        assert [a['url'] for a in articles] == [
+            'https://blog.google/technology/ai/modelo-nuevo/', 'https://blog.google/x'
+        ]
@@ -0,0 +1,77 @@
+"""
+Tests para el cliente HTTP compartido
+"""
+import threading
+import pytest
+import http_client
+
+
+class TestHttpClient:
+    """Tests para la sesión HTTP compartida"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_session(self):
+        """Fixture que garantiza una sesión nueva en cada test"""
+        config = http_client.get_config()
+        http_client.close()
+        yield
+        http_client.configure(**config)
+
+    def test_session_is_shared(self):
+        """Test que todas las llamadas reutilizan la misma sesión"""
+        assert http_client.get_session() is http_client.get_session()
+
+    def test_session_is_shared_across_threads(self):
+        """Test que varios hilos obtienen la misma sesión"""
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(http_client.get_session()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(s) for s in sessions}) == 1
+
+    def test_session_has_pooled_adapter_with_retries(self):
+        """Test que el adapter tiene pool y política de reintentos"""
+        http_client.configure(pool_maxsize=7, max_retries=4)
+        adapter = http_client.get_session().get_adapter('https://openai.com')
+
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 4
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_session_without_retries(self):
+        """Test que retries=False da otra sesión compartida, sin reintentos"""
+        session = http_client.get_session(retries=False)
+
+        assert session is http_client.get_session(retries=False)
+        assert session is not http_client.get_session()
+        assert session.get_adapter('https://openai.com').max_retries.total == 0
+
+    def test_configure_rebuilds_session(self):
+        """Test que configure recrea la sesión con la nueva configuración"""
+        first = http_client.get_session()
+        http_client.configure(pool_connections=3)
+
+        assert http_client.get_session() is not first
+        assert http_client.get_config()['pool_connections'] == 3
+
+    def test_default_headers_keep_alive(self):
+        """Test que la sesión envía los headers por defecto"""
+        session = http_client.get_session()
+        assert session.headers['Connection'] == 'keep-alive'
+        assert 'Mozilla' in session.headers['User-Agent']
+
+    def test_accepts_only_decodable_encodings(self):
+        """Test que no se pide br si urllib3 no puede descomprimirlo"""
+        encodings = http_client.get_session().headers['Accept-Encoding'].split(',')
+        assert 'gzip' in encodings
+        try:
+            import brotli  # noqa: F401
+        except ImportError:
+            try:
+                import brotlicffi  # noqa: F401
+            except ImportError:
+                assert 'br' not in encodings
@@ -0,0 +1,107 @@
+"""
+Tests para el sistema de trabajos en background
+"""
+import threading
+import pytest
+from events import EventBus
+from jobs import JobManager, SUCCEEDED, FAILED, CANCELLED, RUNNING
+
+
+def wait_done(job, timeout=5):
+    """Espera a que termine el future del trabajo"""
+    try:
+        job.future.result(timeout=timeout)
+    except Exception:
+        pass
+
+
+class TestJobManager:
+    """Tests para la clase JobManager"""
+
+    @pytest.fixture
+    def bus(self):
+        return EventBus()
+
+    @pytest.fixture
+    def manager(self, bus):
+        """Fixture con un manager de un solo worker"""
+        manager = JobManager(max_workers=1, events=bus)
+        yield manager
+        manager.shutdown()
+
+    def test_job_result_and_status(self, manager):
+        """Test que un trabajo exitoso guarda su resultado"""
+        job, created = manager.submit('test', lambda job: {'value': 42})
+        wait_done(job)
+
+        assert created
+        assert job.status == SUCCEEDED
+        assert manager.get(job.id).result == {'value': 42}
+
+    def test_failed_job_records_error(self, manager, bus):
+        """Test que un error se guarda y se publica '<kind>_failed'"""
+        def boom(job):
+            raise RuntimeError('boom')
+
+        job, _ = manager.submit('generation', boom)
+        wait_done(job)
+
+        assert job.status == FAILED
+        assert job.error == 'boom'
+        assert bus.events_after(0)[-1]['type'] == 'generation_failed'
+
+    def test_duplicate_requests_are_coalesced(self, manager):
+        """Test que un submit con la misma clave reutiliza el trabajo activo"""
+        release = threading.Event()
+        first, _ = manager.submit('generation', lambda job: release.wait(5), key='gen')
+        second, created = manager.submit('generation', lambda job: None, key='gen')
+        release.set()
+        wait_done(first)
+
+        assert not created
+        assert second is first
+
+        third, created = manager.submit('generation', lambda job: None, key='gen')
+        assert created
+        assert third is not first
+
+    def test_cancel_queued_job(self, manager):
+        """Test que un trabajo en cola cancelado nunca se ejecuta"""
+        release = threading.Event()
+        ran = []
+        blocker, _ = manager.submit('a', lambda job: release.wait(5))
+        queued, _ = manager.submit('b', lambda job: ran.append(True))
+
+        assert manager.cancel(queued.id)
+        release.set()
+        wait_done(blocker)
+
+        assert queued.status == CANCELLED
+        assert ran == []
+
+    def test_cancel_running_job_is_cooperative(self, manager):
+        """Test que un trabajo corriendo se detiene en su check_cancelled"""
+        started = threading.Event()
+
+        def long_job(job):
+            started.set()
+            while True:
+                job.check_cancelled()
+                threading.Event().wait(0.01)
+
+        job, _ = manager.submit('long', long_job)
+        started.wait(2)
+        assert job.status == RUNNING
+
+        assert manager.cancel(job.id)
+        wait_done(job)
+        assert job.status == CANCELLED
+
+    def test_job_events_are_tagged(self, manager, bus):
+        """Test que los eventos del trabajo llevan su id"""
+        job, _ = manager.submit('generation', lambda job: job.emit('scrape_started', source='A'))
+        wait_done(job)
+
+        events = bus.events_after(0)
+        assert all(e['job_id'] == job.id for e in events)
+        assert [e['type'] for e in events] == ['scrape_started', 'generation_finished']
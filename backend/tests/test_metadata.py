@@ -0,0 +1,209 @@
+"""
+Tests para el servicio de metadata de URLs (caché LRU+TTL y deduplicación)
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from unittest.mock import Mock
+import metadata
+from metadata import MetadataService, extract_metadata, extract_metadata_stream, fetch_metadata
+
+
+HTML = b"""<html><head>
+<title>Fallback title</title>
+<meta property="og:title" content="OG title">
+<meta name="description" content="Meta description">
+</head><body><p>Contenido</p></body></html>"""
+
+
+class CountingFetcher:
+    """Fetcher falso que cuenta descargas y puede bloquearse hasta que se libere"""
+
+    def __init__(self, gate: threading.Event = None, error: Exception = None):
+        self.calls = 0
+        self.gate = gate
+        self.error = error
+        self._lock = threading.Lock()
+
+    def __call__(self, url):
+        with self._lock:
+            self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {'title': f'Title for {url}', 'description': 'desc'}
+
+
+@pytest.fixture
+def trickling_server():
+    """Servidor HTTP local que envía el <head> de a un byte cada 50 ms (unos 15 s en total)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.end_headers()
+            try:
+                for byte in b'<html><head><!--' + b' ' * 300:
+                    self.wfile.write(bytes([byte]))
+                    self.wfile.flush()
+                    time.sleep(0.05)
+            except OSError:  # el cliente cortó la conexión
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+class TestExtractMetadata:
+    """Tests para extract_metadata"""
+
+    def test_prefers_open_graph_and_falls_back_to_meta_description(self):
+        """Test que og:title gana a <title> y se usa meta description si no hay og"""
+        assert extract_metadata(HTML) == {'title': 'OG title', 'description': 'Meta description'}
+
+    def test_missing_tags(self):
+        """Test que sin etiquetas se devuelven None"""
+        assert extract_metadata(b'<html><body></body></html>') == {'title': None, 'description': None}
+
+
+class TestStreamingExtraction:
+    """Tests para la extracción incremental limitada al <head>"""
+
+    def test_stops_reading_at_end_of_head(self):
+        """Test que no se consumen chunks después de </head>"""
+        consumed = []
+
+        def chunks():
+            for chunk in (HTML[:40], HTML[40:], b'<p>body</p>' * 10, b'never'):
+                consumed.append(chunk)
+                yield chunk
+
+        assert extract_metadata_stream(chunks())['title'] == 'OG title'
+        assert b'never' not in consumed
+
+    def test_respects_byte_limit(self):
+        """Test que se deja de leer al llegar al límite de bytes"""
+        page = b'<html><head>' + b'<!-- relleno -->' * 1000 + b'<title>Tarde</title></head></html>'
+        chunks = [page[i:i + 100] for i in range(0, len(page), 100)]
+
+        assert extract_metadata_stream(chunks, max_bytes=1024) == {'title': None, 'description': None}
+        assert extract_metadata_stream(chunks, max_bytes=len(page))['title'] == 'Tarde'
+
+    def test_title_split_across_chunks_and_entities(self):
+        """Test que el título se arma aunque venga partido y con entidades"""
+        chunks = [b'<head><title>IA &amp; ', b'LLMs</title></head>']
+        assert extract_metadata_stream(chunks)['title'] == 'IA & LLMs'
+
+    def test_deadline_aborts_slow_downloads(self):
+        """Test que se corta con TimeoutError al vencer el plazo total"""
+        with pytest.raises(TimeoutError):
+            extract_metadata_stream([b'<head>', b'<title>x'], deadline=time.monotonic() - 1)
+
+    def test_fetch_streams_and_closes_response(self, monkeypatch):
+        """Test que fetch_metadata pide streaming, respeta el charset y cierra la respuesta"""
+        response = Mock()
+        response.raw = None  # sin socket: se lee con iter_content
+        response.headers = {'Content-Type': 'text/html; charset=iso-8859-1'}
+        response.iter_content = Mock(return_value=iter([
+            '<head><title>Información</title></head><body>'.encode('iso-8859-1')
+        ]))
+        get = Mock(return_value=response)
+        monkeypatch.setattr(metadata.http_client, 'get', get)
+
+        assert fetch_metadata('https://example.com')['title'] == 'Información'
+        assert get.call_args.kwargs['stream'] is True
+        assert get.call_args.kwargs['retries'] is False
+        response.close.assert_called_once()
+
+    def test_fetch_timeout_bounds_slow_servers(self, trickling_server):
+        """Test que un servidor que manda de a un byte no estira la descarga más allá del timeout"""
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            fetch_metadata(trickling_server, timeout=0.5)
+
+        assert time.monotonic() - start < 1.5
+
+
+class TestMetadataService:
+    """Tests para la clase MetadataService"""
+
+    def test_second_request_is_served_from_cache(self):
+        """Test que una URL ya consultada no se vuelve a descargar"""
+        fetcher = CountingFetcher()
+        service = MetadataService(fetcher=fetcher)
+
+        first = service.get('https://example.com/a')
+        second = service.get('https://www.example.com/a/?utm_source=x')
+
+        assert first == second
+        assert fetcher.calls == 1
+        assert service.stats()['hits'] == 1
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test que una entrada vencida se vuelve a descargar"""
+        fetcher = CountingFetcher()
+        service = MetadataService(ttl_seconds=60, fetcher=fetcher)
+        now = time.monotonic()
+        monkeypatch.setattr('metadata.time.monotonic', lambda: now)
+        service.get('https://example.com/a')
+
+        monkeypatch.setattr('metadata.time.monotonic', lambda: now + 61)
+        service.get('https://example.com/a')
+
+        assert fetcher.calls == 2
+
+    def test_least_recently_used_is_evicted(self):
+        """Test que al superar max_entries se desaloja la menos usada"""
+        fetcher = CountingFetcher()
+        service = MetadataService(max_entries=2, fetcher=fetcher)
+        service.get('https://example.com/a')
+        service.get('https://example.com/b')
+        service.get('https://example.com/a')
+        service.get('https://example.com/c')
+
+        service.get('https://example.com/a')
+        assert fetcher.calls == 3
+        service.get('https://example.com/b')
+        assert fetcher.calls == 4
+        assert service.stats()['evictions'] == 2
+
+    def test_concurrent_requests_share_one_fetch(self):
+        """Test que pedidos simultáneos de la misma URL hacen una sola descarga"""
+        gate = threading.Event()
+        fetcher = CountingFetcher(gate=gate)
+        service = MetadataService(fetcher=fetcher)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(service.get('https://example.com/a')))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while service.stats()['coalesced'] < 4:
+            time.sleep(0.01)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert fetcher.calls == 1
+        assert len(results) == 5
+        assert all(r == results[0] for r in results)
+
+    def test_errors_are_not_cached(self):
+        """Test que un error se propaga y el siguiente pedido reintenta"""
+        fetcher = CountingFetcher(error=ConnectionError('boom'))
+        service = MetadataService(fetcher=fetcher)
+
+        with pytest.raises(ConnectionError):
+            service.get('https://example.com/a')
+        fetcher.error = None
+        assert service.get('https://example.com/a')['description'] == 'desc'
+        assert fetcher.calls == 2
@@ -0,0 +1,245 @@
+"""
+Tests para el PostStore (SQLite append-only)
+"""
+import json
+import sqlite3
+import threading
+import pytest
+from post_store import PostStore
+
+
+def make_post(post_id, source='Test Blog', generated_at='2026-01-03T12:00:00'):
+    """Crea un post de ejemplo"""
+    return {
+        'id': post_id,
+        'article': {'title': f'Title {post_id}', 'url': f'https://example.com/{post_id}',
+                    'description': '', 'source': source, 'scraped_at': '2026-01-03T12:00:00'},
+        'post_text': f'Post {post_id}',
+        'generated_at': generated_at
+    }
+
+
+class TestPostStore:
+    """Tests para la clase PostStore"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Fixture con un store vacío en un directorio temporal"""
+        return PostStore(tmp_path)
+
+    def test_empty_store(self, store):
+        """Test que un store nuevo está vacío"""
+        assert store.load_posts() == []
+        assert store.count() == 0
+
+    def test_append_keeps_newest_first(self, store):
+        """Test que load_posts devuelve los más nuevos primero"""
+        store.append_posts([make_post('b'), make_post('a')])
+        store.append_posts([make_post('d'), make_post('c')])
+
+        assert [p['id'] for p in store.load_posts()] == ['d', 'c', 'b', 'a']
+
+    def test_migrates_legacy_posts_json(self, tmp_path):
+        """Test que posts.json se importa una sola vez conservando el orden"""
+        legacy = [make_post('new'), make_post('old')]
+        (tmp_path / 'posts.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        store = PostStore(tmp_path)
+        assert store.load_posts() == legacy
+
+        store.append_posts([make_post('newest')])
+        reopened = PostStore(tmp_path)
+        assert [p['id'] for p in reopened.load_posts()] == ['newest', 'new', 'old']
+
+    def test_failed_append_is_rolled_back(self, store, tmp_path, monkeypatch):
+        """Test que un error a mitad de la transacción (posts ya insertados) no deja nada escrito"""
+        store.append_posts([make_post('a')])
+
+        def fail(conn, deltas):
+            assert conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0] == 3
+            raise sqlite3.OperationalError('falla simulada')
+
+        monkeypatch.setattr(PostStore, '_apply_analytics', staticmethod(fail))
+        with pytest.raises(sqlite3.OperationalError):
+            store.append_posts([make_post('c'), make_post('b')])
+        monkeypatch.undo()
+
+        reopened = PostStore(tmp_path)
+        assert [p['id'] for p in reopened.load_posts()] == ['a']
+        assert store.version == reopened.version == 1
+
+    def test_version_increases_only_on_committed_writes(self, store, tmp_path):
+        """Test que la versión sube con cada append y no con uno fallido"""
+        assert store.version == 0
+        store.append_posts([make_post('a')])
+        store.append_posts([make_post('b')])
+        assert store.version == 2
+
+        with pytest.raises(KeyError):
+            store.append_posts([{'post_text': 'sin id'}])
+        assert store.version == 2
+        assert PostStore(tmp_path).version == 2
+
+    def test_source_counts(self, store):
+        """Test de los conteos por fuente agregados en SQL"""
+        store.append_posts([make_post('a', source='OpenAI'), make_post('b', source='OpenAI'),
+                            make_post('c', source='Google AI')])
+
+        assert store.source_counts() == {'OpenAI': 2, 'Google AI': 1}
+
+    def test_analytics_are_updated_on_append(self, store):
+        """Test que cada append actualiza los contadores materializados"""
+        store.append_posts([
+            make_post('a', source='OpenAI', generated_at='2026-01-03T12:00:00'),
+            make_post('b', source='Google AI', generated_at='2026-01-03T12:00:01')
+        ])
+        store.append_posts([make_post('c', source='OpenAI', generated_at='2026-01-04T09:00:00')])
+
+        stats = store.analytics()
+        assert stats['total_posts'] == 3
+        assert stats['generations'] == 2
+        assert stats['sources'] == {'OpenAI': 2, 'Google AI': 1}
+        assert stats['days'] == {'2026-01-03': 2, '2026-01-04': 1}
+        assert stats['posts_per_generation'] == {'2': 1, '1': 1}
+        assert store.check_analytics() == {}
+
+    def test_analytics_count_topics(self, store):
+        """Test que los tópicos se cuentan una vez por post"""
+        post = make_post('a')
+        post['post_text'] = 'Nuevo modelo GPT con LLM multimodal #GenAI #GenAI'
+        store.append_posts([post])
+
+        topics = store.analytics()['topics']
+        assert topics['gpt'] == 1
+        assert topics['genai'] == 1
+        assert topics['multimodal'] == 1
+
+    def test_failed_append_does_not_touch_analytics(self, store):
+        """Test que un append fallido no deja contadores a medias"""
+        with pytest.raises(KeyError):
+            store.append_posts([make_post('b'), {'post_text': 'sin id'}])
+
+        assert store.analytics()['total_posts'] == 0
+        assert store.check_analytics() == {}
+
+    def test_rebuild_repairs_inconsistent_analytics(self, store):
+        """Test que el chequeo detecta diferencias y la reconstrucción las corrige"""
+        store.append_posts([make_post('a'), make_post('b')])
+        store._connect().execute(
+            "UPDATE analytics SET count = 7 WHERE dimension = 'source' AND key = 'Test Blog'"
+        )
+
+        assert store.check_analytics() == {('source', 'Test Blog'): (7, 2)}
+        assert store.rebuild_analytics()['sources'] == {'Test Blog': 2}
+        assert store.check_analytics() == {}
+
+    def test_rebuild_bumps_version_only_when_counts_change(self, store, tmp_path):
+        """Test que una reconstrucción que corrige contadores invalida las vistas cacheadas"""
+        store.append_posts([make_post('a')])
+        store.rebuild_analytics()
+        assert store.version == 1
+
+        store._connect().execute("UPDATE analytics SET count = 7 WHERE dimension = 'source'")
+        store.rebuild_analytics()
+        assert store.version == 2
+        assert PostStore(tmp_path).refresh_version() == 2
+
+    def test_analytics_rebuilt_when_topic_vocabulary_changes(self, tmp_path):
+        """Test que un cambio de vocabulario recalcula los tópicos al abrir el store"""
+        store = PostStore(tmp_path)
+        post = make_post('a')
+        post['post_text'] = 'Agentes con LLM'
+        store.append_posts([post])
+        conn = store._connect()
+        conn.execute("DELETE FROM analytics WHERE dimension = 'topic'")
+        conn.execute("UPDATE meta SET value = 'vocabulario-viejo' WHERE key = 'analytics_built'")
+
+        reopened = PostStore(tmp_path)
+        assert reopened.analytics()['topics'] == {'agent': 1, 'llm': 1}
+        assert reopened.version == store.version + 1
+
+    def test_migrated_posts_are_included_in_analytics(self, tmp_path):
+        """Test que los posts importados de posts.json cuentan en las analíticas"""
+        legacy = [make_post('new', generated_at='2026-01-02T10:00:05'),
+                  make_post('old', generated_at='2026-01-02T10:00:00'),
+                  make_post('older', generated_at='2026-01-01T08:00:00')]
+        (tmp_path / 'posts.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        stats = PostStore(tmp_path).analytics()
+        assert stats['total_posts'] == 3
+        assert stats['generations'] == 2
+        assert stats['posts_per_generation'] == {'2': 1, '1': 1}
+
+    def test_concurrent_appends_do_not_lose_posts(self, store):
+        """Test que escritores concurrentes no pierden posts"""
+        def writer(n):
+            for i in range(10):
+                store.append_posts([make_post(f'{n}_{i}')])
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.count() == 50
+        assert store.analytics()['generations'] == 50
+        assert store.check_analytics() == {}
+
+    def test_query_posts_paginates_with_cursor(self, store):
+        """Test que la paginación por cursor recorre todo sin repetir"""
+        store.append_posts([make_post(str(i)) for i in reversed(range(25))])
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = store.query_posts(limit=10, cursor=cursor)
+            seen.extend(p['id'] for p in page)
+            if cursor is None:
+                break
+
+        assert seen == [str(i) for i in reversed(range(25))]
+
+    def test_query_posts_filters(self, store):
+        """Test de los filtros por fuente, fechas y texto"""
+        store.append_posts([
+            make_post('c', source='OpenAI Blog', generated_at='2026-01-05T10:00:00'),
+            make_post('b', source='Google AI Blog', generated_at='2026-01-04T10:00:00'),
+            make_post('a', source='OpenAI Blog', generated_at='2026-01-03T10:00:00'),
+        ])
+
+        by_source, _ = store.query_posts(source='OpenAI Blog')
+        assert [p['id'] for p in by_source] == ['c', 'a']
+
+        by_date, _ = store.query_posts(since='2026-01-04', until='2026-01-04')
+        assert [p['id'] for p in by_date] == ['b']
+
+        by_text, _ = store.query_posts(q='Title b')
+        assert [p['id'] for p in by_text] == ['b']
+
+    def test_get_post_by_id(self, store):
+        """Test que get_post devuelve el post o None"""
+        store.append_posts([make_post('b'), make_post('a')])
+
+        assert store.get_post('a')['id'] == 'a'
+        assert store.get_post('missing') is None
+
+    def test_get_post_uses_id_index(self, store):
+        """Test que la búsqueda por id usa el índice y no recorre la tabla"""
+        plan = store._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM posts WHERE id = ? ORDER BY seq DESC LIMIT 1",
+            ('x',)
+        ).fetchall()
+
+        assert any('idx_posts_id' in row[-1] for row in plan)
+
+    def test_lookup_latency_is_reported(self, store):
+        """Test que las métricas reportan la latencia de búsqueda"""
+        store.append_posts([make_post(f'post_{i}') for i in range(2000)])
+        for i in range(0, 2000, 100):
+            store.get_post(f'post_{i}')
+
+        metrics = store.metrics()
+        assert metrics['total_posts'] == 2000
+        assert metrics['lookup_latency']['count'] == 20
+        assert metrics['lookup_latency']['p99_ms'] < 50
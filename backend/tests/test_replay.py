@@ -0,0 +1,157 @@
+"""
+Tests para la capa de record/replay (HTTP y Gemini) y la inyección de fallas
+"""
+import pytest
+import requests
+from google.genai import errors
+from requests.adapters import BaseAdapter
+import replay
+from fakes import FakeGenaiClient
+from generator import LinkedInPostGenerator
+from replay import (Cassette, CassetteMiss, Faults, RecordingAdapter, RecordingGenAIClient,
+                    ReplayAdapter, ReplayGenAIClient)
+
+FEED = b'<rss><channel><item><title>Nuevo modelo</title></item></channel></rss>'
+
+
+class FakeHTTPAdapter(BaseAdapter):
+    """Adapter 'real' falso: responde siempre FEED y guarda los requests recibidos"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.requests.append(request)
+        return replay._build_response(request, 200, {'ETag': '"v1"', 'Content-Type': 'application/rss+xml'},
+                                      FEED, self)
+
+    def close(self):
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+class TestHTTPReplay:
+    """Tests para RecordingAdapter y ReplayAdapter"""
+
+    def test_recorded_response_is_replayed_without_network(self, tmp_path):
+        """Test que lo grabado se sirve igual después, incluido el streaming"""
+        inner = FakeHTTPAdapter()
+        recorded = session_with(RecordingAdapter(inner, Cassette(tmp_path / 'http.json')))
+        assert recorded.get('https://example.com/feed').content == FEED
+
+        replayed = session_with(ReplayAdapter(Cassette(tmp_path / 'http.json')))
+        response = replayed.get('https://example.com/feed', stream=True)
+
+        assert response.status_code == 200
+        assert response.headers['etag'] == '"v1"'
+        assert b''.join(response.iter_content(8)) == FEED
+        assert len(inner.requests) == 1
+
+    def test_recording_drops_conditional_headers(self, tmp_path):
+        """Test que al grabar se pide la respuesta completa, no un 304"""
+        inner = FakeHTTPAdapter()
+        session = session_with(RecordingAdapter(inner, Cassette(tmp_path / 'http.json')))
+
+        session.get('https://example.com/feed', headers={'If-None-Match': '"v0"'})
+
+        assert 'If-None-Match' not in inner.requests[0].headers
+
+    def test_replay_answers_conditional_get(self, tmp_path):
+        """Test que un If-None-Match con el ETag grabado recibe 304"""
+        session_with(RecordingAdapter(FakeHTTPAdapter(), Cassette(tmp_path / 'http.json'))).get(
+            'https://example.com/feed')
+        replayed = session_with(ReplayAdapter(Cassette(tmp_path / 'http.json')))
+
+        assert replayed.get('https://example.com/feed', headers={'If-None-Match': '"v1"'}).status_code == 304
+        assert replayed.get('https://example.com/feed', headers={'If-None-Match': '"v0"'}).status_code == 200
+
+    def test_unrecorded_request_fails_like_no_network(self, tmp_path):
+        """Test que una URL sin grabar falla como un error de conexión"""
+        session = session_with(ReplayAdapter(Cassette(tmp_path / 'http.json')))
+
+        with pytest.raises(requests.ConnectionError):
+            session.get('https://example.com/otra')
+
+    def test_injected_errors_and_rate_limit(self, tmp_path):
+        """Test que las fallas configuradas devuelven 503 y 429"""
+        session_with(RecordingAdapter(FakeHTTPAdapter(), Cassette(tmp_path / 'http.json'))).get(
+            'https://example.com/feed')
+
+        failing = session_with(ReplayAdapter(Cassette(tmp_path / 'http.json'), Faults(error_rate=1.0)))
+        assert failing.get('https://example.com/feed').status_code == 503
+
+        limited = session_with(ReplayAdapter(Cassette(tmp_path / 'http.json'), Faults(rate_limit=2)))
+        statuses = [limited.get('https://example.com/feed').status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+
+
+class TestGenAIReplay:
+    """Tests para los clientes de Gemini grabado y reproducido"""
+
+    def test_generator_runs_from_cassette(self, tmp_path):
+        """Test que el generador obtiene el mismo post desde el cassette, sin el cliente real"""
+        article = {'title': 'Nuevo modelo', 'source': 'Blog', 'description': 'desc',
+                   'url': 'https://example.com/a', 'scraped_at': '2026-01-03T12:00:00'}
+        live = FakeGenaiClient()
+        recording = RecordingGenAIClient(live, Cassette(tmp_path / 'genai.json'))
+        original = LinkedInPostGenerator(client=recording, use_cache=False).generate_post(article)
+
+        replaying = ReplayGenAIClient(Cassette(tmp_path / 'genai.json'))
+        replayed = LinkedInPostGenerator(client=replaying, use_cache=False).generate_post(article)
+
+        assert replayed['post_text'] == original['post_text']
+        assert live.calls == 1
+
+    def test_unrecorded_prompt_raises(self, tmp_path):
+        """Test que un prompt sin grabar no se inventa"""
+        client = ReplayGenAIClient(Cassette(tmp_path / 'genai.json'))
+
+        with pytest.raises(CassetteMiss):
+            client.models.generate_content(model='gemini', contents='otro prompt')
+
+    def test_injected_rate_limit_uses_sdk_error(self, tmp_path):
+        """Test que el 429 inyectado es el error del SDK (el generador lo reintenta)"""
+        RecordingGenAIClient(FakeGenaiClient(), Cassette(tmp_path / 'genai.json')).models.generate_content(
+            model='gemini', contents='Título: Algo\n')
+        client = ReplayGenAIClient(Cassette(tmp_path / 'genai.json'), Faults(rate_limit=1))
+        client.models.generate_content(model='gemini', contents='Título: Algo\n')
+
+        with pytest.raises(errors.ClientError) as error:
+            client.models.generate_content(model='gemini', contents='Título: Algo\n')
+        assert LinkedInPostGenerator._is_retryable(error.value)
+
+
+class TestReplayMode:
+    """Tests para la selección del modo por REPLAY_MODE"""
+
+    def test_off_keeps_the_real_adapter_and_client(self, monkeypatch):
+        """Test que sin REPLAY_MODE no cambia nada"""
+        monkeypatch.delenv('REPLAY_MODE', raising=False)
+        inner = FakeHTTPAdapter()
+        client = FakeGenaiClient()
+
+        assert replay.http_adapter(inner) is inner
+        assert replay.genai_client(lambda: client) is client
+
+    def test_replay_does_not_need_the_real_client(self, monkeypatch, tmp_path):
+        """Test que en replay no se crea el cliente real (no hace falta API key)"""
+        monkeypatch.setenv('REPLAY_MODE', 'replay')
+        monkeypatch.setenv('REPLAY_CASSETTE', str(tmp_path))
+
+        client = replay.genai_client(lambda: pytest.fail('no debería crearse el cliente real'))
+
+        assert isinstance(client, ReplayGenAIClient)
+        assert isinstance(replay.http_adapter(FakeHTTPAdapter()), ReplayAdapter)
+
+    def test_invalid_mode_is_rejected(self, monkeypatch):
+        """Test que un modo desconocido es un error"""
+        monkeypatch.setenv('REPLAY_MODE', 'grabar')
+
+        with pytest.raises(ValueError):
+            replay.mode()
@@ -1,6 +1,7 @@
 """
 Tests para el ArticleScraper
 """
+import time
 import pytest
 from scraper import ArticleScraper
 
@@ -79,3 +80,56 @@ class TestArticleScraper:
         fallback = scraper.get_fallback_articles()
         assert isinstance(fallback, list)
         assert len(fallback) > 0, "Debe tener al menos un artículo de fallback"
+
+    def test_sources_are_scraped_concurrently(self, scraper):
+        """Test que el tiempo total es el de la fuente más lenta, no la suma"""
+        def slow_source(name, delay):
+            def scrape():
+                time.sleep(delay)
+                return [{'title': name, 'url': f'https://example.com/{name}',
+                         'description': '', 'source': name, 'scraped_at': ''}]
+            return scrape
+
+        scraper.get_sources = lambda: {
+            'A': slow_source('A', 0.3),
+            'B': slow_source('B', 0.3),
+            'C': slow_source('C', 0.3),
+        }
+
+        start = time.monotonic()
+        articles, timings = scraper.fetch_all_sources()
+        elapsed = time.monotonic() - start
+
+        assert [a['source'] for a in articles] == ['A', 'B', 'C']
+        assert elapsed < 0.8
+        assert all(t['status'] == 'ok' for t in timings.values())
+
+    def test_slow_source_is_dropped_after_deadline(self, scraper):
+        """Test que una fuente que excede su deadline se descarta"""
+        scraper.get_sources = lambda: {
+            'fast': lambda: [{'title': 'Fast', 'url': 'https://example.com/fast',
+                              'description': '', 'source': 'fast', 'scraped_at': ''}],
+            'slow': lambda: time.sleep(2) or [],
+        }
+        scraper.source_timeouts['slow'] = 0.2
+
+        start = time.monotonic()
+        articles, timings = scraper.fetch_all_sources()
+
+        assert time.monotonic() - start < 1.0
+        assert len(articles) == 1
+        assert timings['fast']['status'] == 'ok'
+        assert timings['slow']['status'] == 'timeout'
+        assert scraper.last_run_timings == timings
+
+    def test_failing_source_reports_error(self, scraper):
+        """Test que un error en una fuente no afecta a las demás"""
+        def broken():
+            raise RuntimeError('boom')
+
+        scraper.get_sources = lambda: {'broken': broken, 'empty': lambda: []}
+        articles, timings = scraper.fetch_all_sources()
+
+        assert articles == []
+        assert timings['broken']['status'] == 'error'
+        assert timings['empty']['status'] == 'ok'
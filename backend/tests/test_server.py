@@ -100,6 +100,21 @@ class TestServerEndpoints:
         data = json.loads(response.data)
         assert 'success' in data
 
+    def test_fetch_metadata_uses_shared_cache(self, client, monkeypatch):
+        """Test que una segunda vista previa de la misma URL sale de la caché"""
+        import server
+        from metadata import MetadataService
+        calls = []
+        service = MetadataService(fetcher=lambda url: calls.append(url) or {'title': 'T', 'description': 'D'})
+        monkeypatch.setattr(server, 'metadata_service', service)
+
+        client.get('/api/fetch-metadata?url=https://example.com/post')
+        response = client.get('/api/fetch-metadata?url=https://example.com/post/')
+
+        data = json.loads(response.data)
+        assert data['metadata'] == {'title': 'T', 'description': 'D'}
+        assert len(calls) == 1
+
     def test_custom_source_endpoint_requires_post(self, client):
         """Test que /api/custom-source solo acepta POST"""
         response = client.get('/api/custom-source')
@@ -150,6 +165,16 @@ class TestServerEndpoints:
         assert 'success' in data
         assert 'memory' in data
 
+    def test_agent_status_supports_conditional_requests(self, client):
+        """Test que /api/agent/status responde 304 si el ETag no cambió"""
+        response = client.get('/api/agent/status')
+        etag = response.headers.get('ETag')
+        assert etag
+
+        cached = client.get('/api/agent/status', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+
     def test_cors_headers_present(self, client):
         """Test que los headers CORS están presentes"""
         response = client.get('/api/health')
@@ -162,3 +187,98 @@ class TestServerEndpoints:
         response = client.get('/api/posts')
 
         assert 'application/json' in response.content_type
+
+    def test_get_posts_is_paginated(self, client, tmp_path, monkeypatch):
+        """Test que /api/posts pagina con limit y cursor"""
+        import server
+        from post_store import PostStore
+
+        store = PostStore(tmp_path)
+        store.append_posts([
+            {'id': f'post_{i}', 'article': {'title': f'T{i}', 'source': 'Test'},
+             'post_text': 'x', 'generated_at': '2026-01-03T12:00:00'}
+            for i in reversed(range(5))
+        ])
+        monkeypatch.setattr(server, 'post_store', store)
+
+        first = json.loads(client.get('/api/posts?limit=3').data)
+        assert [p['id'] for p in first['posts']] == ['post_4', 'post_3', 'post_2']
+        assert first['has_more'] is True
+
+        second = json.loads(client.get(f"/api/posts?limit=3&cursor={first['next_cursor']}").data)
+        assert [p['id'] for p in second['posts']] == ['post_1', 'post_0']
+        assert second['next_cursor'] is None
+
+    def test_get_posts_rejects_invalid_limit(self, client):
+        """Test que un limit no numérico devuelve 400"""
+        response = client.get('/api/posts?limit=abc')
+        assert response.status_code == 400
+
+    def test_events_poll_returns_published_events(self, client):
+        """Test que el long-poll devuelve los eventos publicados"""
+        import server
+
+        after = server.events.last_id
+        server.events.publish('scrape_started', source='Test')
+
+        response = client.get(f'/api/generate/events/poll?after={after}&timeout=1')
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data['events'][0]['type'] == 'scrape_started'
+        assert data['last_event_id'] == after + 1
+
+    def test_events_stream_is_sse(self, client):
+        """Test que /api/generate/events responde como text/event-stream"""
+        response = client.get('/api/generate/events', buffered=False)
+
+        assert response.mimetype == 'text/event-stream'
+        assert next(response.response).startswith(b'retry:')
+        response.close()
+
+    def test_generate_returns_job_and_coalesces(self, client, monkeypatch):
+        """Test que /api/generate crea un trabajo y reutiliza el activo"""
+        import threading
+        import server
+
+        release = threading.Event()
+        monkeypatch.setattr(server, 'generate_posts_background', lambda job: release.wait(5) and {'posts': 0})
+
+        first = json.loads(client.post('/api/generate').data)
+        second = json.loads(client.post('/api/generate').data)
+        release.set()
+        server.jobs.get(first['job_id']).future.result(timeout=5)
+
+        assert first['success'] and not first['coalesced']
+        assert second['job_id'] == first['job_id']
+        assert second['coalesced']
+
+        job = json.loads(client.get(f"/api/jobs/{first['job_id']}").data)
+        assert job['job']['status'] == 'succeeded'
+
+    def test_batch_custom_source_validates_urls(self, client):
+        """Test que /api/custom-source/batch exige una lista de URLs"""
+        assert client.post('/api/custom-source/batch', json={}).status_code == 400
+        assert client.post('/api/custom-source/batch', json={'urls': 'https://a.com'}).status_code == 400
+        assert client.post('/api/custom-source/batch', json={'urls': []}).status_code == 400
+
+    def test_batch_custom_source_runs_as_job(self, client, monkeypatch):
+        """Test que el lote corre como trabajo y el resultado queda en /api/jobs/<id>"""
+        import server
+
+        monkeypatch.setattr(server, 'batch_ingest_background',
+                            lambda job, urls, skip_processed: {'total': len(urls), 'created': 0})
+
+        response = client.post('/api/custom-source/batch', json={'urls': ['https://a.com/1', 'https://a.com/2']})
+        assert response.status_code == 202
+        job_id = json.loads(response.data)['job_id']
+        server.jobs.get(job_id).future.result(timeout=5)
+
+        job = json.loads(client.get(f'/api/jobs/{job_id}').data)['job']
+        assert job['kind'] == 'batch_ingest'
+        assert job['result'] == {'total': 2, 'created': 0}
+
+    def test_get_unknown_job_returns_404(self, client):
+        """Test que un job inexistente devuelve 404"""
+        assert client.get('/api/jobs/nope').status_code == 404
+        assert client.post('/api/jobs/nope/cancel').status_code == 404
@@ -0,0 +1,51 @@
+"""
+Tests para el contenedor de servicios del proceso
+"""
+import os
+import time
+import pytest
+from services import ServiceContainer
+
+
+class TestServiceContainer:
+    """Tests para la clase ServiceContainer"""
+
+    @pytest.fixture
+    def services(self, tmp_path):
+        """Fixture con un contenedor sin intervalo de refresco"""
+        return ServiceContainer(tmp_path, refresh_interval=0, generator_factory=object)
+
+    def test_brain_is_reused(self, services):
+        """Test que el cerebro se construye una sola vez"""
+        assert services.get_brain() is services.get_brain()
+
+    def test_own_writes_do_not_reload_brain(self, services):
+        """Test que guardar la memoria desde el proceso no invalida el cerebro"""
+        brain = services.get_brain()
+        brain.memory.save_memory()
+
+        assert services.get_brain() is brain
+
+    def test_external_change_reloads_brain(self, services):
+        """Test que un cambio externo en agent_memory.json recarga el cerebro"""
+        brain = services.get_brain()
+        brain.memory.save_memory()
+        memory_file = brain.memory.memory_file
+        future = time.time() + 10
+        os.utime(memory_file, (future, future))
+
+        assert services.get_brain() is not brain
+
+    def test_refresh_interval_skips_stat(self, tmp_path):
+        """Test que dentro del intervalo no se consulta el disco"""
+        services = ServiceContainer(tmp_path, refresh_interval=60, generator_factory=object)
+        brain = services.get_brain()
+        brain.memory.save_memory()
+        future = time.time() + 10
+        os.utime(brain.memory.memory_file, (future, future))
+
+        assert services.get_brain() is brain
+
+    def test_generator_is_created_once(self, services):
+        """Test que el generador (y su cliente) se construye una sola vez"""
+        assert services.get_generator() is services.get_generator()
@@ -0,0 +1,56 @@
+"""
+Tests para el extractor de tópicos compilado
+"""
+import re
+from topics import TopicExtractor, extract_many, extract_topics
+
+
+class TestTopicExtractor:
+    """Tests para TopicExtractor"""
+
+    def test_keywords_respect_word_boundaries(self):
+        """Test que 'ai' e 'ia' no coinciden dentro de otras palabras"""
+        assert extract_topics('He said the media was there') == []
+        assert set(extract_topics('La IA y el AI Act')) == {'ia', 'ai'}
+
+    def test_aliases_map_to_canonical_topic(self):
+        """Test que los alias cuentan como su tópico canónico"""
+        text = 'ChatGPT, large\nlanguage models y redes neuronales con agentes'
+        assert set(extract_topics(text)) == {'gpt', 'llm', 'neural', 'agent'}
+
+    def test_hashtags_are_kept_and_mapped(self):
+        """Test que los hashtags se conservan y los que son alias suman su canónico"""
+        topics = extract_topics('Nuevo modelo #LLMs #OpenSource')
+        assert set(topics) == {'llms', 'llm', 'opensource'}
+
+    def test_topics_in_order_of_appearance_without_repeats(self):
+        """Test que el resultado no tiene repetidos y sigue el orden del texto"""
+        assert extract_topics('Gemini vs Claude vs Gemini') == ['gemini', 'claude']
+
+    def test_extract_many_matches_single_extraction(self):
+        """Test que el lote da lo mismo que texto por texto (sin cruzar límites)"""
+        texts = ['Un agent', 'multimodal #AI', '', 'machine\nlearning', 'sin tópicos']
+        assert extract_many(texts) == [extract_topics(t) for t in texts]
+
+    def test_extract_many_does_not_join_adjacent_texts(self):
+        """Test que un alias de varias palabras no se arma entre dos textos vecinos"""
+        texts = ['we use large', 'language models today', 'machine', 'learning #AI']
+        assert extract_many(texts) == [[], [], [], ['ai']]
+        assert extract_many(texts) == [extract_topics(t) for t in texts]
+
+    def test_vocabulary_is_extensible(self):
+        """Test que se pueden agregar tópicos y alias"""
+        extractor = TopicExtractor({'rag': ['retrieval augmented generation']})
+        before = extractor.fingerprint
+        extractor.extend({'rag': ['retrieval-augmented generation'], 'robotics': ['robots']})
+
+        assert extractor.extract('Retrieval-augmented generation para robots') == ['rag', 'robotics']
+        assert extractor.fingerprint != before
+
+    def test_large_vocabulary_compiles_to_one_pattern(self):
+        """Test que cientos de términos se compilan en un único patrón"""
+        vocabulary = {f'topic{i}': [f'term{i}', f'alias {i}'] for i in range(500)}
+        extractor = TopicExtractor(vocabulary)
+
+        assert isinstance(extractor._pattern, re.Pattern)
+        assert extractor.extract('term42 y alias   499, pero no term4200') == ['topic42', 'topic499']
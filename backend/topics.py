@@ -0,0 +1,154 @@
+"""
+Extracción de tópicos de los posts (hashtags y palabras clave de IA)
+Compartida por la memoria del agente y las analíticas del store de posts.
+
+El vocabulario (tópico -> alias) se compila en una única expresión regular
+con forma de trie y límites de palabra, así que el costo es una pasada por
+el texto sin importar cuántos términos tenga el vocabulario, y 'ai' ya no
+coincide dentro de 'said' ni 'ia' dentro de 'media'.
+"""
+import hashlib
+import json
+import re
+from typing import Dict, Iterable, List
+
+# Tópico canónico -> alias que lo indican (en minúsculas; los espacios
+# aceptan cualquier separador en blanco)
+DEFAULT_VOCABULARY: Dict[str, List[str]] = {
+    'gpt': ['gpt', 'gpts', 'chatgpt'],
+    'gemini': ['gemini'],
+    'claude': ['claude'],
+    'llm': ['llm', 'llms', 'large language model', 'large language models'],
+    'vision': ['vision', 'visión', 'computer vision'],
+    'multimodal': ['multimodal', 'multimodales'],
+    'ai': ['ai', 'a.i.', 'artificial intelligence', 'genai', 'generative ai'],
+    'ia': ['ia', 'inteligencia artificial', 'ia generativa'],
+    'machine learning': ['machine learning', 'aprendizaje automático'],
+    'neural': ['neural', 'neuronal', 'neuronales', 'neural network', 'neural networks',
+               'red neuronal', 'redes neuronales'],
+    'transformer': ['transformer', 'transformers'],
+    'chatbot': ['chatbot', 'chatbots'],
+    'agent': ['agent', 'agents', 'agentic', 'agente', 'agentes'],
+    'automation': ['automation', 'automatización', 'automatizacion', 'automatizar'],
+}
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Alternancia con prefijos compartidos: ['agent', 'agents', 'ai'] ->
+    'a(?:gent(?:s)?|i)'. El motor de regex descarta ramas por el primer
+    carácter en lugar de probar cada término.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [
+            (r'\s+' if char == ' ' else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{pattern})?" if '' in node else pattern
+
+    return build(trie)
+
+
+# Separador de extract_many: no es \s (los alias de varias palabras no lo
+# cruzan) ni \w (los hashtags y los bordes de palabra terminan en él)
+TEXT_SEPARATOR = '\x00'
+
+
+class TopicExtractor:
+    """
+    Extractor compilado: hashtags y alias del vocabulario en una sola pasada.
+    Devuelve los tópicos canónicos (y los hashtags tal cual) en orden de
+    aparición, sin repetidos.
+    """
+
+    def __init__(self, vocabulary: Dict[str, List[str]] = None):
+        self.vocabulary: Dict[str, List[str]] = {}
+        self.extend(vocabulary if vocabulary is not None else DEFAULT_VOCABULARY)
+
+    def extend(self, vocabulary: Dict[str, List[str]]):
+        """Agrega tópicos o alias y recompila el matcher"""
+        for topic, aliases in vocabulary.items():
+            known = self.vocabulary.setdefault(topic, [])
+            for alias in [topic, *aliases]:
+                alias = ' '.join(alias.lower().split())
+                if alias not in known:
+                    known.append(alias)
+        self._compile()
+
+    def _compile(self):
+        self._aliases = {alias: topic for topic, aliases in self.vocabulary.items() for alias in aliases}
+        terms = _trie_pattern(self._aliases)
+        self._pattern = re.compile(rf"#(?P<tag>\w+)|(?<!\w)(?P<term>{terms})(?!\w)")
+        self.fingerprint = hashlib.sha256(
+            json.dumps(self.vocabulary, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()[:16]
+
+    def _collect(self, match: re.Match, topics: Dict[str, None]):
+        """Agrega a `topics` lo que aporta una coincidencia"""
+        if match.lastgroup == 'tag':
+            tag = match.group('tag')
+            topics[tag] = None
+            # Un hashtag que es alias también cuenta como su tópico canónico
+            canonical = self._aliases.get(tag)
+            if canonical:
+                topics[canonical] = None
+        else:
+            term = match.group('term')
+            topic = self._aliases.get(term)
+            if topic is None:  # alias de varias palabras con otros separadores
+                topic = self._aliases[' '.join(term.split())]
+            topics[topic] = None
+
+    def extract(self, text: str) -> List[str]:
+        """Tópicos de un texto"""
+        topics: Dict[str, None] = {}
+        for match in self._pattern.finditer(text.lower()):
+            self._collect(match, topics)
+        return list(topics)
+
+    def extract_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        Tópicos de muchos textos con una sola pasada del matcher sobre todos
+        ellos, separados por TEXT_SEPARATOR.
+        """
+        # Se pasa a minúsculas antes de medir: lower() puede cambiar la longitud
+        texts = [text.lower() for text in texts]
+        if not texts:
+            return []
+        ends = []
+        offset = 0
+        for text in texts:
+            offset += len(text)
+            ends.append(offset)
+            offset += 1
+        results: List[Dict[str, None]] = [{} for _ in texts]
+        index = 0
+        # Las coincidencias llegan en orden: basta con avanzar el índice del texto
+        for match in self._pattern.finditer(TEXT_SEPARATOR.join(texts)):
+            while match.start() > ends[index]:
+                index += 1
+            self._collect(match, results[index])
+        return [list(topics) for topics in results]
+
+
+DEFAULT_EXTRACTOR = TopicExtractor()
+
+
+def extract_topics(text: str) -> List[str]:
+    """Extrae tópicos clave del texto usando hashtags y palabras clave"""
+    return DEFAULT_EXTRACTOR.extract(text)
+
+
+def extract_many(texts: List[str]) -> List[List[str]]:
+    """Tópicos de muchos textos en una sola llamada"""
+    return DEFAULT_EXTRACTOR.extract_many(texts)
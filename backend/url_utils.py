@@ -0,0 +1,47 @@
+"""
+Normalización de URLs para comparar artículos sin importar variantes triviales
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Parámetros de tracking que no cambian el contenido de la página
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'igshid', 'si', '_hsenc', '_hsmi'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Forma canónica de una URL: sin esquema, sin 'www.', host en minúsculas,
+    sin fragmento, sin parámetros de tracking (query ordenada) y sin barra final.
+    'https://www.OpenAI.com/index/gpt/?utm_source=x' -> 'openai.com/index/gpt'
+    """
+    if not url:
+        return ''
+    url = url.strip()
+    if '://' not in url:
+        url = f'//{url}'
+
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f'{host}:{parts.port}'
+
+    path = parts.path.rstrip('/')
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    )
+
+    normalized = f'{host}{path}'
+    if query:
+        normalized += f'?{urlencode(query)}'
+    return normalized
@@ -1,8 +1,18 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef, useCallback } from 'react'
 import './App.css'
 import CustomSourceInput from './components/CustomSourceInput'
 import { API_URL } from './config'
 
+const PAGE_SIZE = 20
+
+const PROGRESS_EVENTS = [
+  'generation_started', 'scrape_phase', 'scrape_started', 'scrape_finished',
+  'scoring_phase', 'article_scored', 'generation_phase', 'post_generated',
+  'saved', 'learning_phase', 'generation_finished', 'generation_failed',
+  'generation_cancelled'
+]
+const TERMINAL_EVENTS = ['generation_finished', 'generation_failed', 'generation_cancelled']
+
 function App() {
   const [posts, setPosts] = useState([])
   const [loading, setLoading] = useState(true)
@@ -11,6 +21,10 @@ function App() {
   const [generating, setGenerating] = useState(false)
   const [generationProgress, setGenerationProgress] = useState('')
   const [showCustomSource, setShowCustomSource] = useState(false)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const sentinelRef = useRef(null)
+  const progressStreamRef = useRef(null)
 
   useEffect(() => {
     fetchPosts()
@@ -20,11 +34,12 @@ function App() {
   const fetchPosts = async () => {
     try {
       setLoading(true)
-      const response = await fetch(`${API_URL}/api/posts`)
+      const response = await fetch(`${API_URL}/api/posts?limit=${PAGE_SIZE}`)
       const data = await response.json()
 
       if (data.success) {
         setPosts(data.posts)
+        setNextCursor(data.next_cursor || null)
       } else {
         setError('Error al cargar los posts')
       }
@@ -35,6 +50,42 @@ function App() {
     }
   }
 
+  const fetchMorePosts = useCallback(async () => {
+    if (!nextCursor || loadingMore) return
+
+    try {
+      setLoadingMore(true)
+      const response = await fetch(
+        `${API_URL}/api/posts?limit=${PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`
+      )
+      const data = await response.json()
+
+      if (data.success) {
+        setPosts((prev) => [...prev, ...data.posts])
+        setNextCursor(data.next_cursor || null)
+      }
+    } catch (err) {
+      console.error('Error loading more posts:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }, [nextCursor, loadingMore])
+
+  // Scroll infinito: cargar la siguiente página cuando el final de la lista es visible
+  useEffect(() => {
+    const sentinel = sentinelRef.current
+    if (!sentinel || !nextCursor || typeof IntersectionObserver === 'undefined') return
+
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        fetchMorePosts()
+      }
+    }, { rootMargin: '400px' })
+
+    observer.observe(sentinel)
+    return () => observer.disconnect()
+  }, [nextCursor, fetchMorePosts])
+
   const fetchStats = async () => {
     try {
       const response = await fetch(`${API_URL}/api/stats`)
@@ -63,6 +114,93 @@ function App() {
     })
   }
 
+  const describeEvent = (event) => {
+    switch (event.type) {
+      case 'scrape_started':
+        return `Buscando en ${event.source}...`
+      case 'scrape_finished':
+        return `${event.source}: ${event.articles} artículos (${event.elapsed}s)`
+      case 'article_scored':
+        return `Evaluado: ${event.title.slice(0, 40)}... (${event.score})`
+      case 'post_generated':
+        return `Post ${event.index}/${event.total} generado`
+      case 'saved':
+        return `Guardados ${event.count} posts`
+      default:
+        return event.progress || null
+    }
+  }
+
+  const handleProgressEvent = async (event, jobId) => {
+    // El stream es compartido: ignorar eventos de otros trabajos
+    if (jobId && event.job_id && event.job_id !== jobId) return false
+
+    const text = describeEvent(event)
+    if (text) {
+      setGenerationProgress(text)
+    }
+
+    if (TERMINAL_EVENTS.includes(event.type)) {
+      closeProgressStream()
+      setGenerating(false)
+
+      if (event.type === 'generation_failed') {
+        alert('Error: ' + event.error)
+      } else if (event.type === 'generation_cancelled') {
+        setGenerationProgress('')
+      } else {
+        // Recargar posts y stats
+        await fetchPosts()
+        await fetchStats()
+        setGenerationProgress('')
+      }
+      return true
+    }
+    return false
+  }
+
+  const closeProgressStream = () => {
+    if (progressStreamRef.current) {
+      progressStreamRef.current.close()
+      progressStreamRef.current = null
+    }
+  }
+
+  const subscribeToProgress = (afterId, jobId) => {
+    closeProgressStream()
+
+    if (typeof EventSource !== 'undefined') {
+      const source = new EventSource(`${API_URL}/api/generate/events?after=${afterId}`)
+      progressStreamRef.current = source
+      PROGRESS_EVENTS.forEach((type) => {
+        source.addEventListener(type, (message) => handleProgressEvent(JSON.parse(message.data), jobId))
+      })
+      return
+    }
+
+    // Long-poll: cada request espera en el servidor hasta que haya eventos nuevos
+    let active = true
+    progressStreamRef.current = { close: () => { active = false } }
+    const poll = async (lastId) => {
+      while (active) {
+        try {
+          const response = await fetch(`${API_URL}/api/generate/events/poll?after=${lastId}`)
+          const data = await response.json()
+          for (const event of data.events || []) {
+            if (await handleProgressEvent(event, jobId)) return
+          }
+          lastId = data.last_event_id ?? lastId
+        } catch (err) {
+          console.error('Error checking status:', err)
+          await new Promise((resolve) => setTimeout(resolve, 2000))
+        }
+      }
+    }
+    poll(afterId)
+  }
+
+  useEffect(() => closeProgressStream, [])
+
   const generateNewPosts = async () => {
     try {
       setGenerating(true)
@@ -80,34 +218,8 @@ function App() {
         return
       }
 
-      // Polling para verificar el progreso
-      const checkStatus = setInterval(async () => {
-        try {
-          const statusResponse = await fetch(`${API_URL}/api/generate/status`)
-          const statusData = await statusResponse.json()
-
-          if (statusData.success) {
-            const status = statusData.status
-            setGenerationProgress(status.progress)
-
-            if (!status.is_generating) {
-              clearInterval(checkStatus)
-              setGenerating(false)
-
-              if (status.error) {
-                alert('Error: ' + status.error)
-              } else {
-                // Recargar posts y stats
-                await fetchPosts()
-                await fetchStats()
-                setGenerationProgress('')
-              }
-            }
-          }
-        } catch (err) {
-          console.error('Error checking status:', err)
-        }
-      }, 2000) // Verificar cada 2 segundos
+      // Suscribirse a los eventos de progreso (SSE, o long-poll si no hay EventSource)
+      subscribeToProgress(data.last_event_id ?? 0, data.job_id)
 
     } catch (err) {
       setGenerating(false)
@@ -234,6 +346,11 @@ function App() {
               </div>
             </article>
           ))}
+          {nextCursor && (
+            <div ref={sentinelRef} className="scroll-sentinel">
+              {loadingMore && <div className="spinner"></div>}
+            </div>
+          )}
         </div>
       )}
 
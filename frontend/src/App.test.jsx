@@ -95,6 +95,22 @@ describe('App Component', () => {
     })
   })
 
+  it('requests the first page of posts', async () => {
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ success: true, posts: [], next_cursor: null })
+    }).mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ success: true, stats: { total_posts: 0, sources: {} } })
+    })
+
+    render(<App />)
+
+    await waitFor(() => {
+      expect(fetch.mock.calls[0][0]).toMatch(/\/api\/posts\?limit=\d+/)
+    })
+  })
+
   it('displays statistics correctly', async () => {
     fetch.mockResolvedValueOnce({
       ok: true,